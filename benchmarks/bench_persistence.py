@@ -0,0 +1,54 @@
+from common import measure
+
+from src.config_manager import ConfigManager
+
+REMINDER_COUNTS = (10, 100, 1000)
+
+def make_reminders(count):
+    """生成指定数量的提醒，时间均匀分布在一天中"""
+    return [
+        {
+            "time": f"{(i * 7 // 60) % 24:02d}:{(i * 7) % 60:02d}",
+            "message": f"第{i + 1}节课即将开始\n请做好课前准备",
+            "duration": 10,
+            "play_sound": False,
+            "weekdays": [True, True, True, True, True, False, False],
+        }
+        for i in range(count)
+    ]
+
+def run(options):
+    """配置文件加载和保存的耗时"""
+    results = {}
+    config_manager = ConfigManager()
+    
+    for count in REMINDER_COUNTS:
+        reminders = make_reminders(count)
+        
+        results[f"config_save_reminders_{count}"] = measure(
+            lambda: config_manager.save_reminders(reminders), repeat=options.repeat)
+        results[f"config_load_reminders_{count}"] = measure(
+            config_manager.load_reminders, repeat=options.repeat)
+        results[f"config_get_setting_{count}"] = measure(
+            lambda: config_manager.get_setting("startup_minimized", True), repeat=options.repeat)
+    
+    # SQLite后端：保存时只写入变化的行，按星期和时间的查询使用索引
+    config_manager.set_storage_backend("sqlite")
+    for count in REMINDER_COUNTS:
+        reminders = config_manager.sanitize_reminders(make_reminders(count))
+        config_manager.save_reminders(reminders)
+        
+        def edit_one():
+            reminders[count // 2]["duration"] += 1
+            config_manager.save_reminders(reminders)
+        
+        results[f"sqlite_save_one_changed_{count}"] = measure(edit_one, repeat=options.repeat)
+        results[f"sqlite_load_reminders_{count}"] = measure(
+            config_manager.load_reminders, repeat=options.repeat)
+        results[f"sqlite_due_at_{count}"] = measure(
+            lambda: config_manager.database.due_at(0, 8 * 60), repeat=options.repeat)
+        results[f"sqlite_next_occurrences_{count}"] = measure(
+            lambda: config_manager.database.next_occurrences(0, 12 * 60, 10), repeat=options.repeat)
+    config_manager.set_storage_backend("json")
+    
+    return results
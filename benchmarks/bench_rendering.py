@@ -0,0 +1,167 @@
+import os
+import time
+
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QLinearGradient, QColor
+from PySide6.QtWidgets import QWidget, QApplication
+
+from common import measure, summarize, process_events
+
+from src.config_manager import ConfigManager
+from src.utils.card_manager import CardManager
+from src.utils.wallpaper_manager import WallpaperManager
+from src.utils.theme import apply_theme
+from src.components.ui_components import ColorBlock
+from src.components.card_ui import Card
+from src.components.card_renderer import CardRenderCache
+from src.components.reminder_screen import ReminderScreen
+
+WALLPAPER_SIZES = {"4k": (3840, 2160), "8k": (7680, 4320)}
+CARD_COUNTS = (10, 50, 200)
+FRAME_MS = 16  # 按60Hz逐帧推进动画
+
+# 入场和退场动画中各色块的启动延迟，与 ReminderAnimator 一致
+ENTER_OFFSETS = {"backdrop": 0, "a": 150, "b": 350, "c": 600, "accent": 800}
+EXIT_OFFSETS = {"accent": 0, "c": 200, "a": 400, "b": 600, "backdrop": 800}
+
+def make_wallpaper(path, width, height):
+    """生成带渐变的测试壁纸，避免纯色图片解码过快"""
+    image = QImage(width, height, QImage.Format_RGB32)
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0, QColor("#FF8A65"))
+    gradient.setColorAt(0.5, QColor("#4DB6AC"))
+    gradient.setColorAt(1, QColor("#5C6BC0"))
+    
+    painter = QPainter(image)
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    image.save(path, "JPG", 90)
+    return path
+
+def make_card(i, image_path):
+    """生成测试名片数据，文字卡片和图片卡片交替"""
+    return {
+        "name": f"老师{i + 1}",
+        "title": "数学" if i % 2 else "",
+        "image_path": image_path if i % 3 == 0 else "",
+        "is_round": bool(i % 2),
+    }
+
+def bench_color_block(options, work_dir, results):
+    """大尺寸壁纸下 ColorBlock 绘制一帧的耗时，对比实时缩放和预合成两种方式"""
+    screen_size = QGuiApplication.primaryScreen().size()
+    target = QImage(screen_size, QImage.Format_ARGB32_Premultiplied)
+    
+    for label, (width, height) in WALLPAPER_SIZES.items():
+        path = make_wallpaper(os.path.join(work_dir, f"wallpaper_{label}.jpg"), width, height)
+        
+        block = ColorBlock("#0B5394", None, radius=5, opacity=0.7)
+        block.set_background_image(path)
+        block.resize(screen_size)
+        results[f"colorblock_paint_wallpaper_{label}"] = measure(lambda: block.render(target), repeat=options.repeat)
+        
+        block.set_composited_image(path, screen_size)
+        results[f"colorblock_paint_composited_{label}"] = measure(lambda: block.render(target), repeat=options.repeat)
+        block.deleteLater()
+
+def bench_cards(options, card_image, results):
+    """构造N张名片控件的耗时"""
+    max_width = QGuiApplication.primaryScreen().size().width() // 5
+    
+    for count in CARD_COUNTS:
+        cards_data = [make_card(i, card_image) for i in range(count)]
+        hosts = []
+        
+        def construct():
+            host = QWidget()
+            for card_data in cards_data:
+                card = Card(card_data, host)
+                card.resize(Card.display_size(card_data, max_width))
+            hosts.append(host)
+        
+        results[f"card_construct_{count}"] = measure(construct, repeat=max(3, options.repeat // 4), warmup=1)
+        for host in hosts:
+            host.deleteLater()
+        process_events()
+
+def _step_animations(screen, animations, offsets):
+    """逐帧推进一组动画并同步重绘，返回每帧耗时（毫秒）"""
+    # 启动后立即暂停，由基准测试控制动画时间
+    for animation in animations.values():
+        animation.start()
+        animation.pause()
+    
+    total = max(offsets[key] + animation.duration() for key, animation in animations.items())
+    samples = []
+    for t in range(0, total, FRAME_MS):
+        start = time.perf_counter()
+        for key, animation in animations.items():
+            # 停在最后一毫秒之前，避免退场动画结束时关闭窗口
+            animation.setCurrentTime(min(max(0, t - offsets[key]), animation.duration() - 1))
+        screen.repaint()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def bench_screen(options, wallpapers, card_manager, card_renderer, results):
+    """提醒屏幕构造耗时和入场、退场动画的逐帧耗时"""
+    screens = []
+    variants = {
+        "plain": ({}, None, None),
+        "wallpapers": (wallpapers, None, None),
+        "wallpapers_cards": (wallpapers, card_manager, card_renderer),
+    }
+    
+    for label, (screen_wallpapers, screen_cards, screen_renderer) in variants.items():
+        def construct():
+            screen = ReminderScreen("第一节课即将开始\n请做好课前准备", 10, False,
+                                    screen_wallpapers, screen_cards, screen_renderer)
+            screen.close_timer.stop()
+            # 退场动画结束时屏幕自行关闭并销毁
+            screen.destroyed.connect(lambda _=None, screen=screen: screens.remove(screen))
+            screens.append(screen)
+        
+        results[f"reminder_screen_construct_{label}"] = measure(construct, repeat=max(5, options.repeat // 2))
+        
+        # 对最后创建的屏幕逐帧推进完整的入场和退场动画
+        screen = screens[-1]
+        screen.show()
+        process_events()
+        results[f"enter_animation_frames_{label}"] = summarize(
+            _step_animations(screen, screen.animator.enter_animations, ENTER_OFFSETS))
+        
+        screen.animator.start_main_close_animation()
+        results[f"exit_animation_frames_{label}"] = summarize(
+            _step_animations(screen, screen.animator.exit_animations, EXIT_OFFSETS))
+    
+    # 关闭后由 WA_DeleteOnClose 销毁，屏幕内部的延时回调随之失效
+    for screen in list(screens):
+        screen.close()
+    process_events()
+
+def run(options):
+    """渲染相关的耗时：色块绘制、名片构造、提醒屏幕构造和动画帧"""
+    results = {}
+    config_manager = ConfigManager()
+    # 与应用一致使用编译后的应用样式表，名片和提醒屏幕的样式都来自其中
+    apply_theme(QApplication.instance(), config_manager)
+    work_dir = os.path.join(config_manager.app_data_dir, "bench")
+    os.makedirs(work_dir, exist_ok=True)
+    card_image = make_wallpaper(os.path.join(work_dir, "avatar.jpg"), 800, 800)
+    
+    bench_color_block(options, work_dir, results)
+    bench_cards(options, card_image, results)
+    
+    # 准备提醒屏幕使用的壁纸和名片
+    wallpaper_manager = WallpaperManager(config_manager)
+    wallpaper_path = os.path.join(work_dir, "wallpaper_4k.jpg")
+    for area in ("main", "left", "top", "accent"):
+        wallpaper_manager.set_wallpaper(area, wallpaper_path)
+    wallpapers = wallpaper_manager.get_all_wallpapers()
+    
+    card_manager = CardManager(config_manager)
+    for i in range(20):
+        card_manager.add_card(make_card(i, card_image))
+    card_renderer = CardRenderCache(card_manager)
+    card_renderer.get_sprites()
+    
+    bench_screen(options, wallpapers, card_manager, card_renderer, results)
+    return results
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from common import measure
+from bench_persistence import REMINDER_COUNTS, make_reminders
+
+from src.config_manager import ConfigManager
+from src.utils.reminder_manager import ReminderManager
+from src.utils.fire_ledger import FireLedger
+
+def run(options):
+    """每次定时检查提醒的耗时"""
+    results = {}
+    config_manager = ConfigManager()
+    
+    for count in REMINDER_COUNTS:
+        config_manager.save_reminders(make_reminders(count))
+        reminder_manager = ReminderManager(config_manager)
+        
+        # 每次检查前清除触发记录，使每次都完整地检查一遍
+        def reset():
+            reminder_manager.ledger = FireLedger()
+        
+        results[f"check_reminders_tick_{count}"] = measure(
+            reminder_manager.check_reminders, repeat=options.repeat * 5, setup=reset)
+        
+        # 模拟休眠8小时后唤醒的第一次检查，需要补查期间的全部触发
+        def reset_after_sleep():
+            reminder_manager.ledger = FireLedger()
+            reminder_manager.ledger.last_evaluated = (datetime.now() - timedelta(hours=8)).replace(second=0, microsecond=0)
+        
+        results[f"catch_up_after_sleep_{count}"] = measure(
+            reminder_manager.check_reminders, repeat=options.repeat * 5, setup=reset_after_sleep)
+        results[f"next_reminder_{count}"] = measure(
+            reminder_manager.get_next_reminder, repeat=options.repeat * 5)
+    
+    return results
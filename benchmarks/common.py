@@ -0,0 +1,45 @@
+import time
+import statistics
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QElapsedTimer
+
+def summarize(samples_ms):
+    """汇总耗时样本（毫秒）"""
+    ordered = sorted(samples_ms)
+    p95_index = min(len(ordered) - 1, max(0, round(len(ordered) * 0.95) - 1))
+    return {
+        "n": len(ordered),
+        "min_ms": round(ordered[0], 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+def measure(func, repeat=20, warmup=2, setup=None):
+    """多次调用 func 并统计耗时；setup 在每次调用前执行，不计入耗时"""
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+    
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+def process_events(duration_ms=0):
+    """处理事件循环，duration_ms 大于0时持续处理指定时长"""
+    app = QCoreApplication.instance()
+    if duration_ms <= 0:
+        app.processEvents()
+        return
+    
+    timer = QElapsedTimer()
+    timer.start()
+    while timer.elapsed() < duration_ms:
+        app.processEvents(QEventLoop.AllEvents, 10)
@@ -0,0 +1,111 @@
+"""
+无界面运行性能基准测试，结果写入JSON文件以便在不同提交之间对比
+
+用法:
+    python benchmarks/run_benchmarks.py [--quick] [--repeat N] [--screen 1920x1080] [--output 路径]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+for path in (ROOT_DIR, BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+SUITES = ("persistence", "scheduler", "rendering")
+
+def git_revision():
+    """获取当前提交的短哈希，不在git仓库中时返回unknown"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="课前提醒性能基准测试")
+    parser.add_argument("--repeat", type=int, default=20, help="每项测试的重复次数")
+    parser.add_argument("--quick", action="store_true", help="快速模式，减少重复次数")
+    parser.add_argument("--screen", default="1920x1080", help="离屏平台的屏幕尺寸")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="只运行指定的测试组，可重复指定")
+    parser.add_argument("--output", help="结果输出路径，默认 benchmarks/results/bench_<提交>.json")
+    options = parser.parse_args()
+    if options.quick:
+        options.repeat = min(options.repeat, 5)
+    return options
+
+def prepare_environment(options, work_dir):
+    """使用临时数据目录和离屏平台，避免影响用户配置和依赖显示设备"""
+    os.environ["APPDATA"] = work_dir
+    
+    # 模拟休眠后补查会把错过的提醒记为警告，没有配置日志时每次都会输出到终端
+    logging.getLogger("ClassScreenReminder.FireLedger").setLevel(logging.ERROR)
+    
+    if not os.environ.get("QT_QPA_PLATFORM"):
+        width, height = (int(value) for value in options.screen.lower().split("x"))
+        screen_config = os.path.join(work_dir, "offscreen.json")
+        with open(screen_config, "w", encoding="utf-8") as f:
+            json.dump({"screens": [{
+                "name": "bench", "x": 0, "y": 0,
+                "width": width, "height": height,
+                "logicalDpi": 96, "dpr": 1,
+            }]}, f)
+        os.environ["QT_QPA_PLATFORM"] = f"offscreen:configfile={screen_config}"
+
+def main():
+    options = parse_args()
+    work_dir = tempfile.mkdtemp(prefix="csr_bench_")
+    prepare_environment(options, work_dir)
+    
+    # 环境准备好之后再导入Qt和应用模块
+    import PySide6
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QGuiApplication
+    
+    app = QApplication(sys.argv)
+    screen_size = QGuiApplication.primaryScreen().size()
+    
+    revision = git_revision()
+    report = {
+        "meta": {
+            "commit": revision,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": PySide6.__version__,
+            "platform": platform.platform(),
+            "qt_platform": os.environ["QT_QPA_PLATFORM"].split(":")[0],
+            "screen": f"{screen_size.width()}x{screen_size.height()}",
+            "repeat": options.repeat,
+        },
+        "results": {},
+    }
+    
+    for suite in options.suite or SUITES:
+        module = __import__(f"bench_{suite}")
+        start = time.perf_counter()
+        report["results"][suite] = module.run(options)
+        print(f"{suite}: {time.perf_counter() - start:.1f}s")
+        for name, stats in report["results"][suite].items():
+            print(f"  {name:<45} median {stats['median_ms']:>10.3f}ms  p95 {stats['p95_ms']:>10.3f}ms")
+    
+    output = options.output or os.path.join(BENCH_DIR, "results", f"bench_{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"结果已写入: {output}")
+    
+    app.quit()
+
+if __name__ == "__main__":
+    main()
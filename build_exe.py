@@ -59,7 +59,10 @@ def build_executable():
         "--windowed",
         f"--icon={icon_path}",
         "--clean",
-        "--noconfirm"
+        "--noconfirm",
+        # 页面、界面组件和QtMultimedia改为按需导入，需显式收集
+        "--collect-submodules=src",
+        "--hidden-import=PySide6.QtMultimedia"
     ]
     
     # 添加数据文件
@@ -1,9 +1,24 @@
+import time
+_startup_time = time.perf_counter()  # 启动计时起点，在导入其他模块之前记录
+
 import sys
 import os
 import logging
+
+# 启动性能分析需在导入其他模块之前启用，才能记录各模块的导入耗时
+from src.utils import startup_profiler
+if startup_profiler.is_requested():
+    startup_profiler.start(_startup_time)
+
+# 已有实例在运行时只把命令转发给它后退出，不导入Qt
+from src.utils.instance_client import parse_commands, forward_commands
+_commands = parse_commands(sys.argv[1:])
+if __name__ == "__main__" and forward_commands(_commands):
+    sys.exit(0)
+
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import QFile, QTextStream, Qt
+from PySide6.QtCore import Qt, QTimer
 
 # 添加src目录到Python路径
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,13 +26,15 @@ src_dir = os.path.join(current_dir, "src")
 if src_dir not in sys.path:
     sys.path.append(src_dir)
 
-from src.main_window import MainWindow
+from src.scheduler_core import SchedulerCore
+from src.utils.single_instance import SingleInstanceServer
 from src.config_manager import ConfigManager
-from src.utils.sound_manager import initialize_sound
-from src.utils.resource_manager import init_resource_paths, get_resource_path, create_default_resources, get_icon_path
+from src.utils.sound_manager import initialize_sound, set_config_manager
+from src.utils.resource_manager import init_resource_paths, create_default_resources, get_icon_path, get_app_data_dir
+from src.utils.theme import apply_theme
 
 # 配置日志记录
-log_dir = os.path.join(os.environ.get('APPDATA', os.path.expanduser('~/.config')), 'ClassScreenReminder')
+log_dir = get_app_data_dir()
 os.makedirs(log_dir, exist_ok=True)
 logging.basicConfig(
     level=logging.ERROR,
@@ -26,44 +43,45 @@ logging.basicConfig(
     filemode='a'
 )
 
-def load_stylesheet(resource):
-    """加载应用样式表"""
-    file = QFile(resource)
-    if not file.open(QFile.ReadOnly | QFile.Text):
-        return ""
-    stream = QTextStream(file)
-    return stream.readAll()
+# 启动耗时日志：即使全局级别为ERROR，也记录各启动阶段的耗时
+timing_logger = logging.getLogger("ClassScreenReminder.Timing")
+timing_logger.setLevel(logging.INFO)
 
-def check_single_instance():
-    """检查是否已有实例运行"""
-    if sys.platform == 'win32':
-        try:
-            import win32event
-            import win32api
-            import winerror
-            
-            mutex_name = "ClassScreenReminderMutex"
-            mutex = win32event.CreateMutex(None, False, mutex_name)
-            return win32api.GetLastError() != winerror.ERROR_ALREADY_EXISTS
-        except ImportError:
-            return True
-    return True
+# 内存诊断日志：每次提醒结束后记录存活对象数量和进程内存
+logging.getLogger("ClassScreenReminder.Diagnostics").setLevel(logging.INFO)
+logging.getLogger("ClassScreenReminder.FireLedger").setLevel(logging.INFO)
+
+def log_startup_phase(phase):
+    """记录启动时间线：从进程启动到当前阶段的耗时"""
+    elapsed_ms = (time.perf_counter() - _startup_time) * 1000
+    timing_logger.info(f"启动时间线 +{elapsed_ms:.1f}ms: {phase}")
+    startup_profiler.mark(phase)
+
+log_startup_phase("模块导入完成")
 
 def main():
-    # 检查是否已有实例在运行
-    if not check_single_instance():
-        sys.exit(0)
-    
     # 创建应用程序
-    app = QApplication(sys.argv)
-    app.setApplicationName("ClassScreenReminder")
+    with startup_profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setApplicationName("ClassScreenReminder")
+    log_startup_phase("QApplication创建完成")
+    
+    # 单实例服务；同时启动的另一个实例已持有锁时，等它开始监听后把命令转发给它再退出
+    with startup_profiler.phase("SingleInstanceServer"):
+        instance_server = SingleInstanceServer(app)
+        if not instance_server.listen():
+            forward_commands(_commands, wait=10.0)
+            sys.exit(0)
+        app.aboutToQuit.connect(instance_server.close)
     
     # 初始化资源路径
     app_dir = os.path.dirname(os.path.abspath(__file__))
-    init_resource_paths(app_dir)
+    with startup_profiler.phase("init_resource_paths"):
+        init_resource_paths(app_dir)
     
     # 确保资源目录和必要文件存在
-    create_default_resources()
+    with startup_profiler.phase("create_default_resources"):
+        create_default_resources()
     
     # 设置应用图标
     icon_path = get_icon_path()
@@ -74,29 +92,65 @@ def main():
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app.setAttribute(Qt.AA_EnableHighDpiScaling)
     
-    # 加载样式表
-    style_path = get_resource_path("style.qss")
-    app.setStyleSheet(load_stylesheet(style_path))
+    # 初始化配置管理器，由声音子系统和主窗口共享
+    with startup_profiler.phase("ConfigManager"):
+        config_manager = ConfigManager()
+        set_config_manager(config_manager)
+    
+    # 按主题和强调色编译应用样式表，各控件不再单独设置样式
+    with startup_profiler.phase("load_stylesheet"):
+        apply_theme(app, config_manager)
+    log_startup_phase("资源和样式表加载完成")
+    
+    # 托盘常驻时只运行调度核心，设置窗口关闭后销毁，不随最后一个窗口关闭而退出
+    app.setQuitOnLastWindowClosed(False)
+    
+    # 创建调度核心，设置窗口在首次显示时才导入和创建
+    with startup_profiler.phase("SchedulerCore"):
+        core = SchedulerCore(config_manager)
+    log_startup_phase("调度核心创建完成")
+    
+    # 再次启动时转发的命令由运行中的调度核心处理
+    instance_server.commands_received.connect(core.handle_commands)
+    
+    # 如果设置了启动时最小化，则不创建设置窗口，只显示托盘图标
+    if not config_manager.get_startup_minimized() or "show" in _commands:
+        with startup_profiler.phase("MainWindow.show"):
+            core.show_main_window()
+        log_startup_phase("主窗口界面显示完成")
     
-    # 静默加载声音资源
-    sound_initialized = initialize_sound()
-    if not sound_initialized:
-        # 显示提示对话框
-        QMessageBox.warning(
-            None, 
-            "声音资源缺失", 
-            "未找到声音文件 'attend_class.wav'。\n\n"
-            "请在 resources 目录中放置此文件，以启用提醒声音功能。\n"
-            "程序将继续运行，但没有声音提醒。"
-        )
+    def init_sound_deferred():
+        """事件循环启动后再加载声音资源，不阻塞托盘图标和窗口的显示"""
+        log_startup_phase("事件循环已启动")
+        
+        # 静默加载声音资源
+        with startup_profiler.phase("initialize_sound"):
+            sound_initialized = initialize_sound(config_manager)
+        log_startup_phase("声音初始化完成")
+        
+        # 启动完成，写出性能报告；无界面回归测试时直接退出
+        if startup_profiler.is_enabled():
+            startup_profiler.write_report()
+            if startup_profiler.exit_requested():
+                app.quit()
+                return
+        
+        if not sound_initialized:
+            # 显示提示对话框
+            QMessageBox.warning(
+                None, 
+                "声音资源缺失", 
+                "未找到声音文件 'attend_class.wav'。\n\n"
+                "请在 resources 目录中放置此文件，以启用提醒声音功能。\n"
+                "程序将继续运行，但没有声音提醒。"
+            )
     
-    # 初始化配置管理器并创建主窗口
-    config_manager = ConfigManager()
-    main_window = MainWindow(config_manager)
+    QTimer.singleShot(0, init_sound_deferred)
     
-    # 如果设置了启动时最小化，则不显示主窗口
-    if not config_manager.get_startup_minimized():
-        main_window.show()
+    # 首次启动时也执行命令行中的其他命令
+    other_commands = [command for command in _commands if command != "show"]
+    if other_commands:
+        QTimer.singleShot(0, lambda: core.handle_commands(other_commands))
     
     # 运行应用
     sys.exit(app.exec())
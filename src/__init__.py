@@ -1,17 +1,27 @@
-# 确保子模块能被正确导入
-try:
-    # 导入子包
-    from . import components
-    from . import utils
-    from . import config_manager
-    from . import main_window
-    
-    # 从子包导入常用类和函数
-    from .components.reminder_screen import ReminderScreen
-    from .utils.sound_manager import play_initial_sound, initialize_sound
-    from .config_manager import ConfigManager
-    from .main_window import MainWindow
-except ImportError:
-    pass
+import importlib
 
-__all__ = ['ReminderScreen', 'ConfigManager', 'MainWindow', 'play_initial_sound', 'initialize_sound']
+# 子包和常用类在首次访问时才导入，避免导入包时加载全部界面和多媒体模块
+_SUBMODULES = ('components', 'utils', 'config_manager', 'scheduler_core', 'main_window')
+
+# 导出常用类和函数：{名称: 所在模块}
+_EXPORTS = {
+    'ReminderScreen': 'components.reminder_screen',
+    'ConfigManager': 'config_manager',
+    'SchedulerCore': 'scheduler_core',
+    'MainWindow': 'main_window',
+    'play_initial_sound': 'utils.sound_manager',
+    'initialize_sound': 'utils.sound_manager',
+}
+
+__all__ = ['ReminderScreen', 'ConfigManager', 'SchedulerCore', 'MainWindow', 'play_initial_sound', 'initialize_sound']
+
+def __getattr__(name):
+    """按需导入子包或导出的类和函数"""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(__all__))
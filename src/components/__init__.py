@@ -1,38 +1,53 @@
-from .ui_components import ColorBlock, LightEffectBlock
-from .reminder_screen import ReminderScreen
-from .reminder_ui import ReminderUI
-from .reminder_animation import ReminderAnimator
-from .reminder_events import ReminderEventHandler
-from .card_ui import Card
+import importlib
 
-# 确保子模块能被正确导入
-from . import ui_components
-from . import ui_builder
-from . import reminder_screen
-from . import reminder_animation
-from . import page_builders
-from . import card_ui
-
-# 导入UI子包
-from .ui import (
-    AudioManagerUI,
-    WallpaperManagerUI,
-    TrayManager,
-    ReminderManagerUI,
-    CardManagerUI
+# 子模块和常用类在首次访问时才导入，托盘启动时不加载界面相关模块
+_SUBMODULES = (
+    'ui_components',
+    'ui_builder',
+    'reminder_screen',
+    'reminder_ui',
+    'reminder_animation',
+    'reminder_events',
+    'page_builders',
+    'card_ui',
+    'card_renderer',
+    'card_presenter',
+    'wallpaper_preview',
+    'reminder_list_model',
+    'ui',
 )
 
-__all__ = [
-    'ColorBlock', 
-    'LightEffectBlock', 
-    'ReminderScreen',
-    'ReminderUI',
-    'ReminderAnimator',
-    'ReminderEventHandler',
-    'AudioManagerUI',
-    'WallpaperManagerUI',
-    'TrayManager',
-    'ReminderManagerUI',
-    'CardManagerUI',
-    'Card'
-]
+# 导出常用类：{名称: 所在子模块}
+_EXPORTS = {
+    'ColorBlock': 'ui_components',
+    'LightEffectBlock': 'ui_components',
+    'ReminderScreen': 'reminder_screen',
+    'ReminderUI': 'reminder_ui',
+    'ReminderAnimator': 'reminder_animation',
+    'ReminderEventHandler': 'reminder_events',
+    'AudioManagerUI': 'ui',
+    'WallpaperManagerUI': 'ui',
+    'TrayManager': 'ui',
+    'ReminderManagerUI': 'ui',
+    'CardManagerUI': 'ui',
+    'Card': 'card_ui',
+    'CardSprite': 'card_ui',
+    'CardRenderCache': 'card_renderer',
+    'CardPresenter': 'card_presenter',
+    'WallpaperPreviewRenderer': 'wallpaper_preview',
+    'ReminderListModel': 'reminder_list_model',
+    'ReminderFilterProxyModel': 'reminder_list_model',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """按需导入子模块或导出的类"""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(__all__))
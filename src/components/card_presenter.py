@@ -0,0 +1,122 @@
+import logging
+from PySide6.QtCore import QTimer
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.CardPresenter")
+
+class CardPresenter:
+    """虚拟化的名片展示器，按缓存的尺寸分栏分页，只为当前页创建控件"""
+    
+    START_Y = 50          # 起始Y坐标
+    BOTTOM_MARGIN = 40    # 底部留白
+    SPACING = 16          # 卡片间距
+    LEFT_MARGIN = 20      # 左侧边距
+    COLUMN_SPACING = 16   # 栏间距
+    ENTER_DELAY = 580     # 入场动画基础延迟，与色块动画错位
+    ENTER_STAGGER = 150   # 每张卡片入场延迟递增
+    EXIT_STAGGER = 180    # 每张卡片退场延迟递增
+    PAGE_INTERVAL = 5000  # 多页时的翻页间隔（毫秒）
+    
+    def __init__(self, container, area_width, area_height):
+        self.container = container
+        self.area_width = area_width
+        self.area_height = area_height
+        
+        self.pages = []     # 每页为 [(工厂函数, x, y), ...]
+        self.widgets = []   # 当前页已创建的卡片控件
+        self.current_page = 0
+        
+        # 翻页计时器，随容器一起销毁
+        self.page_timer = QTimer(container)
+        self.page_timer.timeout.connect(self.show_next_page)
+    
+    def set_items(self, items):
+        """设置要展示的卡片，items 为 [(尺寸, 工厂函数), ...]，仅根据尺寸计算布局"""
+        self.pages = self._layout(items)
+        self.current_page = 0
+        
+        if len(self.pages) > 1:
+            logger.info(f"名片共 {len(items)} 张，分为 {len(self.pages)} 页显示")
+    
+    def _layout(self, items):
+        """按列从上到下排列，超出高度换列，超出宽度换页"""
+        bottom = self.area_height - self.BOTTOM_MARGIN
+        
+        pages = []
+        page = []
+        x = self.LEFT_MARGIN
+        y = self.START_Y
+        column_width = 0
+        
+        for size, factory in items:
+            # 当前列放不下时换到下一列
+            if page and y + size.height() > bottom:
+                x += column_width + self.COLUMN_SPACING
+                y = self.START_Y
+                column_width = 0
+                
+                # 下一列超出区域宽度时换到下一页
+                if x + size.width() > self.area_width:
+                    pages.append(page)
+                    page = []
+                    x = self.LEFT_MARGIN
+            
+            page.append((factory, x, y))
+            y += size.height() + self.SPACING
+            column_width = max(column_width, size.width())
+        
+        if page:
+            pages.append(page)
+        return pages
+    
+    def start(self):
+        """显示第一页并在多页时启动翻页"""
+        if not self.pages:
+            return
+        
+        self._show_page(0)
+        if len(self.pages) > 1:
+            self.page_timer.start(self.PAGE_INTERVAL)
+    
+    def show_next_page(self):
+        """切换到下一页"""
+        self.start_exit_animation()
+        self._show_page((self.current_page + 1) % len(self.pages), delay=self.EXIT_STAGGER * 2)
+    
+    def _show_page(self, index, delay=ENTER_DELAY):
+        """创建指定页的卡片控件并播放入场动画"""
+        self.current_page = index
+        self.widgets = []
+        
+        for i, (factory, x, y) in enumerate(self.pages[index]):
+            card = factory()
+            
+            # 设置初始位置（在区域外）
+            start_x = -(card.width() + 50)
+            card.move(start_x, y)
+            card.show()
+            
+            # 错位启动动画，以卡片为上下文，卡片销毁后计时器自动失效
+            QTimer.singleShot(delay + i * self.ENTER_STAGGER, card,
+                              lambda c=card, sx=start_x, ex=x, cy=y: c.start_enter_animation(sx, ex, cy))
+            
+            self.widgets.append(card)
+    
+    def start_exit_animation(self):
+        """当前页卡片退场，退场后卡片自行销毁"""
+        for i, card in enumerate(self.widgets):
+            # 错位启动退场动画，使用更短的间隔
+            QTimer.singleShot(i * self.EXIT_STAGGER, card,
+                              lambda c=card: c.start_exit_animation(c.x(), -400))
+        self.widgets = []
+    
+    def stop(self):
+        """停止翻页并让当前页退场"""
+        self.page_timer.stop()
+        self.start_exit_animation()
+    
+    def release(self):
+        """停止翻页并丢弃各页的创建函数，释放其引用的名片图集"""
+        self.page_timer.stop()
+        self.pages = []
+        self.widgets = []
@@ -0,0 +1,119 @@
+import os
+import json
+import hashlib
+import logging
+from PySide6.QtCore import QObject, QRect, QTimer, Qt
+from PySide6.QtGui import QGuiApplication, QPixmap, QPainter
+from PySide6.QtWidgets import QWidget
+
+from .card_ui import Card
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.CardRenderer")
+
+class CardRenderCache(QObject):
+    """名片渲染缓存，在名片添加或编辑时预渲染为图像并合并为图集"""
+    
+    ATLAS_SPACING = 2  # 图集中相邻卡片之间的间隔，避免缩放采样越界
+    
+    def __init__(self, card_manager):
+        super().__init__()
+        self.card_manager = card_manager
+        self.atlas = None       # 合并后的图集
+        self.sprites = []       # 图集中每张卡片的 (区域, 逻辑尺寸, 名片数据)
+        self._rendered = {}     # 按卡片内容键缓存的单张渲染结果
+        self._dirty = True
+        
+        # 名片增删改时重新渲染变化的卡片
+        self.card_manager.cards_changed.connect(self.invalidate)
+        
+        # 启动后空闲时预渲染，避免阻塞启动流程
+        QTimer.singleShot(0, self.refresh)
+    
+    def invalidate(self):
+        """标记缓存失效并尽快重新渲染"""
+        self._dirty = True
+        QTimer.singleShot(0, self.refresh)
+    
+    def get_sprites(self):
+        """获取图集和卡片区域列表，缓存失效时先重新渲染"""
+        if self._dirty:
+            self.refresh()
+        return self.atlas, self.sprites
+    
+    def refresh(self):
+        """渲染新增或变化的卡片并重建图集"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        
+        cards_data = self.card_manager.get_all_cards()
+        max_width = self._block_width()
+        
+        rendered = {}
+        for card_data in cards_data:
+            key = self._card_key(card_data, max_width)
+            pixmap = self._rendered.get(key) or rendered.get(key)
+            if pixmap is None:
+                pixmap = self._render_card(card_data, max_width)
+            rendered[key] = pixmap
+        
+        # 只保留当前名片的渲染结果，已删除或已修改的旧结果被丢弃
+        self._rendered = rendered
+        self._build_atlas(cards_data, max_width)
+    
+    def _block_width(self):
+        """名片所在的左侧区域宽度，与提醒屏幕布局一致"""
+        return QGuiApplication.primaryScreen().size().width() // 5
+    
+    def _card_key(self, card_data, max_width):
+        """根据名片内容、图片修改时间和区域宽度生成缓存键"""
+        image_path = card_data.get("image_path", "")
+        image_mtime = os.path.getmtime(image_path) if image_path and os.path.exists(image_path) else 0
+        
+        raw = json.dumps([card_data, image_mtime, max_width], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    def _render_card(self, card_data, max_width):
+        """将单张卡片渲染为图像"""
+        # 使用隐藏的宿主控件，使卡片与提醒屏幕中一样作为子控件布局
+        host = QWidget()
+        card = Card(card_data, host)
+        card.resize(Card.display_size(card_data, max_width))
+        card.update_cached_background()
+        
+        pixmap = card.grab()
+        host.deleteLater()
+        return pixmap
+    
+    def _build_atlas(self, cards_data, max_width):
+        """将所有卡片图像按顺序纵向合并为一张图集"""
+        self.sprites = []
+        if not cards_data:
+            self.atlas = None
+            return
+        
+        pixmaps = [self._rendered[self._card_key(card_data, max_width)] for card_data in cards_data]
+        dpr = max(pixmap.devicePixelRatio() for pixmap in pixmaps)
+        
+        atlas_width = max(pixmap.width() for pixmap in pixmaps)
+        atlas_height = sum(pixmap.height() + self.ATLAS_SPACING for pixmap in pixmaps)
+        
+        atlas = QPixmap(atlas_width, atlas_height)
+        atlas.fill(Qt.transparent)
+        
+        painter = QPainter(atlas)
+        y = 0
+        for card_data, pixmap in zip(cards_data, pixmaps):
+            source_rect = QRect(0, y, pixmap.width(), pixmap.height())
+            painter.drawPixmap(source_rect, pixmap, pixmap.rect())
+            
+            # 逻辑尺寸用于布局，区域为图集中的物理像素位置
+            logical_size = pixmap.size() / pixmap.devicePixelRatio()
+            self.sprites.append((source_rect, logical_size, card_data))
+            y += pixmap.height() + self.ATLAS_SPACING
+        painter.end()
+        
+        atlas.setDevicePixelRatio(dpr)
+        self.atlas = atlas
+        logger.info(f"已预渲染 {len(self.sprites)} 张名片")
@@ -1,8 +1,60 @@
-from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QVBoxLayout, QSizePolicy
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QVBoxLayout, QSizePolicy, QWidget
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QSize, QPoint, QTimer
 from PySide6.QtGui import QColor, QPainter, QPainterPath, QPixmap, QFont, QLinearGradient, QBrush, QPen, QPalette
 
-class Card(QFrame):
+from ..utils.thumbnail_cache import get_avatar
+
+class CardAnimationMixin:
+    """名片入场/退场动画，供卡片控件和预渲染卡片共用"""
+    
+    def prepare_for_animation(self):
+        """为动画做准备"""
+        self.is_animating = True
+    
+    def start_enter_animation(self, start_x, end_x, y_pos):
+        """开始入场动画"""
+        # 提前准备动画
+        self.prepare_for_animation()
+        
+        # 获取当前大小，避免动画中重新计算
+        current_height = self.height()
+        current_width = self.width()
+        
+        # 预先设置初始位置，避免闪烁
+        self.setGeometry(start_x, y_pos, current_width, current_height)
+        
+        # 配置动画
+        self.enter_animation = QPropertyAnimation(self, b"geometry", self)
+        self.enter_animation.setDuration(850)  # 调整持续时间与色块相似
+        self.enter_animation.setStartValue(QRect(start_x, y_pos, current_width, current_height))
+        self.enter_animation.setEndValue(QRect(end_x, y_pos, current_width, current_height))
+        self.enter_animation.setEasingCurve(QEasingCurve.OutQuint)  # 使用与色块一致的缓动曲线
+        
+        # 动画完成后重置状态
+        self.enter_animation.finished.connect(self.animation_finished)
+        
+        # 直接启动，不需要小延迟
+        self.enter_animation.start()
+    
+    def start_exit_animation(self, start_x, end_x):
+        """开始退场动画"""
+        self.is_animating = True
+        
+        current_geometry = self.geometry()
+        self.exit_animation = QPropertyAnimation(self, b"geometry", self)
+        self.exit_animation.setDuration(700)  # 调整持续时间
+        self.exit_animation.setStartValue(current_geometry)
+        self.exit_animation.setEndValue(QRect(end_x, current_geometry.y(), current_geometry.width(), current_geometry.height()))
+        self.exit_animation.setEasingCurve(QEasingCurve.InQuint)  # 使用与色块一致的缓动曲线
+        self.exit_animation.finished.connect(self.deleteLater)
+        self.exit_animation.start()
+    
+    def animation_finished(self):
+        """动画完成后的回调"""
+        self.is_animating = False
+        self.update()  # 确保最终状态正确绘制
+
+class Card(CardAnimationMixin, QFrame):
     """高级展示卡片UI组件"""
     
     def __init__(self, card_data, parent=None):
@@ -24,17 +76,9 @@ class Card(QFrame):
     
     def setup_ui(self):
         """设置卡片UI"""
+        # 白色圆角底色由应用样式表中的 QFrame#card 规则提供
         self.setObjectName("card")
         
-        # 使用现代化阴影和圆角效果，改回白色底色
-        self.setStyleSheet("""
-            QFrame#card {
-                background-color: rgba(255, 255, 255, 0.95);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }
-        """)
-        
         # 启用阴影效果需要的设置
         self.setAttribute(Qt.WA_TranslucentBackground)
         
@@ -46,7 +90,6 @@ class Card(QFrame):
         # 添加左侧图片
         image_container = QFrame()
         image_container.setFixedSize(86, 86)  # 稍微增大容器
-        image_container.setStyleSheet("background: transparent;")
         
         image_layout = QVBoxLayout(image_container)
         image_layout.setContentsMargins(0, 0, 0, 0)
@@ -55,75 +98,14 @@ class Card(QFrame):
         image_label = QLabel()
         image_size = 80  # 图片大小
         
-        # 如果有图片，加载图片; 否则创建默认图片
+        # 如果有图片，加载缓存的头像缩略图; 否则创建默认图片
+        avatar = None
         if "image_path" in self.card_data and self.card_data["image_path"]:
-            pixmap = QPixmap(self.card_data["image_path"])
-            if not pixmap.isNull():
-                # 创建圆形或方形图片
-                is_round = self.card_data.get("is_round", True)
-                
-                # 先缩放图片填充方式
-                scaled_pixmap = pixmap.scaled(image_size, image_size, 
-                                            Qt.KeepAspectRatioByExpanding, 
-                                            Qt.SmoothTransformation)
-                
-                # 计算中心裁剪区域
-                width, height = scaled_pixmap.width(), scaled_pixmap.height()
-                x_offset = (width - image_size) // 2 if width > image_size else 0
-                y_offset = (height - image_size) // 2 if height > image_size else 0
-                
-                # 裁剪中心区域
-                cropped_pixmap = scaled_pixmap.copy(x_offset, y_offset, 
-                                                min(width, image_size), 
-                                                min(height, image_size))
-                
-                if is_round:
-                    # 创建圆形图片
-                    rounded_pixmap = QPixmap(image_size, image_size)
-                    rounded_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(rounded_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    
-                    # 创建圆形裁剪区域
-                    path = QPainterPath()
-                    path.addEllipse(0, 0, image_size, image_size)
-                    painter.setClipPath(path)
-                    
-                    # 先绘制边框
-                    pen = QPen(QColor(200, 200, 200, 120), 2)
-                    painter.setPen(pen)
-                    painter.drawEllipse(1, 1, image_size-2, image_size-2)
-                    
-                    # 绘制裁剪后的图片
-                    painter.drawPixmap(0, 0, cropped_pixmap)
-                    painter.end()
-                    
-                    image_label.setPixmap(rounded_pixmap)
-                else:
-                    # 使用方形图片，但添加圆角效果
-                    rounded_pixmap = QPixmap(image_size, image_size)
-                    rounded_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(rounded_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    
-                    # 创建圆角矩形裁剪区域
-                    path = QPainterPath()
-                    corner_radius = 12  # 增大圆角半径
-                    path.addRoundedRect(0, 0, image_size, image_size, corner_radius, corner_radius)
-                    painter.setClipPath(path)
-                    
-                    # 先绘制边框
-                    pen = QPen(QColor(200, 200, 200, 120), 2)
-                    painter.setPen(pen)
-                    painter.drawRoundedRect(1, 1, image_size-2, image_size-2, corner_radius, corner_radius)
-                    
-                    # 绘制裁剪后的图片
-                    painter.drawPixmap(0, 0, cropped_pixmap)
-                    painter.end()
-                    
-                    image_label.setPixmap(rounded_pixmap)
+            avatar = get_avatar(self.card_data["image_path"], image_size,
+                                self.card_data.get("is_round", True))
+        
+        if avatar is not None:
+            image_label.setPixmap(avatar)
         else:
             # 创建默认占位图，使用更优雅的颜色
             is_round = self.card_data.get("is_round", True)
@@ -188,7 +170,7 @@ class Card(QFrame):
             painter.end()
             
             image_label.setPixmap(default_pixmap)
-            
+        
         # 设置图片标签固定大小并添加到布局
         image_label.setFixedSize(image_size, image_size)
         image_layout.addWidget(image_label)
@@ -196,7 +178,6 @@ class Card(QFrame):
         
         # 右侧文字布局
         text_container = QFrame()
-        text_container.setStyleSheet("background: transparent;")
         
         text_layout = QVBoxLayout(text_container)
         text_layout.setContentsMargins(0, 0, 0, 0)
@@ -212,24 +193,15 @@ class Card(QFrame):
         if has_text_info:
             # 处理常规卡片，包含文字信息
             name_label = QLabel(name)
+            name_label.setObjectName("cardName")
             name_label.setWordWrap(True)
-            name_label.setStyleSheet("""
-                font-size: 18px; 
-                font-weight: bold; 
-                color: #333;
-                font-family: 'Segoe UI', sans-serif;
-            """)
             text_layout.addWidget(name_label)
             
             # 如果有子标题，添加子标题 (自动换行)
             if title_text:
                 title_label = QLabel(title_text)
+                title_label.setObjectName("cardTitle")
                 title_label.setWordWrap(True)
-                title_label.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #666;
-                    font-family: 'Segoe UI', sans-serif;
-                """)
                 text_layout.addWidget(title_label)
             
             # 增加文本右侧弹性空间
@@ -252,15 +224,8 @@ class Card(QFrame):
             # 移除右侧拉伸区域，使卡片变为正方形风格
             main_layout.setContentsMargins(8, 8, 8, 8)
             
-            # 让主布局居中
-            self.setStyleSheet("""
-                QFrame#card {
-                    background-color: rgba(255, 255, 255, 0.95);
-                    border-radius: 12px;
-                    border: 1px solid rgba(255, 255, 255, 0.3);
-                    padding: 5px;
-                }
-            """)
+            # 纯图片卡片使用更大的圆角和内边距
+            self.setProperty("imageOnly", True)
         
         # 设置卡片策略 - 自动调整宽度和优先高度
         self.setSizePolicy(
@@ -342,48 +307,27 @@ class Card(QFrame):
         # 设置动画状态
         self.is_animating = True
     
-    def start_enter_animation(self, start_x, end_x, y_pos):
-        """开始入场动画"""
-        # 提前准备动画
-        self.prepare_for_animation()
-        
-        # 获取当前大小，避免动画中重新计算
-        current_height = self.height()
-        current_width = self.width()
-        
-        # 预先设置初始位置，避免闪烁
-        self.setGeometry(start_x, y_pos, current_width, current_height)
-        
-        # 配置动画
-        self.enter_animation = QPropertyAnimation(self, b"geometry")
-        self.enter_animation.setDuration(850)  # 调整持续时间与色块相似
-        self.enter_animation.setStartValue(QRect(start_x, y_pos, current_width, current_height))
-        self.enter_animation.setEndValue(QRect(end_x, y_pos, current_width, current_height))
-        self.enter_animation.setEasingCurve(QEasingCurve.OutQuint)  # 使用与色块一致的缓动曲线
+    @staticmethod
+    def display_size(card_data, max_width):
+        """计算卡片在提醒屏幕左侧区域中的显示尺寸"""
+        name = card_data.get("name", "")
+        title = card_data.get("title", "")
         
-        # 动画完成后重置状态
-        self.enter_animation.finished.connect(self.animation_finished)
+        # 检查是否只有图片，无文字信息
+        has_text_info = bool(name.strip() or title.strip())
         
-        # 直接启动，不需要小延迟
-        self.enter_animation.start()
-    
-    def start_exit_animation(self, start_x, end_x):
-        """开始退场动画"""
-        self.is_animating = True
+        # 根据是否有文本内容设置不同的宽度
+        if has_text_info:
+            # 正常卡片
+            text_length = max(len(name), len(title))
+            width = min(max_width - 50, 86 + min(14 * text_length, 250) + 42)
+            height = 110 if title else 90
+        else:
+            # 纯图片卡片，使用正方形尺寸
+            width = 110
+            height = 130
         
-        current_geometry = self.geometry()
-        self.exit_animation = QPropertyAnimation(self, b"geometry")
-        self.exit_animation.setDuration(700)  # 调整持续时间
-        self.exit_animation.setStartValue(current_geometry)
-        self.exit_animation.setEndValue(QRect(end_x, current_geometry.y(), current_geometry.width(), current_geometry.height()))
-        self.exit_animation.setEasingCurve(QEasingCurve.InQuint)  # 使用与色块一致的缓动曲线
-        self.exit_animation.finished.connect(self.deleteLater)
-        self.exit_animation.start()
-    
-    def animation_finished(self):
-        """动画完成后的回调"""
-        self.is_animating = False
-        self.update()  # 确保最终状态正确绘制
+        return QSize(width, height)
     
     def sizeHint(self):
         """提供尺寸提示以便布局正确计算"""
@@ -423,3 +367,25 @@ class Card(QFrame):
             return QSize(220, 90)  # 常规卡片最小尺寸
         else:
             return QSize(120, 120)  # 增大纯图片卡片最小尺寸
+
+
+class CardSprite(CardAnimationMixin, QWidget):
+    """预渲染的卡片图像，从卡片图集中绘制，无需重建布局和子控件"""
+    
+    def __init__(self, atlas, source_rect, size, parent=None):
+        super().__init__(parent)
+        self.atlas = atlas                # 卡片图集
+        self.source_rect = source_rect    # 图集中的区域（物理像素）
+        self.is_animating = False
+        
+        self.enter_animation = None
+        self.exit_animation = None
+        
+        self.resize(size)
+    
+    def paintEvent(self, event):
+        """直接绘制图集中对应的区域"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        painter.drawPixmap(self.rect(), self.atlas, self.source_rect)
+        painter.end()
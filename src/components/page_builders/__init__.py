@@ -1,7 +1,22 @@
-# 页面构建器模块初始化文件
-from .reminders_page import create_reminders_page
-from .wallpaper_page import create_wallpaper_page
-from .settings_page import create_settings_page
-from .about_page import create_about_page
-from .audio_page import create_audio_page
-from .cards_page import create_cards_page
+# 页面构建器模块初始化文件，各页面构建函数在首次访问时才导入
+import importlib
+
+_EXPORTS = {
+    'create_reminders_page': 'reminders_page',
+    'create_wallpaper_page': 'wallpaper_page',
+    'create_settings_page': 'settings_page',
+    'create_about_page': 'about_page',
+    'create_audio_page': 'audio_page',
+    'create_cards_page': 'cards_page',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """按需导入页面构建函数"""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -83,7 +83,7 @@ def create_about_page(main_window):
         # 创建标签并显示圆角图片
         image_label = QLabel()
         image_label.setPixmap(rounded_pixmap)
-        image_label.setStyleSheet("margin: 10px;")
+        image_label.setObjectName("aboutImage")
         image_layout.addWidget(image_label)
 
     about_layout.addLayout(image_layout)
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QPushButton, QFrame, QFileDialog)
+                              QPushButton, QFrame, QFileDialog, QComboBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 import os
@@ -49,6 +49,19 @@ def _add_audio_settings(main_window, parent_layout):
     
     audio_layout.addLayout(audio_info_layout)
     
+    # 输出设备选择
+    device_layout = QHBoxLayout()
+    device_label = QLabel("输出设备:")
+    device_label.setMinimumWidth(80)
+    device_layout.addWidget(device_label)
+    
+    main_window.audio_device_combo = QComboBox()
+    main_window.audio_device_combo.setObjectName("audioDeviceCombo")
+    main_window.audio_device_combo.currentIndexChanged.connect(main_window.on_audio_device_changed)
+    device_layout.addWidget(main_window.audio_device_combo, 1)
+    
+    audio_layout.addLayout(device_layout)
+    
     # 操作按钮
     buttons_layout = QHBoxLayout()
     buttons_layout.setSpacing(10)
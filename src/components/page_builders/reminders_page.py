@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QPushButton, QTimeEdit, QListWidget, QFormLayout, 
+                              QPushButton, QTimeEdit, QListView, QFormLayout, 
                               QSpinBox, QFrame, QTextEdit, QCheckBox, QGroupBox, 
-                              QGridLayout)
+                              QGridLayout, QComboBox)
 from PySide6.QtCore import Qt, QTime
 
 def create_reminders_page(main_window):
@@ -33,14 +33,37 @@ def _create_left_panel(main_window):
     left_layout.setContentsMargins(0, 0, 0, 0)
     left_layout.setSpacing(10)
     
+    # 标题和过滤、排序设置
+    header_layout = QHBoxLayout()
+    header_layout.setSpacing(8)
+    
     list_label = QLabel("已设置的提醒:")
     list_label.setObjectName("sectionLabel")
-    left_layout.addWidget(list_label)
-    
-    main_window.reminder_list = QListWidget()
+    header_layout.addWidget(list_label)
+    header_layout.addStretch()
+    
+    main_window.weekday_filter_combo = QComboBox()
+    main_window.weekday_filter_combo.setObjectName("weekdayFilterCombo")
+    main_window.weekday_filter_combo.addItem("全部星期", None)
+    for i, name in enumerate(["周一", "周二", "周三", "周四", "周五", "周六", "周日"]):
+        main_window.weekday_filter_combo.addItem(name, i)
+    main_window.weekday_filter_combo.currentIndexChanged.connect(main_window.on_weekday_filter_changed)
+    header_layout.addWidget(main_window.weekday_filter_combo)
+    
+    main_window.sort_by_time_checkbox = QCheckBox("按时间排序")
+    main_window.sort_by_time_checkbox.setObjectName("sortByTimeCheckBox")
+    main_window.sort_by_time_checkbox.toggled.connect(main_window.on_sort_by_time_changed)
+    header_layout.addWidget(main_window.sort_by_time_checkbox)
+    
+    left_layout.addLayout(header_layout)
+    
+    # 列表视图使用提醒模型，增删改时只更新变化的行
+    main_window.reminder_list = QListView()
     main_window.reminder_list.setObjectName("reminderList")
     main_window.reminder_list.setMinimumHeight(400)  # 增加高度
     main_window.reminder_list.setMinimumWidth(300)   # 设置最小宽度
+    main_window.reminder_list.setUniformItemSizes(True)
+    main_window.reminder_list.setModel(main_window.reminder_manager_ui.proxy_model)
     left_layout.addWidget(main_window.reminder_list)
     
     # 操作按钮布局
@@ -59,6 +82,24 @@ def _create_left_panel(main_window):
     
     left_layout.addLayout(list_buttons_layout)
     
+    # 课表导入导出按钮
+    io_buttons_layout = QHBoxLayout()
+    io_buttons_layout.setSpacing(8)
+    
+    main_window.import_button = QPushButton("导入课表")
+    main_window.import_button.setObjectName("secondaryButton")
+    main_window.import_button.setToolTip("从CSV或iCalendar(.ics)文件批量导入提醒")
+    main_window.import_button.clicked.connect(main_window.import_timetable)
+    io_buttons_layout.addWidget(main_window.import_button)
+    
+    main_window.export_button = QPushButton("导出课表")
+    main_window.export_button.setObjectName("secondaryButton")
+    main_window.export_button.setToolTip("将所有提醒导出为CSV或iCalendar(.ics)文件")
+    main_window.export_button.clicked.connect(main_window.export_timetable)
+    io_buttons_layout.addWidget(main_window.export_button)
+    
+    left_layout.addLayout(io_buttons_layout)
+    
     return left_panel
 
 def _create_right_panel(main_window):
@@ -79,9 +120,9 @@ def _create_right_panel(main_window):
     form_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
     
     # 表单标题
-    form_title = QLabel("添加新提醒")
-    form_title.setObjectName("formTitle")
-    form_layout.addRow(form_title)
+    main_window.form_title = QLabel("添加新提醒")
+    main_window.form_title.setObjectName("formTitle")
+    form_layout.addRow(main_window.form_title)
     
     # 添加表单控件
     _add_form_controls(main_window, form_layout)
@@ -144,22 +185,6 @@ def _add_form_controls(main_window, form_layout):
     main_window.message_edit.setObjectName("messageEdit")
     main_window.message_edit.setMinimumHeight(80)  # 设置最小高度
     main_window.message_edit.setMaximumHeight(120)  # 设置最大高度
-    # 简化样式
-    main_window.message_edit.setStyleSheet("""
-        QTextEdit {
-            border: 1px solid #d1d1d1;
-            border-radius: 4px;
-            padding: 10px 10px 10px 12px;
-            background-color: white;
-            color: #333333;
-            font-size: 14px;
-            font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-        }
-        QTextEdit:focus {
-            border-color: #0078d4;
-            border-left-width: 3px;
-        }
-    """)
     form_layout.addRow("提醒消息:", main_window.message_edit)
 
 def _add_buttons(main_window, parent_layout):
@@ -173,6 +198,13 @@ def _add_buttons(main_window, parent_layout):
     main_window.add_button.clicked.connect(main_window.add_reminder)
     buttons_layout.addWidget(main_window.add_button)
     
+    # 取消编辑按钮，仅在编辑已有提醒时显示
+    main_window.cancel_edit_button = QPushButton("取消编辑")
+    main_window.cancel_edit_button.setObjectName("secondaryButton")
+    main_window.cancel_edit_button.clicked.connect(main_window.cancel_edit)
+    main_window.cancel_edit_button.hide()
+    buttons_layout.addWidget(main_window.cancel_edit_button)
+    
     # 测试提醒按钮
     main_window.test_button = QPushButton("测试效果")
     main_window.test_button.setObjectName("actionButton")
@@ -22,7 +22,7 @@ def create_settings_page(main_window):
     
     # 添加开机自启动选项
     main_window.autostart_checkbox = QCheckBox("开机时自动启动应用")
-    main_window.autostart_checkbox.setChecked(True)
+    main_window.autostart_checkbox.setChecked(main_window.start_with_windows)
     main_window.autostart_checkbox.toggled.connect(main_window.toggle_autostart)
     settings_layout.addWidget(main_window.autostart_checkbox)
     
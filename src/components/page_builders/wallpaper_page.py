@@ -47,14 +47,6 @@ def _add_wallpaper_settings(main_window, parent_layout):
     main_window.wallpaper_preview.setObjectName("wallpaperPreview")
     main_window.wallpaper_preview.setAlignment(Qt.AlignCenter)
     main_window.wallpaper_preview.setMinimumHeight(180)
-    main_window.wallpaper_preview.setStyleSheet("""
-        QLabel#wallpaperPreview {
-            background-color: #f5f5f5;
-            border: 1px dashed #d0d0d0;
-            border-radius: 4px;
-            padding: 8px;
-        }
-    """)
     preview_layout.addWidget(main_window.wallpaper_preview)
     
     main_window.path_label = QLabel("未选择图片")
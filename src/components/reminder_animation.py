@@ -8,7 +8,8 @@ class ReminderAnimator:
         self.parent = parent
         self.ui = parent.ui
         
-        # 保存动画对象
+        # 保存动画对象，动画以提醒屏幕为父对象，随屏幕一起销毁
+        # 错位启动的计时器也以屏幕为上下文，屏幕销毁后不再触发
         self.enter_animations = {}
         self.exit_animations = {}
         
@@ -18,35 +19,35 @@ class ReminderAnimator:
     def start_animations(self):
         """开始入场动画"""
         # 背景模糊层淡入
-        anim_backdrop = QPropertyAnimation(self.ui.backdrop, b"geometry")
+        anim_backdrop = QPropertyAnimation(self.ui.backdrop, b"geometry", self.parent)
         anim_backdrop.setDuration(800)
         anim_backdrop.setStartValue(QRect(0, 0, 0, self.screen_size.height()))
         anim_backdrop.setEndValue(QRect(0, 0, self.screen_size.width(), self.screen_size.height()))
         anim_backdrop.setEasingCurve(QEasingCurve.OutQuint)
         
         # 色块A从顶部向底部延伸
-        anim_a = QPropertyAnimation(self.ui.block_a, b"geometry")
+        anim_a = QPropertyAnimation(self.ui.block_a, b"geometry", self.parent)
         anim_a.setDuration(1100)
         anim_a.setStartValue(QRect(0, 0, self.ui.block_a_width, 0))
         anim_a.setEndValue(QRect(0, 0, self.ui.block_a_width, self.screen_size.height()))
         anim_a.setEasingCurve(QEasingCurve.OutQuint)
         
         # 色块B从左向右延伸
-        anim_b = QPropertyAnimation(self.ui.block_b, b"geometry")
+        anim_b = QPropertyAnimation(self.ui.block_b, b"geometry", self.parent)
         anim_b.setDuration(1200)
         anim_b.setStartValue(QRect(0, 0, 0, self.screen_size.height()))
         anim_b.setEndValue(QRect(0, 0, self.screen_size.width(), self.screen_size.height()))
         anim_b.setEasingCurve(QEasingCurve.OutQuart)
         
         # 色块C从右向左延展到色块A的右边界
-        anim_c = QPropertyAnimation(self.ui.block_c, b"geometry")
+        anim_c = QPropertyAnimation(self.ui.block_c, b"geometry", self.parent)
         anim_c.setDuration(1100)
         anim_c.setStartValue(QRect(self.screen_size.width(), 0, 0, self.screen_size.height() // 2))
         anim_c.setEndValue(QRect(self.ui.block_a_width, 0, self.screen_size.width() - self.ui.block_a_width, self.screen_size.height() // 2))
         anim_c.setEasingCurve(QEasingCurve.OutQuint)
         
         # 装饰条动画
-        anim_accent = QPropertyAnimation(self.ui.accent_line, b"geometry")
+        anim_accent = QPropertyAnimation(self.ui.accent_line, b"geometry", self.parent)
         anim_accent.setDuration(1000)
         anim_accent.setStartValue(QRect(self.screen_size.width(), self.screen_size.height() // 2 - 7, 0, 14))
         anim_accent.setEndValue(QRect(self.ui.block_a_width, self.screen_size.height() // 2 - 7, self.screen_size.width() - self.ui.block_a_width, 14))
@@ -68,10 +69,10 @@ class ReminderAnimator:
         anim_backdrop.start()  # 先启动背景
         
         # 使用错位效果启动其他动画
-        QTimer.singleShot(150, lambda: self.enter_animations['a'].start())
-        QTimer.singleShot(350, lambda: self.enter_animations['b'].start())
-        QTimer.singleShot(600, lambda: self.enter_animations['c'].start())
-        QTimer.singleShot(800, lambda: self.enter_animations['accent'].start())
+        QTimer.singleShot(150, self.parent, lambda: self.enter_animations['a'].start())
+        QTimer.singleShot(350, self.parent, lambda: self.enter_animations['b'].start())
+        QTimer.singleShot(600, self.parent, lambda: self.enter_animations['c'].start())
+        QTimer.singleShot(800, self.parent, lambda: self.enter_animations['accent'].start())
     
     def on_enter_animations_finished(self):
         """入场动画完成时的回调"""
@@ -82,13 +83,13 @@ class ReminderAnimator:
         # 如果已经在关闭中，则不重复触发
         if self.parent.is_closing:
             return
-            
+        
         # 如果入场动画还在进行中，则等待入场动画完成后再关闭
         if self.parent.is_entering:
             # 只设置关闭定时器，不立即关闭
-            QTimer.singleShot(200, self.check_and_start_close)
+            QTimer.singleShot(200, self.parent, self.check_and_start_close)
             return
-            
+        
         # 设置关闭状态标志
         self.parent.is_closing = True
         
@@ -99,40 +100,40 @@ class ReminderAnimator:
         self.ui.start_cards_exit_animation()
         
         # 延迟一小段时间后开始其他组件的退场动画
-        QTimer.singleShot(300, self.start_main_close_animation)
+        QTimer.singleShot(300, self.parent, self.start_main_close_animation)
     
     def start_main_close_animation(self):
         """开始主要组件的退场动画"""
         # 色块C从当前位置收缩回屏幕右侧
-        anim_c = QPropertyAnimation(self.ui.block_c, b"geometry")
+        anim_c = QPropertyAnimation(self.ui.block_c, b"geometry", self.parent)
         anim_c.setDuration(800)
         anim_c.setStartValue(QRect(self.ui.block_a_width, 0, self.screen_size.width() - self.ui.block_a_width, self.screen_size.height() // 2))
         anim_c.setEndValue(QRect(self.screen_size.width(), 0, 0, self.screen_size.height() // 2))
         anim_c.setEasingCurve(QEasingCurve.InQuint)
         
         # 色块A从上向下收缩
-        anim_a = QPropertyAnimation(self.ui.block_a, b"geometry")
+        anim_a = QPropertyAnimation(self.ui.block_a, b"geometry", self.parent)
         anim_a.setDuration(900)
         anim_a.setStartValue(QRect(0, 0, self.ui.block_a_width, self.screen_size.height()))
         anim_a.setEndValue(QRect(0, self.screen_size.height(), self.ui.block_a_width, 0))
         anim_a.setEasingCurve(QEasingCurve.InQuint)
         
         # 色块B从左向右收缩
-        anim_b = QPropertyAnimation(self.ui.block_b, b"geometry")
+        anim_b = QPropertyAnimation(self.ui.block_b, b"geometry", self.parent)
         anim_b.setDuration(1000)
         anim_b.setStartValue(QRect(0, 0, self.screen_size.width(), self.screen_size.height()))
         anim_b.setEndValue(QRect(self.screen_size.width(), 0, 0, self.screen_size.height()))
         anim_b.setEasingCurve(QEasingCurve.InQuint)
         
         # 背景模糊层淡出
-        anim_backdrop = QPropertyAnimation(self.ui.backdrop, b"geometry")
+        anim_backdrop = QPropertyAnimation(self.ui.backdrop, b"geometry", self.parent)
         anim_backdrop.setDuration(1100)
         anim_backdrop.setStartValue(QRect(0, 0, self.screen_size.width(), self.screen_size.height()))
         anim_backdrop.setEndValue(QRect(self.screen_size.width(), 0, 0, self.screen_size.height()))
         anim_backdrop.setEasingCurve(QEasingCurve.InCubic)
         
         # 装饰条退出动画
-        anim_accent = QPropertyAnimation(self.ui.accent_line, b"geometry")
+        anim_accent = QPropertyAnimation(self.ui.accent_line, b"geometry", self.parent)
         anim_accent.setDuration(1500)
         anim_accent.setStartValue(QRect(self.ui.block_a_width, self.screen_size.height() // 2 - 7, self.screen_size.width() - self.ui.block_a_width, 14))
         anim_accent.setEndValue(QRect(self.screen_size.width(), self.screen_size.height() // 2 - 7, 0, 14))
@@ -152,10 +153,10 @@ class ReminderAnimator:
         
         # 开始退出动画序列
         anim_accent.start()  # 先启动装饰条退出
-        QTimer.singleShot(200, lambda: self.exit_animations['c'].start())
-        QTimer.singleShot(400, lambda: self.exit_animations['a'].start())
-        QTimer.singleShot(600, lambda: self.exit_animations['b'].start())
-        QTimer.singleShot(800, lambda: self.exit_animations['backdrop'].start())
+        QTimer.singleShot(200, self.parent, lambda: self.exit_animations['c'].start())
+        QTimer.singleShot(400, self.parent, lambda: self.exit_animations['a'].start())
+        QTimer.singleShot(600, self.parent, lambda: self.exit_animations['b'].start())
+        QTimer.singleShot(800, self.parent, lambda: self.exit_animations['backdrop'].start())
     
     def check_and_start_close(self):
         """检查入场动画是否完成，然后开始退场动画"""
@@ -163,4 +164,9 @@ class ReminderAnimator:
             self.start_close_animation()
         else:
             # 继续等待
-            QTimer.singleShot(200, self.check_and_start_close)
+            QTimer.singleShot(200, self.parent, self.check_and_start_close)
+    
+    def stop(self):
+        """停止所有动画，动画对象随提醒屏幕一起销毁"""
+        for animation in list(self.enter_animations.values()) + list(self.exit_animations.values()):
+            animation.stop()
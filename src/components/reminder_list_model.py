@@ -0,0 +1,147 @@
+import logging
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+
+from ..utils.schedule import parse_minute
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.ReminderListModel")
+
+# 自定义数据角色
+ReminderRole = Qt.UserRole + 1   # 提醒字典
+TimeRole = Qt.UserRole + 2       # 当天的分钟数，用于排序
+WeekdaysRole = Qt.UserRole + 3   # 星期启用列表
+
+class ReminderListModel(QAbstractListModel):
+    """提醒列表模型，直接读取 ReminderManager 的提醒，按行响应增删改并缓存显示文本"""
+    
+    def __init__(self, reminder_manager, parent=None):
+        super().__init__(parent)
+        self.reminder_manager = reminder_manager
+        # 每行的显示文本缓存，None表示需要重新格式化；长度即模型当前的行数
+        self._display_cache = [None] * len(reminder_manager.get_all_reminders())
+        
+        # 提醒管理器在修改列表后才发出信号，此时按行通知视图
+        reminder_manager.reminder_added.connect(self._on_reminder_added)
+        reminder_manager.reminder_deleted.connect(self._on_reminder_deleted)
+        reminder_manager.reminder_edited.connect(self._on_reminder_edited)
+        reminder_manager.reminders_imported.connect(self._on_reminders_imported)
+        reminder_manager.reminders_reloaded.connect(self.reset)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._display_cache)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._display_cache):
+            return None
+        
+        row = index.row()
+        reminder = self.reminder_manager.get_reminder(row)
+        if reminder is None:
+            return None
+        
+        if role == Qt.DisplayRole:
+            text = self._display_cache[row]
+            if text is None:
+                text = self._display_cache[row] = self.reminder_manager.format_reminder_for_display(reminder)
+            return text
+        if role == Qt.ToolTipRole:
+            return reminder["message"]
+        if role == ReminderRole:
+            return reminder
+        if role == TimeRole:
+            minute = parse_minute(reminder.get("time"))
+            return -1 if minute is None else minute
+        if role == WeekdaysRole:
+            return reminder.get("weekdays", [True] * 7)
+        return None
+    
+    def reset(self):
+        """提醒列表整体变化后重建模型"""
+        self.beginResetModel()
+        self._display_cache = [None] * len(self.reminder_manager.get_all_reminders())
+        self.endResetModel()
+    
+    def _on_reminder_added(self):
+        """新提醒追加在末尾"""
+        count = len(self.reminder_manager.get_all_reminders())
+        start = len(self._display_cache)
+        if count <= start:
+            self.reset()
+            return
+        
+        self.beginInsertRows(QModelIndex(), start, count - 1)
+        self._display_cache.extend([None] * (count - start))
+        self.endInsertRows()
+    
+    def _on_reminder_deleted(self, row):
+        """删除一行"""
+        if not 0 <= row < len(self._display_cache):
+            self.reset()
+            return
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._display_cache[row]
+        self.endRemoveRows()
+    
+    def _on_reminder_edited(self, row):
+        """编辑后只重新格式化该行"""
+        if not 0 <= row < len(self._display_cache):
+            self.reset()
+            return
+        
+        self._display_cache[row] = None
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+    
+    def _on_reminders_imported(self, count):
+        """导入的提醒追加在末尾，替换整个列表时重建模型"""
+        if len(self.reminder_manager.get_all_reminders()) == len(self._display_cache) + count:
+            self._on_reminder_added()
+        else:
+            self.reset()
+
+class ReminderFilterProxyModel(QSortFilterProxyModel):
+    """按星期过滤、按时间排序的代理模型，不复制提醒列表"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._weekday = None  # 只显示该星期启用的提醒，None表示全部
+        self.setSortRole(TimeRole)
+        self.setDynamicSortFilter(True)
+    
+    def set_weekday_filter(self, weekday):
+        """设置星期过滤，0是周一，None表示不过滤"""
+        if weekday == self._weekday:
+            return
+        self._weekday = weekday
+        self.invalidateFilter()
+    
+    def set_sort_by_time(self, enabled):
+        """按时间排序或恢复添加顺序"""
+        if enabled:
+            self.sort(0, Qt.AscendingOrder)
+        else:
+            # 列号-1恢复源模型的顺序
+            self.sort(-1)
+    
+    def source_row(self, proxy_row):
+        """代理模型的行号转换为提醒索引"""
+        if proxy_row < 0:
+            return -1
+        return self.mapToSource(self.index(proxy_row, 0)).row()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._weekday is None:
+            return True
+        weekdays = self.sourceModel().data(self.sourceModel().index(source_row, 0, source_parent), WeekdaysRole)
+        return bool(weekdays) and self._weekday < len(weekdays) and weekdays[self._weekday]
+    
+    def lessThan(self, left, right):
+        left_time = left.data(TimeRole)
+        right_time = right.data(TimeRole)
+        if left_time != right_time:
+            return left_time < right_time
+        # 时间相同时保持添加顺序
+        return left.row() < right.row()
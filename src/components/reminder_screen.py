@@ -47,12 +47,15 @@ logger = logging.getLogger("ClassScreenReminder.ReminderScreen")
 class ReminderScreen(QWidget):
     """全屏提醒窗口类"""
     
-    def __init__(self, message, duration=10, play_sound=True, wallpapers=None, card_manager=None):
+    def __init__(self, message, duration=10, play_sound=True, wallpapers=None, card_manager=None, card_renderer=None):
         super().__init__()
+        # 关闭后立即销毁，连同子控件、动画和图片一起释放
+        self.setAttribute(Qt.WA_DeleteOnClose)
         self.message = message
         self.play_sound = play_sound  # 保存声音设置
         self.wallpapers = wallpapers or {}  # 保存壁纸设置，字典格式 {区域: 路径}
         self.card_manager = card_manager   # 名片管理器
+        self.card_renderer = card_renderer # 名片渲染缓存（可选）
         
         # 根据设置决定是否播放声音
         if play_sound:
@@ -112,6 +115,18 @@ class ReminderScreen(QWidget):
         if not _is_second_sound_playing:
             play_initial_sound()
     
+    def closeEvent(self, event):
+        """关闭时释放资源，窗口随后由 WA_DeleteOnClose 销毁"""
+        self.release()
+        super().closeEvent(event)
+    
+    def release(self):
+        """停止计时器和动画，释放名片和壁纸图片"""
+        self.close_timer.stop()
+        self.sound_repeat_timer.stop()
+        self.animator.stop()
+        self.ui.release()
+    
     def mousePressEvent(self, event):
         """处理鼠标点击事件"""
         self.event_handler.handle_mouse_press(event)
@@ -1,14 +1,15 @@
 import os
 from datetime import datetime
 from PySide6.QtWidgets import QLabel, QFrame, QVBoxLayout, QGraphicsDropShadowEffect
-from PySide6.QtCore import Qt, QRect, QTimer
+from PySide6.QtCore import Qt, QRect, QSize
 from PySide6.QtGui import QGuiApplication, QColor
 
 from .ui_components import ColorBlock, LightEffectBlock
-from .card_ui import Card
+from .card_ui import Card, CardSprite
+from .card_presenter import CardPresenter
 
 class ReminderUI:
-    """负责提醒屏幕的UI组件创建与初始化"""
+    """负责提醒屏幕的UI组件创建与初始化，文字样式由应用样式表按对象名提供"""
     
     def __init__(self, parent):
         self.parent = parent
@@ -25,7 +26,7 @@ class ReminderUI:
         self.message_container = None
         self.message_decoration = None
         self.hint_label = None
-        self.cards = []  # 存储名片组件列表
+        self.card_presenter = None
         
         # 计算尺寸
         self.screen_size = QGuiApplication.primaryScreen().size()
@@ -58,26 +59,14 @@ class ReminderUI:
         self.block_b.setGeometry(0, 0, 0, self.screen_size.height())
         
         # 如果有主区域壁纸，设置背景图片
-        if "main" in self.wallpapers and os.path.exists(self.wallpapers["main"]):
-            self.block_b.set_background_image(self.wallpapers["main"])
-            # 使用壁纸透明度设置
-            if "main_opacity" in self.wallpapers:
-                self.block_b.color.setAlphaF(self.wallpapers["main_opacity"])
-            else:
-                self.block_b.color.setAlphaF(0.7)
+        self._apply_wallpaper(self.block_b, "main", QSize(self.screen_size.width(), self.screen_size.height()))
         
         # 创建色块A（左侧，上层，更深的蓝色）
         opacity_a = 0.95
         self.block_a = ColorBlock("#073763", self.parent, radius=5, opacity=opacity_a)
         
         # 如果有左侧区域壁纸，设置背景图片
-        if "left" in self.wallpapers and os.path.exists(self.wallpapers["left"]):
-            self.block_a.set_background_image(self.wallpapers["left"])
-            # 使用壁纸透明度设置
-            if "left_opacity" in self.wallpapers:
-                self.block_a.color.setAlphaF(self.wallpapers["left_opacity"])
-            else:
-                self.block_a.color.setAlphaF(0.7)
+        self._apply_wallpaper(self.block_a, "left", QSize(self.block_a_width, self.screen_size.height()))
         
         # 设置几何尺寸，初始高度为0用于动画效果
         self.block_a.setGeometry(0, 0, self.block_a_width, 0)
@@ -89,13 +78,7 @@ class ReminderUI:
         self.block_c.setGeometry(self.screen_size.width(), 0, 0, self.screen_size.height() // 2)
         
         # 如果有上部区域壁纸，设置背景图片
-        if "top" in self.wallpapers and os.path.exists(self.wallpapers["top"]):
-            self.block_c.set_background_image(self.wallpapers["top"])
-            # 使用壁纸透明度设置
-            if "top_opacity" in self.wallpapers:
-                self.block_c.color.setAlphaF(self.wallpapers["top_opacity"])
-            else:
-                self.block_c.color.setAlphaF(0.7)
+        self._apply_wallpaper(self.block_c, "top", QSize(self.screen_size.width() - self.block_a_width, self.screen_size.height() // 2))
         
         self.block_c.stackUnder(self.block_a)  # 确保层级正确
         
@@ -104,13 +87,7 @@ class ReminderUI:
         self.accent_line = LightEffectBlock("#4FC3F7", self.parent, radius=4, opacity=opacity_accent)
         
         # 如果有装饰区域壁纸，设置背景图片
-        if "accent" in self.wallpapers and os.path.exists(self.wallpapers["accent"]):
-            self.accent_line.set_background_image(self.wallpapers["accent"])
-            # 使用壁纸透明度设置
-            if "accent_opacity" in self.wallpapers:
-                self.accent_line.color.setAlphaF(self.wallpapers["accent_opacity"])
-            else:
-                self.accent_line.color.setAlphaF(0.7)
+        self._apply_wallpaper(self.accent_line, "accent", QSize(self.screen_size.width() - self.block_a_width, 14))
         
         self.accent_line.setGeometry(self.screen_size.width(), self.screen_size.height() // 2 - 7, 0, 14)
         self.accent_line.raise_()
@@ -118,61 +95,56 @@ class ReminderUI:
         # 在创建色块A后添加名片
         self.display_cards()
     
+    def _apply_wallpaper(self, block, area, size):
+        """为色块设置区域壁纸，优先使用预合成的壁纸，绘制时只需一次贴图"""
+        composited = self.wallpapers.get(f"{area}_composited")
+        if composited and os.path.exists(composited) and block.set_composited_image(composited, size):
+            return
+        
+        if area in self.wallpapers and os.path.exists(self.wallpapers[area]):
+            block.set_background_image(self.wallpapers[area])
+            # 使用壁纸透明度设置
+            block.color.setAlphaF(self.wallpapers.get(f"{area}_opacity", 0.7))
+    
     def display_cards(self):
-        """显示展示片，左侧对齐排列"""
+        """显示展示片，按区域高度分栏分页，只创建当前页的卡片"""
         if not hasattr(self.parent, 'card_manager') or self.parent.card_manager is None:
             return
-            
-        cards_data = self.parent.card_manager.get_all_cards()
         
-        # 基础设置
-        start_y = 50  # 起始Y坐标
-        spacing = 16  # 卡片间距
-        left_margin = 20  # 左侧边距
-        
-        for i, card_data in enumerate(cards_data):
-            card = Card(card_data, self.block_a)
-            
-            # 计算卡片需要的宽度 (基于内容)
-            card.adjustSize()
-            
-            # 检查是否只有图片，无文字信息
-            name = card_data.get("name", "")
-            title = card_data.get("title", "")
-            has_text_info = bool(name.strip() or title.strip())
-            
-            # 根据是否有文本内容设置不同的宽度
-            if has_text_info:
-                # 正常卡片
-                text_length = max(len(name), len(title))
-                card_width = min(self.block_a_width - 50, 86 + min(14 * text_length, 250) + 42)
-            else:
-                # 纯图片卡片，使用正方形尺寸
-                card_width = 110
-            
-            card_height = card.sizeHint().height()
-            
-            # 设置初始位置（在屏幕外）
-            card.setGeometry(-300, start_y, card_width, card_height)
-            
-            # 错位启动动画以匹配色块动画风格
-            base_delay = 580  # 调整基础延迟
-            delay = base_delay + i * 150  # 每个卡片延迟递增，类似色块错位效果
-            
-            QTimer.singleShot(delay, lambda c=card, sx=-300, ex=left_margin, y=start_y: 
-                            c.start_enter_animation(sx, ex, y))
-            
-            # 更新下一张卡片的起始位置
-            start_y += card_height + spacing
-            
-            self.cards.append(card)
-
+        # 每张卡片只提供缓存的尺寸和创建函数，控件在显示到对应页时才创建
+        # 优先使用预渲染的卡片图集，避免每次提醒重建卡片控件
+        card_renderer = getattr(self.parent, 'card_renderer', None)
+        if card_renderer is not None:
+            atlas, sprites = card_renderer.get_sprites()
+            items = [(size, lambda r=source_rect, s=size: CardSprite(atlas, r, s, self.block_a))
+                     for source_rect, size, _ in sprites]
+        else:
+            items = [(Card.display_size(card_data, self.block_a_width),
+                      lambda d=card_data: self._create_card(d))
+                     for card_data in self.parent.card_manager.get_all_cards()]
+        
+        self.card_presenter = CardPresenter(self.block_a, self.block_a_width, self.screen_size.height())
+        self.card_presenter.set_items(items)
+        self.card_presenter.start()
+    
+    def _create_card(self, card_data):
+        """创建卡片控件（未使用名片渲染缓存时）"""
+        card = Card(card_data, self.block_a)
+        card.resize(Card.display_size(card_data, self.block_a_width))
+        return card
+    
+    def release(self):
+        """释放名片和壁纸图片，控件本身随提醒屏幕销毁"""
+        if self.card_presenter is not None:
+            self.card_presenter.release()
+        for block in (self.backdrop, self.block_a, self.block_b, self.block_c, self.accent_line, self.message_decoration):
+            if block is not None:
+                block.release_images()
+    
     def start_cards_exit_animation(self):
         """开始名片退场动画"""
-        for i, card in enumerate(self.cards):
-            # 错位启动退场动画，使用更短的间隔
-            QTimer.singleShot(i * 180, lambda c=card: 
-                            c.start_exit_animation(c.x(), -400))
+        if self.card_presenter is not None:
+            self.card_presenter.stop()
     
     def _create_time_display(self):
         """创建时间显示"""
@@ -186,14 +158,8 @@ class ReminderUI:
         
         # 创建时间标签
         self.time_label = QLabel(current_time, self.block_c)
+        self.time_label.setObjectName("reminderTime")
         self.time_label.setAlignment(Qt.AlignCenter)
-        self.time_label.setStyleSheet("""
-            color: white;
-            font-size: 160px;
-            font-weight: 700;
-            font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-            letter-spacing: 8px;
-        """)
         self.time_label.setGeometry(time_x, time_y, time_width, time_height)
         
         # 创建发光效果
@@ -216,7 +182,7 @@ class ReminderUI:
         # 创建透明容器
         self.message_container = QFrame(self.block_b)
         self.message_container.setGeometry(message_x, message_y, message_width, message_height)
-        self.message_container.setStyleSheet("background-color: transparent; border: none;")
+        self.message_container.setObjectName("reminderMessageContainer")
         
         # 创建垂直布局
         message_layout = QVBoxLayout(self.message_container)
@@ -232,19 +198,13 @@ class ReminderUI:
         # 处理多行消息
         message_lines = self.message.split('\n')
         
-        # 为每行消息创建标签
+        # 为每行消息创建标签，超过两行时使用较小的字号
+        compact = len(message_lines) > 2
         for i, line in enumerate(message_lines):
             msg_label = QLabel(line, self.message_container)
+            msg_label.setObjectName("reminderMessage")
+            msg_label.setProperty("compact", compact)
             msg_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            msg_label.setStyleSheet(f"""
-                color: white;
-                font-size: {48 if len(message_lines) <= 2 else 42}px;
-                font-weight: 600;
-                font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-                letter-spacing: 1px;
-                background-color: transparent;
-                padding: 8px 0px;
-            """)
             
             # 创建文本阴影效果
             text_shadow = QGraphicsDropShadowEffect(msg_label)
@@ -259,13 +219,6 @@ class ReminderUI:
     def _create_hint_label(self):
         """创建提示标签"""
         self.hint_label = QLabel("双击或按ESC键关闭", self.parent)
+        self.hint_label.setObjectName("reminderHint")
         self.hint_label.setAlignment(Qt.AlignRight | Qt.AlignBottom)
-        self.hint_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 14px;
-            font-family: "Segoe UI", "Microsoft YaHei UI", sans-serif;
-            letter-spacing: 0.5px;
-            padding: 24px;
-            background-color: transparent;
-        """)
         self.hint_label.setGeometry(0, 0, self.screen_size.width(), self.screen_size.height())
@@ -1,15 +1,21 @@
-# 用于UI组件的子包
-
-from .audio_manager_ui import AudioManagerUI
-from .wallpaper_manager_ui import WallpaperManagerUI
-from .tray_manager import TrayManager
-from .reminder_manager_ui import ReminderManagerUI
-from .card_manager_ui import CardManagerUI
-
-__all__ = [
-    'AudioManagerUI',
-    'WallpaperManagerUI',
-    'TrayManager',
-    'ReminderManagerUI',
-    'CardManagerUI',
-]
+# 用于UI组件的子包，各管理类在首次访问时才导入
+import importlib
+
+_EXPORTS = {
+    'AudioManagerUI': 'audio_manager_ui',
+    'WallpaperManagerUI': 'wallpaper_manager_ui',
+    'TrayManager': 'tray_manager',
+    'ReminderManagerUI': 'reminder_manager_ui',
+    'CardManagerUI': 'card_manager_ui',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """按需导入UI管理类"""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,6 +7,16 @@ class AudioManagerUI:
     def __init__(self, main_window):
         self.main_window = main_window
         self.ui_builder = main_window.ui_builder
+        self._updating_devices = False  # 防止刷新设备列表时触发切换
+        
+        # 设备热插拔时刷新设备列表
+        from src.utils.sound_manager import add_output_devices_listener
+        add_output_devices_listener(self.update_output_device_list)
+    
+    def release(self):
+        """设置窗口销毁前取消设备变化的回调，模块级的回调列表不再持有窗口"""
+        from src.utils.sound_manager import remove_output_devices_listener
+        remove_output_devices_listener(self.update_output_device_list)
     
     def select_custom_audio(self):
         """选择自定义音频文件"""
@@ -84,4 +94,44 @@ class AudioManagerUI:
                 # 显示路径和格式
                 self.main_window.audio_path_label.setText(f"{current_path}\n({current_format})")
         else:
-            self.main_window.audio_path_label.setText("未设置音频")
\ No newline at end of file
+            self.main_window.audio_path_label.setText("未设置音频")
+    
+    def update_output_device_list(self):
+        """更新输出设备下拉框"""
+        if not hasattr(self.main_window, 'audio_device_combo'):
+            return
+        
+        from src.utils.sound_manager import get_audio_output_devices, get_audio_output_device
+        
+        combo = self.main_window.audio_device_combo
+        selected_id = get_audio_output_device()
+        
+        self._updating_devices = True
+        try:
+            combo.clear()
+            combo.addItem("跟随系统默认设备", "")
+            
+            found = not selected_id
+            for device_id, description in get_audio_output_devices():
+                combo.addItem(description, device_id)
+                found = found or device_id == selected_id
+            
+            # 已选择的设备当前未连接时仍保留在列表中，接入后自动切换回去
+            if not found:
+                combo.addItem("已选择的设备（未连接）", selected_id)
+            
+            index = combo.findData(selected_id)
+            combo.setCurrentIndex(max(0, index))
+        finally:
+            self._updating_devices = False
+    
+    def on_audio_device_changed(self, index):
+        """处理输出设备选择变化"""
+        if self._updating_devices or index < 0:
+            return
+        
+        from src.utils.sound_manager import set_audio_output_device
+        
+        device_id = self.main_window.audio_device_combo.itemData(index)
+        if not set_audio_output_device(device_id):
+            self.ui_builder.show_warning("切换失败", "无法切换到所选的音频输出设备。")
@@ -4,6 +4,8 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QLinearGradient, QBrush, QPen, QColor
 from PySide6.QtCore import Qt
 
+from ...utils.thumbnail_cache import get_avatar
+
 class CardDialog(QDialog):
     """添加/编辑展示片对话框"""
     
@@ -49,12 +51,12 @@ class CardDialog(QDialog):
         self.preview_label = QLabel()
         self.preview_label.setFixedSize(80, 80)
         self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setStyleSheet("background-color: #f0f0f0; border-radius: 40px;")
+        self.preview_label.setObjectName("cardPreview")
         
         # 如果有已设置的图片，显示预览
         if "image_path" in self.card_data and self.card_data["image_path"]:
             self.update_preview()
-            
+        
         preview_layout = QHBoxLayout()
         preview_layout.addWidget(self.preview_label)
         preview_layout.addStretch(1)
@@ -87,84 +89,29 @@ class CardDialog(QDialog):
                 self.image_path_edit.setText(file_paths[0])
                 self.update_preview()
     
+    def _set_preview_has_image(self, has_image):
+        """切换预览标签的样式属性，只在变化时重新应用应用样式表中的规则"""
+        if self.preview_label.property("hasImage") == has_image:
+            return
+        self.preview_label.setProperty("hasImage", has_image)
+        self.preview_label.style().unpolish(self.preview_label)
+        self.preview_label.style().polish(self.preview_label)
+    
     def update_preview(self):
         """更新图片预览，应用填充裁剪效果"""
         image_path = self.image_path_edit.text()
         preview_size = 80
         
         if image_path:
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                # 根据选择的形状应用不同样式
-                is_round = self.round_checkbox.isChecked()
-                # 重置样式
-                self.preview_label.setStyleSheet("background-color: transparent;")
-                
-                # 先缩放图片以填充
-                scaled_pixmap = pixmap.scaled(preview_size, preview_size, 
-                                            Qt.KeepAspectRatioByExpanding, 
-                                            Qt.SmoothTransformation)
-                
-                # 计算中心裁剪区域
-                width, height = scaled_pixmap.width(), scaled_pixmap.height()
-                x_offset = (width - preview_size) // 2 if width > preview_size else 0
-                y_offset = (height - preview_size) // 2 if height > preview_size else 0
-                
-                # 裁剪中心区域
-                cropped_pixmap = scaled_pixmap.copy(x_offset, y_offset, 
-                                                min(width, preview_size), 
-                                                min(height, preview_size))
-                
-                if is_round:
-                    # 创建圆形图片
-                    rounded_pixmap = QPixmap(preview_size, preview_size)
-                    rounded_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(rounded_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    
-                    # 创建圆形裁剪区域
-                    path = QPainterPath()
-                    path.addEllipse(0, 0, preview_size, preview_size)
-                    painter.setClipPath(path)
-                    
-                    # 添加边框
-                    pen = QPen(QColor(200, 200, 200, 120), 2)
-                    painter.setPen(pen)
-                    painter.drawEllipse(1, 1, preview_size-2, preview_size-2)
-                    
-                    # 绘制裁剪后的图片
-                    painter.drawPixmap(0, 0, cropped_pixmap)
-                    painter.end()
-                    
-                    self.preview_label.setPixmap(rounded_pixmap)
-                else:
-                    # 使用方形图片，但添加圆角
-                    rounded_pixmap = QPixmap(preview_size, preview_size)
-                    rounded_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(rounded_pixmap)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    
-                    # 创建圆角矩形裁剪区域
-                    path = QPainterPath()
-                    corner_radius = 12  # 增大圆角半径
-                    path.addRoundedRect(0, 0, preview_size, preview_size, corner_radius, corner_radius)
-                    painter.setClipPath(path)
-                    
-                    # 添加边框
-                    pen = QPen(QColor(200, 200, 200, 120), 2)
-                    painter.setPen(pen)
-                    painter.drawRoundedRect(1, 1, preview_size-2, preview_size-2, corner_radius, corner_radius)
-                    
-                    # 绘制裁剪后的图片
-                    painter.drawPixmap(0, 0, cropped_pixmap)
-                    painter.end()
-                    
-                    self.preview_label.setPixmap(rounded_pixmap)
-                
+            # 使用与卡片相同的缩略图服务，已生成过的头像直接从缓存加载
+            avatar = get_avatar(image_path, preview_size, self.round_checkbox.isChecked())
+            if avatar is not None:
+                # 有图片时去掉占位背景
+                self._set_preview_has_image(True)
+                self.preview_label.setPixmap(avatar)
                 return
-                
+        self._set_preview_has_image(False)
+        
         # 如果没有图片，显示默认占位符 - 使用渐变背景
         is_round = self.round_checkbox.isChecked()
         
@@ -241,7 +188,8 @@ class CardManagerUI:
         if dialog.exec():
             card_data = dialog.get_card_data()
             self.card_manager.add_card(card_data)
-            self.update_card_list()
+            # 只追加新的一行，不重建整个列表
+            self.main_window.card_list.addItem(self._format_card(card_data))
     
     def edit_card(self):
         """编辑展示片"""
@@ -251,20 +199,23 @@ class CardManagerUI:
             dialog = CardDialog(self.main_window, cards[current_row])
             if dialog.exec():
                 card_data = dialog.get_card_data()
-                self.card_manager.delete_card(current_row)
-                self.card_manager.add_card(card_data)
-                self.update_card_list()
+                # 原位更新，保持卡片顺序和列表选中位置
+                if self.card_manager.update_card(current_row, card_data):
+                    self.main_window.card_list.item(current_row).setText(self._format_card(card_data))
     
     def delete_card(self):
         """删除展示片"""
         current_row = self.main_window.card_list.currentRow()
         if current_row >= 0:
-            self.card_manager.delete_card(current_row)
-            self.update_card_list()
+            if self.card_manager.delete_card(current_row):
+                self.main_window.card_list.takeItem(current_row)
     
     def update_card_list(self):
         """更新展示片列表显示"""
         self.main_window.card_list.clear()
         for card in self.card_manager.get_all_cards():
-            display_text = f"{card['name']}" + (f" - {card['title']}" if card.get('title') else "")
-            self.main_window.card_list.addItem(display_text)
+            self.main_window.card_list.addItem(self._format_card(card))
+    
+    def _format_card(self, card):
+        """格式化展示片用于列表显示"""
+        return f"{card['name']}" + (f" - {card['title']}" if card.get('title') else "")
@@ -1,5 +1,11 @@
 from PySide6.QtCore import QTime, QObject
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtWidgets import QMessageBox, QFileDialog
+
+from ...utils.timetable_io import read_timetable, write_timetable, TimetableError
+from ..reminder_list_model import ReminderListModel, ReminderFilterProxyModel, ReminderRole
+
+TIMETABLE_FILTER = "课表文件 (*.csv *.ics);;CSV文件 (*.csv);;iCalendar文件 (*.ics)"
+MAX_SHOWN_ERRORS = 10  # 导入结果中最多列出的错误条数
 
 class ReminderManagerUI:
     """提醒管理界面相关功能"""
@@ -8,17 +14,38 @@ class ReminderManagerUI:
         self.main_window = main_window
         self.ui_builder = main_window.ui_builder
         self.reminder_manager = main_window.reminder_manager
+        
+        # 列表模型跟随提醒管理器的信号按行更新，代理模型负责过滤和排序
+        self.list_model = ReminderListModel(self.reminder_manager, main_window)
+        self.proxy_model = ReminderFilterProxyModel(main_window)
+        self.proxy_model.setSourceModel(self.list_model)
+        
+        # 正在编辑的提醒ID，为None时表单用于添加新提醒
+        self.editing_id = None
     
     def update_reminder_list(self):
-        """更新提醒列表显示"""
-        self.main_window.reminder_list.clear()
-        
-        for reminder in self.reminder_manager.get_all_reminders():
-            display_text = self.reminder_manager.format_reminder_for_display(reminder)
-            self.main_window.reminder_list.addItem(display_text)
+        """重新加载提醒列表显示，增删改会自动按行更新，只在列表整体变化时需要调用"""
+        self.list_model.reset()
+    
+    def selected_reminder_index(self):
+        """获取列表中选中的提醒索引，未选中时返回-1"""
+        return self.proxy_model.source_row(self.main_window.reminder_list.currentIndex().row())
+    
+    def selected_reminder_id(self):
+        """获取列表中选中的提醒ID，未选中时返回None"""
+        reminder = self.main_window.reminder_list.currentIndex().data(ReminderRole)
+        return reminder.get("id") if reminder else None
+    
+    def on_weekday_filter_changed(self, index):
+        """按星期过滤列表"""
+        self.proxy_model.set_weekday_filter(self.main_window.weekday_filter_combo.itemData(index))
+    
+    def on_sort_by_time_changed(self, checked):
+        """切换按时间排序"""
+        self.proxy_model.set_sort_by_time(checked)
     
     def add_reminder(self):
-        """添加新提醒"""
+        """添加新提醒，编辑模式下保存对当前提醒的修改"""
         time_str = self.main_window.time_edit.time().toString("HH:mm")
         message = self.main_window.message_edit.toPlainText().strip()
         duration = self.main_window.duration_spinbox.value()
@@ -31,22 +58,36 @@ class ReminderManagerUI:
             self.ui_builder.show_warning("警告", "请输入提醒消息")
             return
         
+        if self.editing_id is not None:
+            # 原地修改，列表模型只刷新这一行
+            success, msg = self.reminder_manager.update_reminder(self.editing_id, {
+                "time": time_str,
+                "message": message,
+                "duration": duration,
+                "play_sound": play_sound,
+                "weekdays": weekdays,
+            })
+            if success:
+                self.cancel_edit()
+            else:
+                self.ui_builder.show_warning("保存失败", msg)
+            return
+        
         # 添加提醒
         success, msg = self.reminder_manager.add_reminder(time_str, message, duration, play_sound, weekdays)
         
         if success:
-            # 更新UI
-            self.update_reminder_list()
+            # 列表由模型自动更新
             self.main_window.message_edit.clear()
         else:
             self.ui_builder.show_warning("添加失败", msg)
     
     def delete_reminder(self):
         """删除选中的提醒"""
-        current_row = self.main_window.reminder_list.currentRow()
-        if current_row >= 0:
+        reminder_id = self.selected_reminder_id()
+        reminder = self.reminder_manager.get_reminder_by_id(reminder_id) if reminder_id else None
+        if reminder:
             # 获取当前选中的提醒信息
-            reminder = self.reminder_manager.get_reminder(current_row)
             time_str = reminder["time"]
             message = reminder["message"].split('\n')[0]  # 只显示第一行
             
@@ -56,17 +97,17 @@ class ReminderManagerUI:
                 f"确定要删除以下提醒吗？\n时间: {time_str}\n内容: {message}"
             )
             
+            # 确认期间列表可能已变化，按ID删除
             if reply == QMessageBox.Yes:
-                success, _ = self.reminder_manager.delete_reminder(current_row)
-                if success:
-                    self.update_reminder_list()
+                self.reminder_manager.delete_reminder_by_id(reminder_id)
+                if reminder_id == self.editing_id:
+                    self.cancel_edit()
     
     def edit_reminder(self):
-        """编辑选中的提醒"""
-        current_row = self.main_window.reminder_list.currentRow()
-        if current_row >= 0:
-            reminder = self.reminder_manager.get_reminder(current_row)
-            
+        """将选中的提醒加载到表单中编辑"""
+        reminder_id = self.selected_reminder_id()
+        reminder = self.reminder_manager.get_reminder_by_id(reminder_id) if reminder_id else None
+        if reminder:
             # 设置界面值为当前选中的提醒
             self.main_window.time_edit.setTime(QTime.fromString(reminder["time"], "HH:mm"))
             self.main_window.message_edit.setText(reminder["message"])
@@ -78,20 +119,89 @@ class ReminderManagerUI:
             for i, checkbox in enumerate(self.main_window.weekday_checkboxes):
                 checkbox.setChecked(weekdays[i] if i < len(weekdays) else True)
             
-            # 删除当前提醒
-            success, _ = self.reminder_manager.delete_reminder(current_row)
-            if success:
-                # 更新界面
-                self.update_reminder_list()
-                
-                # 提示用户
-                self.ui_builder.show_message("编辑提醒", 
-                                     "已加载选中的提醒到编辑区域，\n修改后点击「添加提醒」按钮保存。")
+            # 进入编辑模式
+            self.editing_id = reminder_id
+            self.main_window.form_title.setText("编辑提醒")
+            self.main_window.add_button.setText("保存修改")
+            self.main_window.cancel_edit_button.show()
+    
+    def cancel_edit(self):
+        """退出编辑模式，表单恢复为添加新提醒"""
+        self.editing_id = None
+        self.main_window.form_title.setText("添加新提醒")
+        self.main_window.add_button.setText("添加提醒")
+        self.main_window.cancel_edit_button.hide()
+        self.main_window.message_edit.clear()
+    
+    def import_timetable(self):
+        """从CSV或iCalendar文件批量导入提醒"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.main_window,
+            "导入课表",
+            "",
+            TIMETABLE_FILTER
+        )
+        if not file_path:
+            return
+        
+        try:
+            reminders, errors = read_timetable(file_path)
+        except TimetableError as e:
+            self.ui_builder.show_warning("导入失败", str(e))
+            return
+        
+        if not reminders:
+            self.ui_builder.show_warning("导入失败", "文件中没有有效的提醒\n" + "\n".join(errors[:MAX_SHOWN_ERRORS]))
+            return
+        
+        # 有无效条目时先确认，避免导入不完整的课表
+        if errors:
+            shown = "\n".join(errors[:MAX_SHOWN_ERRORS])
+            if len(errors) > MAX_SHOWN_ERRORS:
+                shown += f"\n……共 {len(errors)} 条错误"
+            reply = self.ui_builder.show_question(
+                "部分条目无效",
+                f"有 {len(errors)} 条无效条目将被跳过:\n{shown}\n\n是否导入其余 {len(reminders)} 个提醒？"
+            )
+            if reply != QMessageBox.Yes:
+                return
+        
+        # 整批保存一次，列表模型一次性插入新行
+        success, msg, _ = self.reminder_manager.import_reminders(reminders)
+        if success:
+            self.ui_builder.show_message("导入完成", msg)
+        else:
+            self.ui_builder.show_warning("导入失败", msg)
+    
+    def export_timetable(self):
+        """将所有提醒导出为CSV或iCalendar文件"""
+        reminders = self.reminder_manager.get_all_reminders()
+        if not reminders:
+            self.ui_builder.show_warning("导出失败", "没有可导出的提醒")
+            return
+        
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self.main_window,
+            "导出课表",
+            "课表.csv",
+            TIMETABLE_FILTER
+        )
+        if not file_path:
+            return
+        
+        # 未填写扩展名时按选择的文件类型补全
+        if not file_path.lower().endswith((".csv", ".ics")):
+            file_path += ".ics" if "iCalendar" in selected_filter else ".csv"
+        
+        try:
+            write_timetable(reminders, file_path)
+        except TimetableError as e:
+            self.ui_builder.show_warning("导出失败", str(e))
+            return
+        self.ui_builder.show_message("导出完成", f"已导出 {len(reminders)} 个提醒")
     
     def test_reminder(self):
         """测试提醒显示效果"""
-        from src.components.reminder_screen import ReminderScreen
-        
         # 获取当前时间和测试消息
         message = self.main_window.message_edit.toPlainText().strip()
         if not message:
@@ -100,19 +210,15 @@ class ReminderManagerUI:
         duration = self.main_window.duration_spinbox.value()
         play_sound = self.main_window.sound_checkbox.isChecked()
         
-        # 获取所有区域的壁纸
-        wallpapers = self.main_window.wallpaper_manager.get_all_wallpapers()
-        
-        if self.main_window.reminder_screen:
-            self.main_window.reminder_screen.close()
-            self.main_window.reminder_screen = None
-        
-        # 创建新的提醒屏幕对象，传入所有区域的壁纸和名片管理器
-        self.main_window.reminder_screen = ReminderScreen(message, int(duration), play_sound, wallpapers, self.main_window.card_manager)
-        self.main_window.reminder_screen.show()
+        # 由调度核心显示，设置窗口关闭后提醒屏幕仍然保留
+        self.main_window.core.show_reminder(message, int(duration), play_sound)
     
     def reset_form(self):
         """重置表单内容"""
+        # 重置时同时退出编辑模式
+        if self.editing_id is not None:
+            self.cancel_edit()
+        
         # 时间设为当前时间
         self.main_window.time_edit.setTime(QTime.currentTime())
         
@@ -128,5 +234,5 @@ class ReminderManagerUI:
         
         # 清空消息内容
         self.main_window.message_edit.clear()
-
+        
         self.ui_builder.show_message("操作完成", "表单已重置为默认值")
\ No newline at end of file
@@ -5,13 +5,14 @@ from PySide6.QtGui import QIcon, QAction
 class TrayManager:
     """系统托盘图标管理类"""
     
-    def __init__(self, main_window):
-        self.main_window = main_window
+    def __init__(self, core):
+        # 托盘图标属于常驻的调度核心，设置窗口关闭销毁后仍然保留
+        self.core = core
         self.setup_tray()
     
     def setup_tray(self):
         """设置系统托盘图标"""
-        self.tray_icon = QSystemTrayIcon(self.main_window)
+        self.tray_icon = QSystemTrayIcon(self.core)
         
         # 尝试查找应用图标
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
@@ -23,34 +24,18 @@ class TrayManager:
         if icon is None or icon.isNull():
             # 使用系统内置信息图标
             from PySide6.QtWidgets import QStyle
-            icon = self.main_window.style().standardIcon(QStyle.SP_MessageBoxInformation)
+            icon = QApplication.style().standardIcon(QStyle.SP_MessageBoxInformation)
         
         self.tray_icon.setIcon(icon)
         
-        # 创建托盘菜单
+        # 创建托盘菜单，样式由应用样式表中的 QMenu 规则提供
         tray_menu = QMenu()
-        tray_menu.setStyleSheet("""
-            QMenu {
-                background-color: white;
-                color: #202020;
-                border: 1px solid #e1e1e1;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 24px 6px 12px;
-                color: #202020;
-            }
-            QMenu::item:selected {
-                background-color: rgba(0, 103, 192, 0.08);
-                color: #0067C0;
-            }
-        """)
         
-        show_action = QAction("显示窗口", self.main_window)
+        show_action = QAction("显示窗口", self.core)
         show_action.triggered.connect(self.show_from_tray)
         tray_menu.addAction(show_action)
         
-        exit_action = QAction("退出", self.main_window)
+        exit_action = QAction("退出", self.core)
         exit_action.triggered.connect(self.close_application)
         tray_menu.addAction(exit_action)
         
@@ -68,13 +53,11 @@ class TrayManager:
     
     def close_application(self):
         """彻底关闭应用"""
-        self.tray_icon.hide()
-        QApplication.quit()
-        
+        self.core.quit()
+    
     def show_from_tray(self):
-        """从托盘显示窗口"""
-        self.main_window.showNormal()
-        self.main_window.activateWindow()  # 在Windows上激活窗口并设置焦点
+        """从托盘显示窗口，窗口已关闭时重新创建"""
+        self.core.show_main_window()
     
     def tray_icon_activated(self, reason):
         """处理托盘图标点击事件"""
@@ -1,7 +1,8 @@
 import os
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QSlider
-from PySide6.QtGui import QPixmap, QColor, QPainter
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
+
+from ..wallpaper_preview import WallpaperPreviewRenderer
 
 class WallpaperManagerUI:
     """壁纸管理界面相关功能"""
@@ -11,6 +12,17 @@ class WallpaperManagerUI:
         self.ui_builder = main_window.ui_builder
         self.wallpaper_manager = main_window.wallpaper_manager
         self._updating_ui = False  # 添加标志防止循环更新
+        
+        # 预览渲染器缓存缩小后的壁纸，拖动滑块时只重新叠加遮罩
+        self.preview_renderer = WallpaperPreviewRenderer(self.wallpaper_manager, main_window)
+        self.preview_renderer.preview_updated.connect(self._show_preview)
+        
+        # 拖动滑块时延迟保存透明度，停止拖动后才写入配置并重新合成壁纸
+        self._pending_opacity = None  # (区域, 遮罩不透明度)
+        self._opacity_save_timer = QTimer(main_window)
+        self._opacity_save_timer.setSingleShot(True)
+        self._opacity_save_timer.setInterval(400)
+        self._opacity_save_timer.timeout.connect(self.save_pending_opacity)
     
     def select_wallpaper(self):
         """选择壁纸"""
@@ -53,56 +65,51 @@ class WallpaperManagerUI:
             print(f"区域变更出错: {e}")
             traceback.print_exc()
     
+    def _show_preview(self, pixmap):
+        """显示渲染好的提醒屏幕缩略图"""
+        self.main_window.wallpaper_preview.setPixmap(pixmap)
+    
+    def save_pending_opacity(self):
+        """保存拖动滑块期间尚未保存的透明度"""
+        self._opacity_save_timer.stop()
+        if self._pending_opacity is not None:
+            area, opacity = self._pending_opacity
+            self._pending_opacity = None
+            self.wallpaper_manager.set_wallpaper_opacity(area, opacity)
+    
     def update_wallpaper_preview(self, area):
         """更新壁纸预览显示"""
         self._updating_ui = True  # 设置标志，防止UI更新触发数据更新
         try:
+            # 切换区域或壁纸变化前先保存未保存的透明度
+            self.save_pending_opacity()
+            
             path = self.wallpaper_manager.get_wallpaper(area)
             opacity = self.wallpaper_manager.get_wallpaper_opacity(area)
             
+            # 缩略图包含全部四个区域，始终显示；壁纸路径变化时渲染器会重新加载底图
+            self.preview_renderer.set_selected_area(area)
+            
             # 检查路径是否有效
             if path and os.path.exists(path):
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    # 创建透明效果预览
-                    base_pixmap = pixmap.scaled(300, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    
-                    # 创建一个新的图像以显示遮罩效果
-                    result_pixmap = QPixmap(base_pixmap.size())
-                    result_pixmap.fill(Qt.transparent)
-                    
-                    painter = QPainter(result_pixmap)
-                    # 先绘制原始壁纸
-                    painter.drawPixmap(0, 0, base_pixmap)
-                    
-                    # 再绘制遮罩层，透明度为设定值
-                    color = QColor("#0B5394")  # 蓝色遮罩，与ColorBlock匹配
-                    color.setAlphaF(opacity / 100.0)  # 转换为0-1范围
-                    painter.fillRect(0, 0, base_pixmap.width(), base_pixmap.height(), color)
-                    painter.end()
-                    
-                    self.main_window.wallpaper_preview.setPixmap(result_pixmap)
-                    
-                    # 更新路径和透明度信息显示
-                    slider_value = 100 - opacity  # 反转值来显示透明度
-                    self.main_window.path_label.setText(f"{path} (遮罩透明度: {slider_value}%)")
+                # 更新路径和透明度信息显示
+                slider_value = 100 - opacity  # 反转值来显示透明度
+                self.main_window.path_label.setText(f"{self.wallpaper_manager.get_wallpaper_source(area)} (遮罩透明度: {slider_value}%)")
+                
+                # 更新透明度滑块位置，注意此处可能循环调用，需要阻断信号
+                if hasattr(self.main_window, 'opacity_slider'):
+                    self.main_window.opacity_slider.blockSignals(True)
+                    self.main_window.opacity_slider.setValue(slider_value)
+                    # 立即更新标签显示
+                    if hasattr(self.main_window, 'opacity_value_label'):
+                        self.main_window.opacity_value_label.setText(f"{slider_value}%")
+                    self.main_window.opacity_slider.blockSignals(False)
                     
-                    # 更新透明度滑块位置，注意此处可能循环调用，需要阻断信号
-                    if hasattr(self.main_window, 'opacity_slider'):
-                        self.main_window.opacity_slider.blockSignals(True)
-                        self.main_window.opacity_slider.setValue(slider_value)
-                        # 立即更新标签显示
-                        if hasattr(self.main_window, 'opacity_value_label'):
-                            self.main_window.opacity_value_label.setText(f"{slider_value}%")
-                        self.main_window.opacity_slider.blockSignals(False)
-                        
-                        # 确保滑块启用
-                        self.main_window.opacity_slider.setEnabled(True)
-                    return
+                    # 确保滑块启用
+                    self.main_window.opacity_slider.setEnabled(True)
+                return
             
-            # 没有设置壁纸或加载失败
-            self.main_window.wallpaper_preview.setText("无背景图片")
-            self.main_window.wallpaper_preview.setPixmap(QPixmap())
+            # 没有设置壁纸
             self.main_window.path_label.setText("未选择图片")
             
             # 禁用透明度滑块
@@ -174,8 +181,9 @@ class WallpaperManagerUI:
             # 应用并保存新的透明度值（100-value 是遮罩的不透明度）
             saved_opacity = 100 - value  # 反转值
             
-            # 直接保存透明度设置
-            self.wallpaper_manager.set_wallpaper_opacity(area, saved_opacity)
+            # 延迟保存透明度设置，拖动期间只更新预览
+            self._pending_opacity = (area, saved_opacity)
+            self._opacity_save_timer.start()
             
             # 更新标签显示
             if hasattr(self.main_window, 'opacity_value_label'):
@@ -190,31 +198,11 @@ class WallpaperManagerUI:
 
     def _update_preview_only(self, area, opacity):
         """仅更新预览图，不调整滑块值"""
-        path = self.wallpaper_manager.get_wallpaper(area)
-        if path and os.path.exists(path):
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
-                # 创建透明效果预览
-                base_pixmap = pixmap.scaled(300, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                
-                # 创建一个新的图像以显示遮罩效果
-                result_pixmap = QPixmap(base_pixmap.size())
-                result_pixmap.fill(Qt.transparent)
-                
-                painter = QPainter(result_pixmap)
-                painter.drawPixmap(0, 0, base_pixmap)
-                
-                # 应用遮罩
-                color = QColor("#0B5394")
-                color.setAlphaF(opacity / 100.0)
-                painter.fillRect(0, 0, base_pixmap.width(), base_pixmap.height(), color)
-                painter.end()
-                
-                self.main_window.wallpaper_preview.setPixmap(result_pixmap)
-                
-                # 仅更新路径文本
-                slider_value = 100 - opacity
-                self.main_window.path_label.setText(f"{path} (遮罩透明度: {slider_value}%)")
+        self.preview_renderer.set_opacity(area, opacity)
+        
+        # 仅更新路径文本
+        slider_value = 100 - opacity
+        self.main_window.path_label.setText(f"{self.wallpaper_manager.get_wallpaper_source(area)} (遮罩透明度: {slider_value}%)")
 
     def set_opacity_slider(self, slider):
         """设置透明度滑块控件引用"""
@@ -1,20 +1,29 @@
 import os
+import time
+import logging
+import importlib
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                               QPushButton, QFrame, QMessageBox, QStackedWidget)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 
 from .ui_components import SidebarMenu
-from .page_builders.reminders_page import create_reminders_page
-from .page_builders.wallpaper_page import create_wallpaper_page
-from .page_builders.settings_page import create_settings_page
-from .page_builders.about_page import create_about_page
-from .page_builders.audio_page import create_audio_page
-from .page_builders.cards_page import create_cards_page
+
+timing_logger = logging.getLogger("ClassScreenReminder.Timing")
 
 class MainWindowUI:
     """主窗口UI构建器，负责创建和设置UI组件"""
     
+    # 各页面构建函数所在的模块，页面在首次切换到时才导入和创建
+    PAGE_BUILDERS = {
+        "reminders": ("reminders_page", "create_reminders_page"),
+        "wallpapers": ("wallpaper_page", "create_wallpaper_page"),
+        "audio": ("audio_page", "create_audio_page"),
+        "cards": ("cards_page", "create_cards_page"),
+        "settings": ("settings_page", "create_settings_page"),
+        "about": ("about_page", "create_about_page"),
+    }
+    
     def __init__(self, main_window):
         self.main_window = main_window
         self.weekday_checkboxes = []
@@ -57,12 +66,8 @@ class MainWindowUI:
         self.main_window.content_stack = QStackedWidget()
         content_layout.addWidget(self.main_window.content_stack)
         
-        # 创建不同功能页面
-        self._create_reminders_page()
-        self._create_wallpaper_page()
-        self._create_audio_page()
-        self._create_cards_page()
-        self._create_settings_page()
+        # 只创建默认显示的提醒页面，其余页面首次切换时再创建
+        self.ensure_page("reminders")
         
         # 将内容容器添加到主布局
         main_layout.addWidget(content_container)
@@ -113,41 +118,25 @@ class MainWindowUI:
         
         parent_layout.addWidget(title_frame)
     
-    def _create_reminders_page(self):
-        """创建提醒管理页面"""
-        page = create_reminders_page(self.main_window)
-        self.main_window.content_stack.addWidget(page)
-        self.content_pages["reminders"] = 0  # 保存页面索引
-        self.main_window.weekday_checkboxes = self.weekday_checkboxes
-    
-    def _create_wallpaper_page(self):
-        """创建壁纸设置页面"""
-        page = create_wallpaper_page(self.main_window)
-        self.main_window.content_stack.addWidget(page)
-        self.content_pages["wallpapers"] = 1  # 保存页面索引
-    
-    def _create_audio_page(self):
-        """创建音频设置页面"""
-        page = create_audio_page(self.main_window)
-        self.main_window.content_stack.addWidget(page)
-        self.content_pages["audio"] = 2  # 保存页面索引
-    
-    def _create_cards_page(self):
-        """创建名片管理页面"""
-        page = create_cards_page(self.main_window)
-        self.main_window.content_stack.addWidget(page)
-        self.content_pages["cards"] = 3  # 保存页面索引
-    
-    def _create_settings_page(self):
-        """创建应用设置页面"""
-        page = create_settings_page(self.main_window)
-        self.main_window.content_stack.addWidget(page)
-        self.content_pages["settings"] = 4  # 保存页面索引
-        
-        # 创建关于页面
-        about_page = create_about_page(self.main_window)
-        self.main_window.content_stack.addWidget(about_page)
-        self.content_pages["about"] = 5  # 保存页面索引
+    def ensure_page(self, menu_id):
+        """确保页面已创建，返回页面在堆叠部件中的索引，未知页面返回None"""
+        if menu_id in self.content_pages:
+            return self.content_pages[menu_id]
+        if menu_id not in self.PAGE_BUILDERS:
+            return None
+        
+        start_time = time.perf_counter()
+        module_name, builder_name = self.PAGE_BUILDERS[menu_id]
+        module = importlib.import_module(f".page_builders.{module_name}", __package__)
+        page = getattr(module, builder_name)(self.main_window)
+        
+        index = self.main_window.content_stack.addWidget(page)
+        self.content_pages[menu_id] = index  # 保存页面索引
+        timing_logger.info(f"{menu_id}页面创建耗时: {(time.perf_counter() - start_time) * 1000:.1f}ms")
+        
+        # 页面创建后由主窗口填充数据
+        self.main_window.on_page_created(menu_id)
+        return index
     
     def show_message(self, title, message, icon=QMessageBox.Information):
         """显示消息对话框"""
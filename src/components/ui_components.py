@@ -13,11 +13,12 @@ class ColorBlock(QFrame):
         self.bg_image_path = bg_image_path
         self.original_image = None  # 存储原始图像
         self.scaled_image = None    # 存储缩放后的图像
+        self.composited_image = None  # 预合成的不透明背景（壁纸+遮罩色），绘制时直接贴图
         
         if bg_image_path:
             self.load_background_image(bg_image_path)
         
-        self.setStyleSheet("background-color: transparent;")
+        # 透明背景由应用样式表中的 ColorBlock 规则提供
         self.setAttribute(Qt.WA_TranslucentBackground)
     
     def load_background_image(self, image_path):
@@ -39,8 +40,47 @@ class ColorBlock(QFrame):
             self.bg_image_path = None
             self.update()
     
+    def set_composited_image(self, image_path, size):
+        """设置预合成的背景图，预先缩放到最终显示尺寸，绘制时不再混合遮罩色"""
+        pixmap = QPixmap(image_path)
+        if pixmap.isNull():
+            return False
+        
+        # 合成图按最大屏幕生成，与当前屏幕尺寸不一致时只在此处缩放一次
+        dpr = self.devicePixelRatioF()
+        pixel_size = QSize(round(size.width() * dpr), round(size.height() * dpr))
+        if pixmap.size() != pixel_size:
+            pixmap = pixmap.scaled(pixel_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            pixmap = pixmap.copy((pixmap.width() - pixel_size.width()) // 2,
+                                 (pixmap.height() - pixel_size.height()) // 2,
+                                 pixel_size.width(), pixel_size.height())
+        pixmap.setDevicePixelRatio(dpr)
+        
+        self.composited_image = pixmap
+        self.update()
+        return True
+    
+    def release_images(self):
+        """释放背景图片"""
+        self.original_image = None
+        self.scaled_image = None
+        self.composited_image = None
+    
     def paintEvent(self, event):
         painter = QPainter(self)
+        
+        # 有预合成背景时只需一次贴图，圆角之外保持透明
+        if self.composited_image is not None:
+            if self.radius:
+                path = QPainterPath()
+                path.addRoundedRect(self.rect(), self.radius, self.radius)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setClipPath(path)
+            painter.drawPixmap(0, 0, self.composited_image)
+            painter.end()
+            super().paintEvent(event)
+            return
+        
         painter.setRenderHint(QPainter.Antialiasing)
         
         # 创建圆角路径
@@ -113,39 +153,8 @@ class MenuButton(QPushButton):
         
         self.setMinimumHeight(44)
         self.setCursor(Qt.PointingHandCursor)
+        # 样式由应用样式表中的 #menuButton 规则提供，随主题和强调色变化
         self.setObjectName("menuButton")
-        
-        # 添加额外的样式
-        self._update_style()
-        
-    def _update_style(self):
-        base_style = """
-            QPushButton {
-                text-align: left;
-                padding-left: 16px;
-                background-color: transparent;
-                border: none;
-                border-radius: 8px;
-                color: #202020;
-                font-weight: 500;
-                margin: 2px 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 0, 0, 0.04);
-            }
-            QPushButton:pressed {
-                background-color: rgba(0, 0, 0, 0.08);
-            }
-            QPushButton:checked {
-                background-color: rgba(98, 100, 167, 0.15);
-                color: #0067C0;
-                font-weight: 500;
-            }
-            QPushButton:checked:hover {
-                background-color: rgba(98, 100, 167, 0.2);
-            }
-        """
-        self.setStyleSheet(base_style)
 
 class SidebarMenu(QWidget):
     menuChanged = Signal(str)  # 当菜单项改变时发出信号
@@ -163,12 +172,8 @@ class SidebarMenu(QWidget):
         self.menu_buttons = {}
         self.current_menu = None
         
-        self.setStyleSheet("""
-            #sidebarMenu {
-                background-color: #f8f8f8;
-                border-right: 1px solid #e1e1e1;
-            }
-        """)
+        # 绘制由应用样式表中的 #sidebarMenu 规则设置的背景
+        self.setAttribute(Qt.WA_StyledBackground)
     
     def add_menu_item(self, menu_id, text, is_active=False):
         """添加菜单项"""
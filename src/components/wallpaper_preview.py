@@ -0,0 +1,147 @@
+import os
+import logging
+from datetime import datetime
+from PySide6.QtCore import QObject, QRectF, QSize, QTimer, Qt, Signal
+from PySide6.QtGui import QGuiApplication, QImage, QImageReader, QPainter, QPixmap, QColor, QPen, QFont
+
+from ..utils.wallpaper_compositor import AREA_MASK_COLORS, blur_image
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.WallpaperPreview")
+
+class WallpaperPreviewRenderer(QObject):
+    """壁纸预览渲染器，缓存缩小后的壁纸底图，拖动滑块时只重新叠加遮罩并按屏幕刷新率节流"""
+    
+    preview_updated = Signal(QPixmap)
+    
+    PREVIEW_WIDTH = 320
+    
+    # 无壁纸时各区域色块的默认不透明度，与提醒屏幕一致
+    DEFAULT_OPACITIES = {"main": 0.85, "left": 0.95, "top": 0.90, "accent": 0.9}
+    
+    # 绘制顺序与提醒屏幕的层级一致：中间区域在底，装饰条在最上
+    PAINT_ORDER = ("main", "top", "left", "accent")
+    
+    def __init__(self, wallpaper_manager, parent=None):
+        super().__init__(parent)
+        self.wallpaper_manager = wallpaper_manager
+        self.selected_area = None
+        self._bases = {}      # {区域: (壁纸路径, 模糊半径, 缩小后的底图)}
+        self._opacities = {}  # 拖动滑块时尚未保存的遮罩不透明度
+        
+        # 按屏幕刷新率节流重绘，拖动过程中每帧最多合成一次
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen and screen.refreshRate() > 0 else 60
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(max(1, int(1000 / refresh_rate)))
+        self._render_timer.timeout.connect(self.render)
+    
+    def _layout(self):
+        """按当前屏幕比例计算缩略图尺寸和各区域位置，与提醒屏幕布局一致"""
+        screen_size = QGuiApplication.primaryScreen().size()
+        scale = self.PREVIEW_WIDTH / screen_size.width()
+        width = self.PREVIEW_WIDTH
+        height = round(screen_size.height() * scale)
+        left_width = screen_size.width() // 5 * scale
+        
+        rects = {
+            "main": QRectF(0, 0, width, height),
+            "left": QRectF(0, 0, left_width, height),
+            "top": QRectF(left_width, 0, width - left_width, height / 2),
+            "accent": QRectF(left_width, height / 2 - max(7 * scale, 1), width - left_width, max(14 * scale, 2)),
+        }
+        return QSize(width, height), scale, rects
+    
+    def set_selected_area(self, area):
+        """设置当前选中的区域并立即重绘"""
+        self.selected_area = area
+        self._opacities.clear()
+        self.render()
+    
+    def set_opacity(self, area, opacity):
+        """拖动滑块时更新区域的遮罩不透明度（0-100），在下一帧重绘"""
+        self._opacities[area] = opacity
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+    
+    def _get_base(self, area, size, scale):
+        """获取区域缩小后的壁纸底图，壁纸或模糊半径未变化时直接使用缓存"""
+        path = self.wallpaper_manager.get_wallpaper(area)
+        if not path or not os.path.exists(path):
+            self._bases.pop(area, None)
+            return None
+        
+        blur_radius = self.wallpaper_manager.get_wallpaper_blur(area)
+        cached = self._bases.get(area)
+        if cached and cached[0] == path and cached[1] == blur_radius and cached[2].size() == size:
+            return cached[2]
+        
+        # 解码时直接缩小到预览尺寸，避免完整解码壁纸
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid():
+            cover = max(size.width() / source_size.width(), size.height() / source_size.height())
+            if cover < 1.0:
+                reader.setScaledSize(QSize(max(1, round(source_size.width() * cover)),
+                                           max(1, round(source_size.height() * cover))))
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"无法加载预览壁纸: {path}")
+            return None
+        
+        # 填充裁剪到区域尺寸，模糊半径按缩略比例缩小
+        image = image.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        image = image.copy((image.width() - size.width()) // 2, (image.height() - size.height()) // 2,
+                           size.width(), size.height())
+        image = blur_image(image, round(blur_radius * scale))
+        
+        self._bases[area] = (path, blur_radius, image)
+        return image
+    
+    def render(self):
+        """合成整个提醒屏幕的缩略图并发出更新信号"""
+        self._render_timer.stop()
+        
+        size, scale, rects = self._layout()
+        dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+        
+        preview = QImage(round(size.width() * dpr), round(size.height() * dpr), QImage.Format_ARGB32_Premultiplied)
+        preview.setDevicePixelRatio(dpr)
+        preview.fill(QColor("#3C3C3C"))  # 代表桌面的背景
+        
+        painter = QPainter(preview)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        for area in self.PAINT_ORDER:
+            rect = rects[area]
+            color = QColor(AREA_MASK_COLORS[area])
+            pixel_size = QSize(max(1, round(rect.width() * dpr)), max(1, round(rect.height() * dpr)))
+            base = self._get_base(area, pixel_size, scale * dpr)
+            
+            if base is not None:
+                # 有壁纸时先绘制底图，再叠加遮罩色
+                painter.drawImage(rect, base)
+                opacity = self._opacities.get(area, self.wallpaper_manager.get_wallpaper_opacity(area))
+                color.setAlphaF(opacity / 100.0)
+            else:
+                color.setAlphaF(self.DEFAULT_OPACITIES[area])
+            painter.fillRect(rect, color)
+        
+        # 时间文字，帮助判断遮罩后文字的可读性
+        font = QFont("Microsoft YaHei UI")
+        font.setPixelSize(max(8, round(160 * scale)))
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("white"))
+        painter.drawText(rects["top"], Qt.AlignCenter, datetime.now().strftime("%H:%M"))
+        
+        # 标出当前选中的区域
+        if self.selected_area in rects:
+            painter.setPen(QPen(QColor(255, 255, 255, 220), 1.5, Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(rects[self.selected_area].adjusted(1, 1, -1, -1))
+        painter.end()
+        
+        self.preview_updated.emit(QPixmap.fromImage(preview))
@@ -1,8 +1,15 @@
 import os
+import copy
 import json
+import uuid
+import sqlite3
 import logging
 from pathlib import Path
 
+from src.utils.json_store import JsonStore
+from src.utils.sqlite_store import SqliteStore
+from src.utils.resource_manager import get_app_data_dir
+
 # 配置日志（当单独运行此文件时使用）
 if __name__ == "__main__":
     logging.basicConfig(
@@ -13,59 +20,227 @@ if __name__ == "__main__":
 # 获取logger
 logger = logging.getLogger("ClassScreenReminder.ConfigManager")
 
+def new_reminder_id():
+    """生成新的提醒ID"""
+    return uuid.uuid4().hex
+
+# 各存储文件的默认内容
+DEFAULT_SETTINGS = {
+    "start_with_windows": False,     # 默认开机自启动
+    "minimize_to_tray": True,       # 默认关闭时最小化到托盘
+    "startup_minimized": True,      # 默认启动时最小化
+    "theme": "light",               # 新增主题设置: light或dark
+    "accent_color": "#0067C0",      # 强调色
+    "custom_audio_path": ""         # 自定义音频路径
+}
+DEFAULT_WALLPAPERS = {
+    "wallpaper_path": "",           # 保留旧版本兼容性
+    "wallpapers": {},               # 新增多区域壁纸设置
+}
+
+# 按领域拆分的存储文件，修改一个领域不会重写其他领域的数据
+STORE_DOMAINS = ("settings", "reminders", "cards", "wallpapers", "schedule")
+
+# 设置项所在的存储：{设置项: 领域}，以 wallpaper 开头的设置项在壁纸存储中，其余在通用设置中
+SETTING_DOMAINS = {
+    "cards": "cards",
+    "terms": "schedule",
+    "holidays": "schedule",
+}
+
+# 存储后端：json 为各领域的JSON文件；sqlite 时提醒和名片保存在SQLite数据库中
+STORAGE_BACKENDS = ("json", "sqlite")
+SQLITE_FILE = "data.db"
+
+# 集中管理配置的来源（共享目录或 http(s) 地址），环境变量优先于本机设置，便于统一部署
+MANAGED_SOURCE_ENV = "CSR_MANAGED_SOURCE"
+
+def setting_domain(key):
+    """获取设置项所在的存储领域"""
+    if key in SETTING_DOMAINS:
+        return SETTING_DOMAINS[key]
+    if key.startswith("wallpaper"):
+        return "wallpapers"
+    return "settings"
+
+def _copy_value(value):
+    """复制可变的设置值，避免调用方修改缓存内容"""
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+def _copy_reminder(reminder):
+    """复制提醒，提醒的值只有基本类型和基本类型的列表，比深拷贝快得多"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in reminder.items()}
+
 class ConfigManager:
     """配置管理器类"""
     
     def __init__(self):
         """初始化配置管理器"""
         # 获取用户配置目录
-        self.app_data_dir = os.path.join(
-            os.environ.get('APPDATA', os.path.expanduser('~/.config')),
-            'ClassScreenReminder'
-        )
+        self.app_data_dir = get_app_data_dir()
         
         # 创建配置目录
         os.makedirs(self.app_data_dir, exist_ok=True)
         
-        # 配置文件路径
+        # 旧版本的单一配置文件，启动时自动迁移到各领域的存储文件
         self.config_file = os.path.join(self.app_data_dir, 'config.json')
         
-        # 创建默认配置文件(如果不存在)
-        if not os.path.exists(self.config_file):
+        # 各领域的存储，首次访问时才加载
+        defaults = {
+            "settings": DEFAULT_SETTINGS,
+            "reminders": {"reminders": []},
+            "cards": {"cards": []},
+            "wallpapers": DEFAULT_WALLPAPERS,
+            "schedule": {"terms": [], "holidays": []},
+        }
+        self.stores = {
+            domain: JsonStore(os.path.join(self.app_data_dir, f"{domain}.json"), defaults[domain])
+            for domain in STORE_DOMAINS
+        }
+        self.stores["reminders"].on_load = self._migrate_reminders
+        self.database = None  # 可选的SQLite后端，启用后保存提醒和名片
+        
+        # 迁移旧配置或创建默认配置
+        if os.path.exists(self.config_file):
+            self._migrate_legacy_config()
+        elif not self.stores["settings"].exists():
             self.create_default_config()
+        
+        # 可选的SQLite后端；sqlite_active 记录数据当前是否在数据库中，手动改回json时也能把数据迁移回来
+        if self.get_setting("storage_backend", "json") == "sqlite":
+            self._open_database()
+        elif self.get_setting("sqlite_active", False):
+            self._close_database()
     
-    def create_default_config(self):
-        """创建默认配置文件"""
-        default_config = {
-            "reminders": [],
-            "settings": {
-                "start_with_windows": False,     # 默认开机自启动
-                "minimize_to_tray": True,       # 默认关闭时最小化到托盘
-                "startup_minimized": True,      # 默认启动时最小化
-                "wallpaper_path": "",           # 保留旧版本兼容性
-                "wallpapers": {},               # 新增多区域壁纸设置
-                "theme": "light",               # 新增主题设置: light或dark
-                "accent_color": "#0067C0",      # 强调色
-                "custom_audio_path": ""         # 自定义音频路径
-            }
-        }
+    def _database_path(self):
+        return os.path.join(self.app_data_dir, SQLITE_FILE)
+    
+    def _open_database(self):
+        """打开SQLite数据库，数据还在JSON存储中时先导入提醒和名片"""
+        database = SqliteStore(self._database_path())
+        try:
+            if not self.get_setting("sqlite_active", False):
+                database.save_reminders(self.stores["reminders"].get("reminders", []))
+                database.save_cards(self.stores["cards"].get("cards", []))
+                logger.info("已将提醒和名片导入SQLite数据库")
+        except sqlite3.Error as e:
+            logger.error(f"打开SQLite数据库出错，继续使用JSON存储: {e}")
+            database.close()
+            return False
+        self.database = database
+        self.set_setting("sqlite_active", True)
+        return True
+    
+    def _close_database(self):
+        """将SQLite数据库中的提醒和名片写回JSON存储并关闭数据库"""
+        database = self.database or SqliteStore(self._database_path())
+        try:
+            reminders = database.load_reminders()
+            cards = database.load_cards()
+        except sqlite3.Error as e:
+            logger.error(f"读取SQLite数据库出错，无法迁移回JSON存储: {e}")
+            return False
+        finally:
+            database.close()
         
-        self.save_config(default_config)
+        self.database = None
+        self.save_reminders(reminders)
+        self.set_setting("cards", cards)
+        self.set_setting("sqlite_active", False)
+        logger.info("已将提醒和名片从SQLite数据库迁移回JSON存储")
+        return True
     
-    def load_config(self):
-        """加载配置文件"""
+    def get_storage_backend(self):
+        """获取当前使用的存储后端"""
+        return "sqlite" if self.database is not None else "json"
+    
+    def set_storage_backend(self, backend):
+        """切换存储后端，提醒和名片随之迁移"""
+        if backend not in STORAGE_BACKENDS:
+            return False
+        if backend == self.get_storage_backend():
+            return True
+        
+        success = self._open_database() if backend == "sqlite" else self._close_database()
+        if success:
+            self.set_setting("storage_backend", backend)
+        return success
+    
+    def get_managed_source(self):
+        """获取集中管理配置的来源，未启用时返回空字符串"""
+        return os.environ.get(MANAGED_SOURCE_ENV) or self.get_setting("managed_source", "")
+    
+    def _migrate_legacy_config(self):
+        """将旧版本的 config.json 拆分到各领域的存储文件，完成后保留备份"""
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            # 配置文件损坏或不存在时创建默认配置
+                legacy = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            logger.error(f"旧配置文件无法读取，将使用默认配置: {e}")
+            legacy = None
+        
+        # 已存在新存储时不覆盖，只处理旧文件
+        if isinstance(legacy, dict) and not self.stores["settings"].exists():
+            self.save_config(legacy)
+            logger.info(f"已将旧配置迁移到 {len(STORE_DOMAINS)} 个存储文件")
+        elif not self.stores["settings"].exists():
             self.create_default_config()
-            return self.load_config()
+        
+        try:
+            os.replace(self.config_file, self.config_file + ".bak")
+        except OSError as e:
+            logger.error(f"备份旧配置文件时出错: {e}")
+    
+    def apply_legacy_config(self):
+        """运行中出现旧格式的 config.json（如管理脚本写入）时应用其内容并备份，返回是否已应用"""
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            # 可能还在写入，文件再次变化时重试
+            logger.error(f"读取 config.json 出错，暂不应用: {e}")
+            return False
+        
+        if isinstance(legacy, dict):
+            self.save_config(legacy)
+            logger.info("已应用外部写入的 config.json")
+        try:
+            os.replace(self.config_file, self.config_file + ".bak")
+        except OSError as e:
+            logger.error(f"备份旧配置文件时出错: {e}")
+        return isinstance(legacy, dict)
+    
+    def create_default_config(self):
+        """创建默认配置文件"""
+        for store in self.stores.values():
+            store.load()
+            store.save(force=True)
+    
+    def load_config(self):
+        """加载全部配置，返回旧版本单一配置文件的格式 {reminders, settings}"""
+        settings = {}
+        for domain in STORE_DOMAINS:
+            if domain != "reminders":
+                settings.update(self.stores[domain].data)
+        settings.pop("version", None)
+        if self.database is not None:
+            settings["cards"] = self.database.load_cards()
+        return {"reminders": self.load_reminders(), "settings": copy.deepcopy(settings)}
     
     def save_config(self, config):
-        """保存配置到文件"""
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=4)
+        """按旧版本单一配置文件的格式保存，内容拆分到各领域的存储"""
+        if "reminders" in config:
+            self.save_reminders(config["reminders"])
+        
+        changed = set()
+        for key, value in config.get("settings", {}).items():
+            domain = setting_domain(key)
+            if self.stores[domain].set(key, _copy_value(value)):
+                changed.add(domain)
+        for domain in changed:
+            self.stores[domain].save()
     
     def _sanitize_reminder_duration(self, reminder):
         """确保提醒持续时间合法"""
@@ -75,6 +250,10 @@ class ConfigManager:
             except (ValueError, TypeError):
                 reminder["duration"] = 10
         
+        # 确保每个提醒都有稳定的ID
+        if not reminder.get("id"):
+            reminder["id"] = new_reminder_id()
+        
         # 确保play_sound字段存在，默认为True
         reminder.setdefault("play_sound", True)
         
@@ -82,35 +261,80 @@ class ConfigManager:
         reminder["weekdays"] = (reminder.get("weekdays", [True] * 7)[:7] + [True] * 7)[:7]
         return reminder
     
-    def load_reminders(self):
-        """加载提醒列表"""
-        config = self.load_config()
-        reminders = config.get("reminders", [])
+    def sanitize_reminders(self, reminders):
+        """按保存时的规则批量规范化提醒"""
+        return [self._sanitize_reminder_duration(reminder) for reminder in reminders]
+    
+    def _migrate_reminders(self, store):
+        """提醒存储加载后规范化一次：为没有ID或ID重复的提醒分配新ID"""
+        reminders = store.data.get("reminders")
+        if not isinstance(reminders, list):
+            reminders = store.data["reminders"] = []
+        
+        seen = set()
+        migrated = False
+        for reminder in reminders:
+            reminder_id = reminder.get("id")
+            if not reminder_id or reminder_id in seen:
+                reminder["id"] = new_reminder_id()
+                migrated = True
+            seen.add(reminder["id"])
         
         # 确保所有提醒的持续时间是合法的整数
-        return [self._sanitize_reminder_duration(reminder) for reminder in reminders]
+        self.sanitize_reminders(reminders)
+        if migrated:
+            logger.info("已为旧配置中的提醒分配ID")
+            store.mark_dirty()
+            store.save()
+    
+    def load_reminders(self):
+        """加载提醒列表，返回副本"""
+        if self.database is not None:
+            return self.database.load_reminders()
+        return [_copy_reminder(reminder) for reminder in self.stores["reminders"].get("reminders", [])]
     
     def save_reminders(self, reminders):
         """保存提醒列表"""
         # 确保持续时间是整数
-        sanitized_reminders = [self._sanitize_reminder_duration(reminder) for reminder in reminders]
+        sanitized_reminders = self.sanitize_reminders(reminders)
+        if self.database is not None:
+            self.database.save_reminders(sanitized_reminders)
+            return
+        
+        store = self.stores["reminders"]
+        if store.set("reminders", [_copy_reminder(reminder) for reminder in sanitized_reminders]):
+            store.save()
+    
+    def update_reminder(self, reminder):
+        """按ID替换单个提醒，未找到时返回False"""
+        if self.database is not None:
+            return self.database.update_reminder(self._sanitize_reminder_duration(_copy_reminder(reminder)))
         
-        config = self.load_config()
-        config["reminders"] = sanitized_reminders
-        self.save_config(config)
+        store = self.stores["reminders"]
+        reminders = store.get("reminders", [])
+        for i, stored in enumerate(reminders):
+            if stored.get("id") == reminder.get("id"):
+                reminders[i] = self._sanitize_reminder_duration(_copy_reminder(reminder))
+                store.mark_dirty()
+                store.save()
+                return True
+        return False
     
     def get_setting(self, key, default=None):
         """获取设置值"""
-        config = self.load_config()
-        return config.get("settings", {}).get(key, default)
+        if key == "cards" and self.database is not None:
+            return self.database.load_cards()
+        return _copy_value(self.stores[setting_domain(key)].get(key, default))
     
     def set_setting(self, key, value):
-        """设置配置项"""
-        config = self.load_config()
-        if "settings" not in config:
-            config["settings"] = {}
-        config["settings"][key] = value
-        self.save_config(config)
+        """设置配置项，值未变化时不写入文件"""
+        if key == "cards" and self.database is not None:
+            self.database.save_cards(value)
+            return
+        
+        store = self.stores[setting_domain(key)]
+        if store.set(key, _copy_value(value)):
+            store.save()
     
     def get_wallpaper_path(self):
         """获取壁纸路径"""
@@ -1,26 +1,16 @@
 import os
 import sys
+import time
 import logging
 from datetime import datetime
 from PySide6.QtWidgets import QMainWindow, QApplication
-from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QCloseEvent
 
 # 修改导入方式以支持新的目录结构
 try:
     # 包内导入
-    from .components.reminder_screen import ReminderScreen
-    from .components.ui_builder import MainWindowUI
-    from .components.ui.audio_manager_ui import AudioManagerUI
-    from .components.ui.wallpaper_manager_ui import WallpaperManagerUI
-    from .components.ui.tray_manager import TrayManager
-    from .components.ui.reminder_manager_ui import ReminderManagerUI
-    from .components.ui.card_manager_ui import CardManagerUI
-    from .utils.reminder_manager import ReminderManager
     from .utils.autostart_manager import get_autostart_status, set_autostart
-    from .config_manager import ConfigManager
-    from .utils.wallpaper_manager import WallpaperManager
-    from .utils.card_manager import CardManager
 except ImportError:
     # 打包后或直接运行时的导入
     try:
@@ -33,103 +23,101 @@ except ImportError:
             sys.path.append(parent_dir)
         
         # 尝试从绝对路径导入
-        from src.components.reminder_screen import ReminderScreen
-        from src.components.ui_builder import MainWindowUI
-        from src.components.ui.audio_manager_ui import AudioManagerUI
-        from src.components.ui.wallpaper_manager_ui import WallpaperManagerUI
-        from src.components.ui.tray_manager import TrayManager
-        from src.components.ui.reminder_manager_ui import ReminderManagerUI
-        from src.components.ui.card_manager_ui import CardManagerUI
-        from src.utils.reminder_manager import ReminderManager
         from src.utils.autostart_manager import get_autostart_status, set_autostart
-        from src.config_manager import ConfigManager
-        from src.utils.wallpaper_manager import WallpaperManager
-        from src.utils.card_manager import CardManager
     except ImportError as e:
         print(f"导入错误: {e}")
         sys.exit(1)
 
 # 获取logger
 logger = logging.getLogger("ClassScreenReminder.MainWindow")
+timing_logger = logging.getLogger("ClassScreenReminder.Timing")
 
 class MainWindow(QMainWindow):
-    """主应用窗口类"""
+    """设置窗口类，由调度核心按需创建，关闭后销毁以释放界面占用的内存"""
     
-    def __init__(self, config_manager):
+    def __init__(self, core):
         super().__init__()  # 使用默认窗口风格，保留Windows动画
-        self.config_manager = config_manager
+        self.core = core
+        self.config_manager = core.config_manager
+        
+        # 各管理器由调度核心持有，窗口关闭后提醒照常触发
+        self.reminder_manager = core.reminder_manager
+        self.wallpaper_manager = core.wallpaper_manager
+        self.card_manager = core.card_manager
+        self.card_renderer = core.card_renderer
         
-        # 初始化各管理器
-        self.reminder_manager = ReminderManager(config_manager)
-        self.wallpaper_manager = WallpaperManager(config_manager)
-        self.card_manager = CardManager(config_manager)
+        # 关闭时销毁窗口和全部子控件
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        
+        # 界面在窗口首次显示时才创建
+        self.ui_builder = None
+        
+        # 加载设置
+        self.minimize_to_tray = True  # 强制设置为True
+        self.start_with_windows = self.config_manager.get_setting("start_with_windows", True)  # 默认True
+        self.startup_minimized = self.config_manager.get_startup_minimized()
+        self.update_autostart_status()
+    
+    def ensure_ui(self):
+        """首次显示窗口时导入并创建界面和各UI组件管理器"""
+        if self.ui_builder is not None:
+            return
         
-        # 当前显示的提醒屏幕
-        self.reminder_screen = None
+        start_time = time.perf_counter()
+        from src.components.ui_builder import MainWindowUI
+        from src.components.ui.audio_manager_ui import AudioManagerUI
+        from src.components.ui.wallpaper_manager_ui import WallpaperManagerUI
+        from src.components.ui.reminder_manager_ui import ReminderManagerUI
+        from src.components.ui.card_manager_ui import CardManagerUI
         
         # 初始化UI构建器
         self.ui_builder = MainWindowUI(self)
         
         # 初始化各UI组件管理器
-        self.tray_manager = TrayManager(self)
         self.audio_manager_ui = AudioManagerUI(self)
         self.wallpaper_manager_ui = WallpaperManagerUI(self)
         self.reminder_manager_ui = ReminderManagerUI(self)
         self.card_manager_ui = CardManagerUI(self)
         
-        # 设置检查提醒的定时器
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.check_reminders)
-        self.timer.start(10000)  # 每10秒检查一次提醒
-        
-        # 加载设置
-        self.minimize_to_tray = True  # 强制设置为True
-        self.start_with_windows = self.config_manager.get_setting("start_with_windows", True)  # 默认True
-        self.startup_minimized = self.config_manager.get_startup_minimized()
-        
         # 设置UI
         self.ui_builder.setup_ui()
-        
-        # 更新提醒列表
-        self.reminder_manager_ui.update_reminder_list()
-        
-        # 确保初始自启动状态正确
-        if self.start_with_windows:
-            set_autostart(True)
-        self.update_autostart_status()
-        
-        # 更新音频路径显示
-        self.audio_manager_ui.update_audio_path_display()
+        timing_logger.info(f"主窗口界面创建耗时: {(time.perf_counter() - start_time) * 1000:.1f}ms")
+    
+    def setVisible(self, visible):
+        """窗口显示前先创建界面"""
+        if visible:
+            self.ensure_ui()
+        super().setVisible(visible)
+    
+    def on_page_created(self, menu_id):
+        """页面首次创建后填充数据，提醒列表由模型直接提供数据"""
+        if menu_id == "wallpapers":
+            # 显示当前区域的预览
+            self.wallpaper_manager_ui.on_area_changed(self.area_combo.currentIndex())
+        elif menu_id == "audio":
+            # 更新音频路径显示
+            self.audio_manager_ui.update_audio_path_display()
+            self.audio_manager_ui.update_output_device_list()
     
     def closeEvent(self, event: QCloseEvent):
-        """最小化到托盘"""
-        if self.minimize_to_tray and self.tray_manager.is_visible():
-            self.hide()
-            event.ignore()
-        else:
-            event.accept()
+        """关闭时销毁窗口，托盘图标和提醒由调度核心保留；没有托盘时退出应用"""
+        self.save_pending_changes()
+        self.audio_manager_ui.release()
+        event.accept()
+        if not (self.minimize_to_tray and self.core.tray_manager.is_visible()):
+            self.core.quit()
     
-    def check_reminders(self):
-        """检查是否有到期的提醒"""
-        reminder = self.reminder_manager.check_reminders()
-        
-        if reminder:
-            # 关闭现有提醒（如果有）
-            if self.reminder_screen:
-                self.reminder_screen.close()
-                self.reminder_screen = None
-            
-            # 确保duration是整数
-            duration = int(reminder.get("duration", 10))
-            message = reminder["message"]
-            play_sound = reminder.get("play_sound", True)  # 获取声音设置
-            
-            # 获取所有区域的壁纸
-            wallpapers = self.wallpaper_manager.get_all_wallpapers()
-            
-            # 创建新的提醒屏幕，传入名片管理器
-            self.reminder_screen = ReminderScreen(message, duration, play_sound, wallpapers, self.card_manager)
-            self.reminder_screen.show()
+    def save_pending_changes(self):
+        """保存延迟保存的修改，延迟保存的定时器随窗口销毁，不会再触发"""
+        if hasattr(self, "area_combo"):
+            self.wallpaper_manager_ui.save_pending_opacity()
+    
+    def on_config_reloaded(self, cards_changed, wallpapers_changed):
+        """配置文件被外部修改并重新加载后刷新已创建的页面"""
+        if cards_changed and hasattr(self, "card_list"):
+            self.card_manager_ui.update_card_list()
+        if wallpapers_changed and hasattr(self, "area_combo"):
+            self.wallpaper_manager_ui.on_area_changed(self.area_combo.currentIndex())
     
     def update_autostart_status(self):
         """更新开机自启动状态"""
@@ -158,8 +146,9 @@ class MainWindow(QMainWindow):
     
     def on_menu_changed(self, menu_id):
         """处理菜单切换事件"""
-        if menu_id in self.ui_builder.content_pages:
-            self.content_stack.setCurrentIndex(self.ui_builder.content_pages[menu_id])
+        index = self.ui_builder.ensure_page(menu_id)
+        if index is not None:
+            self.content_stack.setCurrentIndex(index)
     
     def on_startup_minimized_changed(self, checked):
         """处理启动时最小化设置变更"""
@@ -169,10 +158,10 @@ class MainWindow(QMainWindow):
     
     # 托盘相关
     def close_application(self):
-        self.tray_manager.close_application()
-        
+        self.core.quit()
+    
     def show_from_tray(self):
-        self.tray_manager.show_from_tray()
+        self.core.show_main_window()
     
     # 音频相关
     def select_custom_audio(self):
@@ -187,6 +176,9 @@ class MainWindow(QMainWindow):
     def update_audio_path_display(self):
         self.audio_manager_ui.update_audio_path_display()
     
+    def on_audio_device_changed(self, index):
+        self.audio_manager_ui.on_audio_device_changed(index)
+    
     # 壁纸相关
     def select_wallpaper(self):
         self.wallpaper_manager_ui.select_wallpaper()
@@ -222,7 +214,7 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'wallpaper_manager_ui') and valid_value >= 0 and valid_value <= 100:
                 # 转发处理
                 self.wallpaper_manager_ui.on_opacity_changed(valid_value)
-                
+            
             # 强制更新标签显示当前值
             if hasattr(self, 'opacity_value_label'):
                 self.opacity_value_label.setText(f"{valid_value}%")
@@ -244,12 +236,27 @@ class MainWindow(QMainWindow):
     def edit_reminder(self):
         self.reminder_manager_ui.edit_reminder()
     
+    def cancel_edit(self):
+        self.reminder_manager_ui.cancel_edit()
+    
     def test_reminder(self):
         self.reminder_manager_ui.test_reminder()
     
     def reset_form(self):
         self.reminder_manager_ui.reset_form()
     
+    def on_weekday_filter_changed(self, index):
+        self.reminder_manager_ui.on_weekday_filter_changed(index)
+    
+    def on_sort_by_time_changed(self, checked):
+        self.reminder_manager_ui.on_sort_by_time_changed(checked)
+    
+    def import_timetable(self):
+        self.reminder_manager_ui.import_timetable()
+    
+    def export_timetable(self):
+        self.reminder_manager_ui.export_timetable()
+    
     # 名片相关
     def add_card(self):
         self.card_manager_ui.add_card()
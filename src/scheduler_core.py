@@ -0,0 +1,178 @@
+import time
+import logging
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.components.card_renderer import CardRenderCache
+from src.components.ui.tray_manager import TrayManager
+from src.utils.reminder_manager import ReminderManager
+from src.utils.wallpaper_manager import WallpaperManager
+from src.utils.card_manager import CardManager
+from src.utils.autostart_manager import set_autostart
+from src.utils.config_watcher import ConfigWatcher
+from src.utils.memory_diagnostics import MemoryDiagnostics
+from src.utils.theme import apply_theme
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.SchedulerCore")
+timing_logger = logging.getLogger("ClassScreenReminder.Timing")
+
+CHECK_INTERVAL = 10000  # 检查提醒的间隔（毫秒）
+
+class SchedulerCore(QObject):
+    """常驻的提醒调度核心：托盘图标、定时检查和提醒屏幕，设置窗口在需要时才创建，关闭后即销毁"""
+    
+    def __init__(self, config_manager):
+        super().__init__()
+        self.config_manager = config_manager
+        
+        # 触发提醒所需的管理器
+        self.reminder_manager = ReminderManager(config_manager)
+        self.wallpaper_manager = WallpaperManager(config_manager)
+        self.card_manager = CardManager(config_manager)
+        self.card_renderer = CardRenderCache(self.card_manager)
+        
+        # 当前显示的提醒屏幕和设置窗口
+        self.reminder_screen = None
+        self.main_window = None
+        
+        # 每次提醒屏幕销毁后记录存活对象数量和进程内存，用于追踪长时间运行时的内存增长
+        self.diagnostics = MemoryDiagnostics()
+        
+        # 初始化托盘
+        self.tray_manager = TrayManager(self)
+        
+        # 设置检查提醒的定时器
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check_reminders)
+        self.timer.start(CHECK_INTERVAL)
+        
+        # 管理脚本等外部程序修改配置文件后自动重新加载变化的部分，不需要重启
+        self.config_watcher = ConfigWatcher(config_manager)
+        self.config_watcher.domains_changed.connect(self.on_config_files_changed)
+        
+        # 本机控制接口，设置了端口时才启用，供打铃系统等脚本添加提醒或立即显示通知
+        self.control_server = None
+        control_port = self.config_manager.get_setting("control_api_port", 0)
+        if control_port:
+            from src.utils.control_server import ControlServer, ensure_token
+            self.control_server = ControlServer(self.reminder_manager, int(control_port), ensure_token(self.config_manager), self.diagnostics)
+            self.control_server.fire_requested.connect(self.show_reminder)
+            self.control_server.listen()
+        
+        # 配置了集中管理来源时定期同步课表和设置，本地存储即离线缓存
+        self.managed_sync = None
+        managed_source = self.config_manager.get_managed_source()
+        if managed_source:
+            from src.utils.managed_config import ManagedConfigSync, DEFAULT_POLL_INTERVAL
+            self.managed_sync = ManagedConfigSync(
+                self.config_manager, self.reminder_manager, managed_source,
+                self.config_manager.get_setting("managed_poll_interval", DEFAULT_POLL_INTERVAL)
+            )
+            self.managed_sync.bundle_applied.connect(self.on_managed_bundle_applied)
+        
+        # 确保初始自启动状态正确
+        if self.config_manager.get_setting("start_with_windows", True):
+            set_autostart(True)
+    
+    # ---------- 设置窗口 ----------
+    
+    def get_main_window(self):
+        """获取设置窗口，不存在时导入并创建"""
+        if self.main_window is None:
+            start_time = time.perf_counter()
+            from src.main_window import MainWindow
+            self.main_window = MainWindow(self)
+            self.main_window.destroyed.connect(self._on_main_window_destroyed)
+            timing_logger.info(f"设置窗口创建耗时: {(time.perf_counter() - start_time) * 1000:.1f}ms")
+        return self.main_window
+    
+    def _on_main_window_destroyed(self):
+        self.main_window = None
+    
+    def show_main_window(self):
+        """显示并激活设置窗口"""
+        window = self.get_main_window()
+        window.showNormal()
+        window.activateWindow()  # 在Windows上激活窗口并设置焦点
+    
+    def quit(self):
+        """彻底关闭应用"""
+        if self.main_window is not None:
+            self.main_window.save_pending_changes()
+        self.tray_manager.tray_icon.hide()
+        QApplication.quit()
+    
+    # ---------- 提醒 ----------
+    
+    def check_reminders(self):
+        """检查是否有到期的提醒"""
+        reminder = self.reminder_manager.check_reminders()
+        
+        if reminder:
+            # 确保duration是整数
+            duration = int(reminder.get("duration", 10))
+            message = reminder["message"]
+            play_sound = reminder.get("play_sound", True)  # 获取声音设置
+            self.show_reminder(message, duration, play_sound)
+    
+    def show_reminder(self, message, duration, play_sound):
+        """显示提醒屏幕，关闭正在显示的提醒"""
+        # 关闭现有提醒（如果有），关闭后立即销毁
+        if self.reminder_screen:
+            self.reminder_screen.close()
+            self.reminder_screen = None
+        
+        # 获取所有区域的壁纸
+        wallpapers = self.wallpaper_manager.get_all_wallpapers()
+        
+        # 提醒屏幕在首次触发时才导入
+        from src.components.reminder_screen import ReminderScreen
+        
+        # 创建新的提醒屏幕，传入名片管理器和名片渲染缓存
+        screen = ReminderScreen(message, duration, play_sound, wallpapers, self.card_manager, self.card_renderer)
+        screen.destroyed.connect(lambda _=None, screen=screen: self._on_reminder_screen_destroyed(screen))
+        self.reminder_screen = screen
+        screen.show()
+    
+    def _on_reminder_screen_destroyed(self, screen):
+        """提醒屏幕销毁后释放引用，待延迟删除的子对象也销毁后记录内存诊断"""
+        if self.reminder_screen is screen:
+            self.reminder_screen = None
+        QTimer.singleShot(0, self, self.diagnostics.record_firing)
+    
+    def handle_commands(self, commands):
+        """处理命令行参数或再次启动时转发的命令"""
+        for command in commands:
+            if command == "show":
+                self.show_main_window()
+            elif command == "test-reminder":
+                self.show_reminder("测试提醒内容", 10, True)
+            elif command == "reload-config":
+                self.config_watcher.check_changes()
+                if self.managed_sync:
+                    self.managed_sync.poll()
+            elif command == "quit":
+                self.quit()
+            else:
+                logger.warning(f"未知的命令: {command}")
+    
+    def on_managed_bundle_applied(self, version, parts):
+        """集中管理的设置可能修改了主题或强调色"""
+        if "settings" in parts:
+            apply_theme(QApplication.instance(), self.config_manager)
+    
+    def on_config_files_changed(self, domains):
+        """配置文件被外部修改后只重新加载变化的领域，设置窗口打开时同步刷新"""
+        if "settings" in domains:
+            # 主题或强调色变化时重新编译应用样式表，未变化时不重新设置
+            apply_theme(QApplication.instance(), self.config_manager)
+        if "reminders" in domains:
+            self.reminder_manager.reload_reminders()
+        if "schedule" in domains:
+            self.reminder_manager.invalidate_schedule()
+        cards_changed = "cards" in domains and self.card_manager.reload_cards()
+        wallpapers_changed = "wallpapers" in domains and bool(self.wallpaper_manager.reload_wallpapers())
+        
+        if self.main_window is not None:
+            self.main_window.on_config_reloaded(cards_changed, wallpapers_changed)
@@ -1,26 +1,51 @@
-# 确保子模块能被正确导入
-from . import sound_manager
-from . import reminder_manager
-from . import wallpaper_manager
-from . import autostart_manager
-from . import resource_manager
-from . import card_manager
+import importlib
 
-# 导出常用功能
-from .sound_manager import play_initial_sound, initialize_sound
-from .resource_manager import get_resource_path, resource_exists, create_default_resources, get_icon_path
-
-__all__ = [
+# 子模块和常用功能在首次访问时才导入，避免导入包时加载全部依赖
+_SUBMODULES = (
     'sound_manager',
     'reminder_manager',
+    'schedule',
+    'fire_ledger',
+    'timetable_io',
+    'json_store',
+    'sqlite_store',
+    'managed_config',
+    'config_watcher',
+    'instance_client',
+    'single_instance',
+    'control_server',
+    'memory_diagnostics',
     'wallpaper_manager',
     'autostart_manager',
     'resource_manager',
+    'theme',
     'card_manager',
-    'play_initial_sound',
-    'initialize_sound',
-    'get_resource_path',
-    'resource_exists',
-    'create_default_resources',
-    'get_icon_path'
-]
+    'thumbnail_cache',
+    'wallpaper_importer',
+    'wallpaper_compositor',
+    'startup_profiler',
+)
+
+# 导出常用功能：{名称: 所在子模块}
+_EXPORTS = {
+    'play_initial_sound': 'sound_manager',
+    'initialize_sound': 'sound_manager',
+    'get_resource_path': 'resource_manager',
+    'resource_exists': 'resource_manager',
+    'create_default_resources': 'resource_manager',
+    'get_icon_path': 'resource_manager',
+    'get_app_data_dir': 'resource_manager',
+}
+
+__all__ = list(_SUBMODULES) + list(_EXPORTS)
+
+def __getattr__(name):
+    """按需导入子模块或导出的函数"""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
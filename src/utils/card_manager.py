@@ -1,7 +1,19 @@
-class CardManager:
+import logging
+from PySide6.QtCore import QObject, Signal
+
+from .thumbnail_cache import prune_thumbnails
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.CardManager")
+
+class CardManager(QObject):
     """名片管理器，负责名片的保存和加载"""
     
+    # 名片数据变化（添加、删除、编辑）时发出
+    cards_changed = Signal()
+    
     def __init__(self, config_manager):
+        super().__init__()
         self.config_manager = config_manager
         self.cards = self._load_cards()
     
@@ -9,15 +21,41 @@ class CardManager:
         """从配置中加载名片数据"""
         return self.config_manager.get_setting("cards", [])
     
+    def reload_cards(self):
+        """配置文件被外部修改后重新加载名片，内容变化时发出信号，返回是否有变化"""
+        cards = self._load_cards()
+        if cards == self.cards:
+            return False
+        # 渲染缓存按卡片内容重新渲染，未变化的卡片沿用已有结果
+        self.cards = cards
+        self.cards_changed.emit()
+        return True
+    
     def save_cards(self):
         """保存名片数据到配置"""
         self.config_manager.set_setting("cards", self.cards)
+        
+        # 清理不再使用的头像缩略图
+        try:
+            prune_thumbnails(card.get("image_path", "") for card in self.cards)
+        except Exception as e:
+            logger.error(f"清理缩略图缓存时出错: {e}")
+        
+        self.cards_changed.emit()
     
     def add_card(self, card_data):
         """添加新名片"""
         self.cards.append(card_data)
         self.save_cards()
     
+    def update_card(self, index, card_data):
+        """原位更新名片，保持名片顺序不变"""
+        if 0 <= index < len(self.cards):
+            self.cards[index] = card_data
+            self.save_cards()
+            return True
+        return False
+    
     def delete_card(self, index):
         """删除名片"""
         if 0 <= index < len(self.cards):
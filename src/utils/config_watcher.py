@@ -0,0 +1,69 @@
+import os
+import logging
+from PySide6.QtCore import QObject, QTimer, QFileSystemWatcher, Signal
+
+from ..config_manager import STORE_DOMAINS
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.ConfigWatcher")
+
+DEBOUNCE_INTERVAL = 500  # 毫秒，外部程序连续写入时合并为一次重新加载
+
+class ConfigWatcher(QObject):
+    """监视配置目录，存储文件被外部修改时重新加载，发出变化的领域"""
+    
+    # 参数为内容被外部修改的存储领域列表
+    domains_changed = Signal(list)
+    
+    def __init__(self, config_manager):
+        super().__init__()
+        self.config_manager = config_manager
+        # 各存储已处理的加载次数，自身保存不会增加加载次数，因此不会触发重新加载
+        self._generations = {domain: store.generation for domain, store in config_manager.stores.items()}
+        
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(DEBOUNCE_INTERVAL)
+        self._debounce_timer.timeout.connect(self.check_changes)
+        
+        # 原子替换会使文件监视失效，同时监视目录以发现重新创建的文件
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_path_changed)
+        self.watcher.directoryChanged.connect(self._on_path_changed)
+        self.watcher.addPath(config_manager.app_data_dir)
+        self._watch_files()
+    
+    def _watched_files(self):
+        return [store.path for store in self.config_manager.stores.values()] + [self.config_manager.config_file]
+    
+    def _watch_files(self):
+        """监视存在但尚未监视的存储文件"""
+        watched = set(self.watcher.files())
+        missing = [path for path in self._watched_files() if path not in watched and os.path.exists(path)]
+        if missing:
+            self.watcher.addPaths(missing)
+    
+    def _on_path_changed(self, path):
+        """文件或目录变化后延迟检查，合并连续的变化"""
+        self._debounce_timer.start()
+    
+    def check_changes(self):
+        """检查各存储是否被外部修改，重新加载并发出变化的领域"""
+        self._watch_files()
+        
+        changed = []
+        # 外部写入的旧格式配置，内容拆分到各存储后所有领域都可能变化
+        if os.path.exists(self.config_manager.config_file) and self.config_manager.apply_legacy_config():
+            changed = list(STORE_DOMAINS)
+        
+        for domain, store in self.config_manager.stores.items():
+            # 访问内容时，文件签名变化的存储会重新加载
+            store.data
+            if store.generation != self._generations[domain]:
+                self._generations[domain] = store.generation
+                if domain not in changed:
+                    changed.append(domain)
+        
+        if changed:
+            logger.info(f"配置文件被外部修改，重新加载: {', '.join(changed)}")
+            self.domains_changed.emit(changed)
@@ -0,0 +1,268 @@
+import hmac
+import json
+import secrets
+import logging
+from urllib.parse import urlsplit, parse_qs, unquote
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QTcpServer, QHostAddress
+
+from .timetable_io import validate_reminder, TimetableError
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.ControlServer")
+
+# 本机控制接口：只监听 127.0.0.1 的 HTTP/JSON 服务，请求需带 "Authorization: Bearer <令牌>"
+#   GET    /reminders            提醒列表
+#   POST   /reminders            添加提醒，请求体为单个提醒或 {"reminders": [...]}
+#   DELETE /reminders/<id>       删除提醒
+#   GET    /upcoming?limit=N     接下来的N次触发
+#   GET    /history              最近的触发记录，包括休眠唤醒后补显示和超过宽限错过的提醒
+#   POST   /fire                 立即显示提醒屏幕 {"message", "duration", "play_sound"}
+#   POST   /batch                批量操作 {"operations": [{"op": "add"|"delete"|"fire", ...}]}，整批只保存一次
+#   GET    /diagnostics          存活的提醒屏幕、名片和QPixmap数量，进程内存和最近每次提醒后的记录
+MAX_REQUEST_SIZE = 1024 * 1024
+MAX_UPCOMING = 200
+DEFAULT_FIRE_DURATION = 10
+MAX_FIRE_DURATION = 600  # 秒
+
+STATUS_TEXT = {
+    200: "OK",
+    201: "Created",
+    202: "Accepted",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+class ControlError(Exception):
+    """请求无效，带HTTP状态码"""
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def ensure_token(config_manager):
+    """获取控制接口的访问令牌，没有时生成并保存"""
+    token = config_manager.get_setting("control_api_token", "")
+    if not token:
+        token = secrets.token_urlsafe(24)
+        config_manager.set_setting("control_api_token", token)
+    return token
+
+def _parse_reminder(data):
+    """校验请求中的提醒，保留指定的ID"""
+    if not isinstance(data, dict):
+        raise ControlError(400, "提醒必须是JSON对象")
+    try:
+        reminder = validate_reminder(data)
+    except TimetableError as e:
+        raise ControlError(400, str(e))
+    if data.get("id"):
+        reminder["id"] = str(data["id"])
+    return reminder
+
+def _parse_fire(data):
+    """校验立即显示的提醒，返回 (消息, 时长, 是否播放声音)"""
+    if not isinstance(data, dict) or not str(data.get("message") or "").strip():
+        raise ControlError(400, "提醒消息不能为空")
+    try:
+        duration = int(data.get("duration", DEFAULT_FIRE_DURATION))
+    except (TypeError, ValueError):
+        raise ControlError(400, f"无效的显示时长: {data.get('duration')}")
+    return str(data["message"]).strip(), max(1, min(MAX_FIRE_DURATION, duration)), bool(data.get("play_sound", True))
+
+class ControlServer(QObject):
+    """本机控制接口，在Qt事件循环中处理请求，供打铃系统等脚本添加提醒或立即显示通知"""
+    
+    # 请求立即显示提醒屏幕，参数为消息、时长（秒）和是否播放声音
+    fire_requested = Signal(str, int, bool)
+    
+    def __init__(self, reminder_manager, port, token, diagnostics=None):
+        super().__init__()
+        self.reminder_manager = reminder_manager
+        self.diagnostics = diagnostics
+        self.port = port
+        self.token = token
+        self._buffers = {}  # {连接: 已收到的数据}
+        
+        self.server = QTcpServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+    
+    def listen(self):
+        """只在本机回环地址上监听"""
+        if not self.server.listen(QHostAddress.LocalHost, self.port):
+            logger.error(f"控制接口监听端口 {self.port} 失败: {self.server.errorString()}")
+            return False
+        logger.info(f"控制接口已在 127.0.0.1:{self.server.serverPort()} 上监听")
+        return True
+    
+    def close(self):
+        """停止监听"""
+        self.server.close()
+    
+    # ---------- 连接和HTTP解析 ----------
+    
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self._buffers[socket] = bytearray()
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(lambda socket=socket: self._on_disconnected(socket))
+    
+    def _on_disconnected(self, socket):
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
+    
+    def _on_ready_read(self, socket):
+        """收到完整请求后处理，每个连接只处理一个请求"""
+        buffer = self._buffers.get(socket)
+        if buffer is None:
+            return
+        buffer.extend(bytes(socket.readAll()))
+        if len(buffer) > MAX_REQUEST_SIZE:
+            self._respond(socket, 413, {"error": "请求过大"})
+            return
+        
+        header_end = buffer.find(b"\r\n\r\n")
+        if header_end < 0:
+            return
+        try:
+            request_line, *header_lines = buffer[:header_end].decode("iso-8859-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            self._respond(socket, 400, {"error": "无效的HTTP请求"})
+            return
+        if len(buffer) < header_end + 4 + length:
+            return
+        
+        body = bytes(buffer[header_end + 4:header_end + 4 + length])
+        try:
+            status, result = self.handle_request(method, target, headers, body)
+        except ControlError as e:
+            status, result = e.status, {"error": str(e)}
+        except Exception as e:
+            logger.error(f"处理控制请求出错: {e}", exc_info=True)
+            status, result = 500, {"error": str(e)}
+        self._respond(socket, status, result)
+    
+    def _respond(self, socket, status, result):
+        """写出JSON响应并关闭连接"""
+        self._buffers.pop(socket, None)
+        body = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        header = (
+            f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        socket.write(header.encode("ascii") + body)
+        socket.disconnectFromHost()
+    
+    # ---------- 请求处理 ----------
+    
+    def _authorized(self, headers):
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(token.strip().encode("utf-8"), self.token.encode("utf-8"))
+    
+    def handle_request(self, method, target, headers, body):
+        """处理一个请求，返回 (状态码, 响应内容)"""
+        if not self._authorized(headers):
+            raise ControlError(401, "缺少或错误的访问令牌")
+        
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+        data = None
+        if body:
+            try:
+                data = json.loads(body.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise ControlError(400, f"请求体不是有效的JSON: {e}")
+        
+        if path == "/reminders":
+            if method == "GET":
+                return 200, {"reminders": self.reminder_manager.get_all_reminders()}
+            if method == "POST":
+                items = data.get("reminders") if isinstance(data, dict) and "reminders" in data else [data]
+                if not isinstance(items, list):
+                    raise ControlError(400, "reminders 必须是列表")
+                return self._apply([{"op": "add", "reminder": item} for item in items])
+        elif path.startswith("/reminders/"):
+            if method == "DELETE":
+                return self._apply([{"op": "delete", "id": unquote(path[len("/reminders/"):])}])
+        elif path == "/upcoming":
+            if method == "GET":
+                return 200, {"upcoming": self._upcoming(parse_qs(url.query))}
+        elif path == "/history":
+            if method == "GET":
+                return 200, {"history": self.reminder_manager.get_fire_history()}
+        elif path == "/fire":
+            if method == "POST":
+                if not isinstance(data, dict):
+                    raise ControlError(400, "请求体必须是JSON对象")
+                return self._apply([dict(data, op="fire")])
+        elif path == "/batch":
+            if method == "POST":
+                operations = data.get("operations") if isinstance(data, dict) else None
+                if not isinstance(operations, list):
+                    raise ControlError(400, "operations 必须是列表")
+                return self._apply(operations)
+        elif path == "/diagnostics" and self.diagnostics is not None:
+            if method == "GET":
+                return 200, self.diagnostics.report()
+        else:
+            raise ControlError(404, f"未知的路径: {url.path}")
+        raise ControlError(405, f"{url.path} 不支持 {method}")
+    
+    def _upcoming(self, query):
+        try:
+            limit = int(query.get("limit", ["10"])[0])
+        except ValueError:
+            raise ControlError(400, "limit 必须是整数")
+        return [
+            {"time": when.isoformat(timespec="minutes"), "reminder": reminder}
+            for when, reminder in self.reminder_manager.get_upcoming_reminders(max(1, min(MAX_UPCOMING, limit)))
+        ]
+    
+    def _apply(self, operations):
+        """先校验全部操作，任何一项无效时整批不执行；增删整批只保存一次，再依次显示提醒"""
+        added, deleted_ids, fires = [], [], []
+        for i, operation in enumerate(operations):
+            op = operation.get("op") if isinstance(operation, dict) else None
+            try:
+                if op == "add":
+                    added.append(_parse_reminder(operation.get("reminder")))
+                elif op == "delete":
+                    if not operation.get("id"):
+                        raise ControlError(400, "缺少要删除的提醒ID")
+                    deleted_ids.append(str(operation["id"]))
+                elif op == "fire":
+                    fires.append(_parse_fire(operation))
+                else:
+                    raise ControlError(400, f"未知的操作: {op}")
+            except ControlError as e:
+                raise ControlError(e.status, f"第{i + 1}个操作: {e}")
+        
+        missing = [reminder_id for reminder_id in deleted_ids if self.reminder_manager.get_reminder_by_id(reminder_id) is None]
+        if missing:
+            raise ControlError(404, f"未找到提醒: {', '.join(missing)}")
+        
+        ids = []
+        if added or deleted_ids:
+            success, message, ids = self.reminder_manager.apply_batch(added, deleted_ids)
+            if not success:
+                raise ControlError(400, message)
+        
+        # 同时请求多个通知时只保留最后一个屏幕，与定时提醒的行为一致
+        for fire in fires:
+            self.fire_requested.emit(*fire)
+        
+        status = 201 if added else 202 if fires and not deleted_ids else 200
+        return status, {"added": ids, "deleted": len(deleted_ids), "fired": len(fires)}
@@ -0,0 +1,99 @@
+import logging
+from collections import deque
+from datetime import timedelta
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.FireLedger")
+
+DEFAULT_GRACE_MINUTES = 5       # 错过触发时间后仍补显示的分钟数，提醒可用 grace_minutes 单独设置
+MAX_CATCH_UP = timedelta(days=1) # 间隔很长（例如休眠过夜）时只补查最近一天
+HISTORY_SIZE = 200              # 保留最近的触发和错过记录数
+MISSED_LOG_LIMIT = 5            # 日志中最多列出的错过提醒数
+
+def grace_minutes(reminder, default=DEFAULT_GRACE_MINUTES):
+    """提醒的补显示宽限（分钟），未设置或无效时使用默认值"""
+    try:
+        return max(0, int(reminder.get("grace_minutes", default)))
+    except (TypeError, ValueError):
+        return default
+
+class FireLedger:
+    """提醒触发记录：保存上次检查的时刻，休眠唤醒或事件循环阻塞后补查期间的触发
+    
+    只使用传入的时刻，不读取系统时间，在模拟时钟下结果确定
+    """
+    
+    def __init__(self):
+        self.last_evaluated = None  # 上次检查的时刻（精确到分钟）
+        self.fired = set()          # 已处理的 (触发时刻, 提醒ID)，时钟回拨时避免重复触发
+        self.history = deque(maxlen=HISTORY_SIZE)
+    
+    def evaluate(self, schedule, reminders, now, default_grace=DEFAULT_GRACE_MINUTES):
+        """检查上次检查之后到当前分钟的触发，返回应显示的提醒索引，没有时返回None
+        
+        超过宽限的触发记为错过；同时有多个可补显示的触发时只显示最近的一个，较早的记为被替代
+        """
+        current = now.replace(second=0, microsecond=0)
+        last = self.last_evaluated
+        
+        if last is None or current <= last:
+            # 首次检查、同一分钟内再次检查或时钟回拨：只检查当前分钟，刚添加或修改到当前分钟的提醒也能触发，
+            # 已处理的触发由 fired 去重
+            start = current - timedelta(minutes=1)
+        else:
+            start = max(last, current - MAX_CATCH_UP)
+            if current - last > timedelta(minutes=1):
+                logger.info(f"距上次检查已过 {int((current - last).total_seconds() // 60)} 分钟（休眠或卡顿），补查期间的提醒")
+        self.last_evaluated = current
+        
+        due = []
+        missed = []
+        for when, index in schedule.between(start, current):
+            reminder = reminders[index]
+            key = (when, reminder.get("id"))
+            if key in self.fired:
+                continue
+            self.fired.add(key)
+            
+            late = int((current - when).total_seconds() // 60)
+            if late <= grace_minutes(reminder, default_grace):
+                due.append((when, index))
+            else:
+                self._record(when, reminder, "missed", late)
+                missed.append(f"{when:%Y-%m-%d %H:%M}「{reminder.get('message', '')}」")
+        if missed:
+            # 长时间休眠可能错过很多提醒，只写一条日志
+            shown = "、".join(missed[:MISSED_LOG_LIMIT]) + ("等" if len(missed) > MISSED_LOG_LIMIT else "")
+            logger.warning(f"错过 {len(missed)} 个已超过宽限的提醒: {shown}")
+        self._prune(current)
+        
+        if not due:
+            return None
+        
+        # 只显示最近一个触发时刻的第一个提醒，与同一分钟内多个提醒时的行为一致
+        latest = due[-1][0]
+        chosen = next(index for when, index in due if when == latest)
+        for when, index in due:
+            late = int((current - when).total_seconds() // 60)
+            if index == chosen and when == latest:
+                self._record(when, reminders[index], "late" if late else "fired", late)
+                if late:
+                    logger.info(f"补显示提醒 {when:%H:%M}「{reminders[index].get('message', '')}」，延迟 {late} 分钟")
+            else:
+                self._record(when, reminders[index], "superseded", late)
+        return chosen
+    
+    def _record(self, when, reminder, status, late):
+        self.history.append({
+            "time": when.isoformat(timespec="minutes"),
+            "id": reminder.get("id"),
+            "message": reminder.get("message", ""),
+            "status": status,
+            "late_minutes": late,
+        })
+    
+    def _prune(self, current):
+        """丢弃补查范围之外的已处理记录"""
+        oldest = current - MAX_CATCH_UP - timedelta(days=1)
+        if any(when < oldest for when, _ in self.fired):
+            self.fired = {key for key in self.fired if key[0] >= oldest}
@@ -0,0 +1,91 @@
+import os
+import sys
+import json
+import socket
+import getpass
+import hashlib
+import time
+import tempfile
+
+from .resource_manager import get_app_data_dir
+
+# 只使用标准库：再次启动时在导入Qt之前转发命令，耗时只有一次套接字往返
+
+# 命令行参数与转发给运行中实例的命令
+COMMANDS = {
+    "--show": "show",                    # 显示主窗口
+    "--test-reminder": "test-reminder",  # 显示测试提醒
+    "--reload-config": "reload-config",  # 重新加载配置文件和集中管理的配置
+    "--quit": "quit",                    # 退出运行中的实例
+}
+DEFAULT_COMMANDS = ["show"]  # 没有参数时再次启动即显示主窗口
+
+REPLY_TIMEOUT = 2.0  # 秒
+RETRY_INTERVAL = 0.1  # 秒
+
+def parse_commands(args):
+    """从命令行参数中提取命令，忽略其他参数；没有命令时返回空列表"""
+    return [COMMANDS[arg] for arg in args if arg in COMMANDS]
+
+def server_name():
+    """单实例服务名，按用户和数据目录区分；Windows上为管道名，其他平台为套接字文件的完整路径"""
+    app_data_dir = get_app_data_dir()
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ""
+    digest = hashlib.sha1(f"{user}:{os.path.abspath(app_data_dir)}".encode("utf-8")).hexdigest()[:12]
+    name = f"ClassScreenReminder-{digest}"
+    if sys.platform == "win32":
+        return name
+    # 使用完整路径，QLocalServer 和这里的客户端不依赖各自对临时目录的判断
+    return os.path.join(tempfile.gettempdir(), name)
+
+def lock_path():
+    """单实例锁文件路径，持有锁的进程才能监听"""
+    return os.path.join(tempfile.gettempdir(), os.path.basename(server_name()) + ".lock")
+
+def encode_commands(commands):
+    """转发的消息为一行JSON"""
+    return (json.dumps({"commands": commands or DEFAULT_COMMANDS}) + "\n").encode("utf-8")
+
+def forward_commands(commands, wait=0.0):
+    """将命令转发给运行中的实例，已转发返回True，没有运行中的实例返回False
+    
+    wait 为等待运行中实例开始监听的秒数，用于同时启动时转发给先启动的实例
+    """
+    deadline = time.monotonic() + wait
+    while not _send(encode_commands(commands)):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(RETRY_INTERVAL)
+    return True
+
+def _send(message):
+    """发送一次消息，无法连接时返回False"""
+    if sys.platform == "win32":
+        # QLocalServer 在Windows上使用命名管道；运行中的实例可能无响应，写入后不等待确认
+        try:
+            with open(r"\\.\pipe" + "\\" + server_name(), "r+b", buffering=0) as pipe:
+                pipe.write(message)
+        except OSError:
+            return False
+        return True
+    
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(REPLY_TIMEOUT)
+    try:
+        client.connect(server_name())
+    except OSError:
+        client.close()
+        return False
+    
+    # 运行中的实例没有确认时也不再启动新实例，避免重复提醒
+    try:
+        client.sendall(message)
+        client.recv(64)
+    except OSError:
+        pass
+    finally:
+        client.close()
+    return True
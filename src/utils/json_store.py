@@ -0,0 +1,107 @@
+import os
+import json
+import logging
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.JsonStore")
+
+STORE_VERSION = 1  # 存储文件格式版本
+
+class JsonStore:
+    """单个JSON存储文件，首次访问时才加载，只在内容变化时原子写入"""
+    
+    def __init__(self, path, defaults=None):
+        self.path = path
+        self.defaults = defaults or {}
+        self._data = None
+        self._dirty = False
+        self._signature = None  # 加载时文件的 (修改时间, 大小)，用于发现外部修改
+        self.generation = 0     # 从文件加载的次数，自身保存不计入，用于判断内容是否被外部修改
+        self.on_load = None     # 从文件加载后调用，参数为存储本身，用于迁移和规范化
+    
+    def _file_signature(self):
+        """获取文件的修改时间和大小，文件不存在时返回None"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def exists(self):
+        """存储文件是否存在"""
+        return os.path.exists(self.path)
+    
+    def load(self):
+        """从文件加载，文件不存在或损坏时使用默认值；已加载过时损坏的文件不覆盖现有内容"""
+        data = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # 外部程序写入到一半时也会读到不完整的内容，保留现有内容，文件再次变化时重新加载
+            if self._data is not None:
+                logger.error(f"存储文件损坏，保留已加载的内容: {self.path} ({e})")
+                self._signature = self._file_signature()
+                return self._data
+            logger.error(f"存储文件损坏，使用默认值: {self.path} ({e})")
+        
+        if not isinstance(data, dict):
+            data = {}
+        for key, value in self.defaults.items():
+            data.setdefault(key, json.loads(json.dumps(value)))
+        data.setdefault("version", STORE_VERSION)
+        
+        self._data = data
+        self._dirty = False
+        self._signature = self._file_signature()
+        self.generation += 1
+        if self.on_load:
+            self.on_load(self)
+        return data
+    
+    @property
+    def data(self):
+        """获取存储内容，文件被外部修改后重新加载"""
+        if self._data is None or (not self._dirty and self._file_signature() != self._signature):
+            self.load()
+        return self._data
+    
+    @property
+    def dirty(self):
+        return self._dirty
+    
+    def get(self, key, default=None):
+        """获取一项内容"""
+        return self.data.get(key, default)
+    
+    def set(self, key, value):
+        """设置一项内容，值未变化时不标记为已修改，返回是否修改"""
+        data = self.data
+        if key in data and data[key] == value:
+            return False
+        data[key] = value
+        self._dirty = True
+        return True
+    
+    def mark_dirty(self):
+        """直接修改内容后标记为需要保存"""
+        self._dirty = True
+    
+    def save(self, force=False):
+        """有修改时原子写入文件：先写临时文件再替换，避免写入中断导致文件损坏"""
+        if self._data is None or not (self._dirty or force):
+            return False
+        
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        
+        self._dirty = False
+        self._signature = self._file_signature()
+        return True
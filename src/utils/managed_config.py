@@ -0,0 +1,289 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .timetable_io import validate_reminder, TimetableError
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.ManagedConfig")
+
+# 集中管理的配置包:
+#   来源为共享目录（或其中的 manifest.json）或 http(s) 地址，清单格式:
+#   {"version": 12, "parts": {"reminders": {"path": "reminders.json", "sha256": "..."}, ...}}
+#   各部分: reminders 为提醒列表；schedule 为 {"terms": [...], "holidays": [...]}；settings 为设置项字典
+MANIFEST_NAME = "manifest.json"
+PART_NAMES = ("reminders", "schedule", "settings")
+DEFAULT_POLL_INTERVAL = 300     # 秒
+FIRST_POLL_DELAY = 5000         # 启动后首次检查的延迟（毫秒），不影响启动速度
+HTTP_TIMEOUT = 15               # 秒
+
+# 集中配置不能覆盖的本机设置；控制接口的端口和令牌只属于本机，不能由共享配置统一开启或设置
+PROTECTED_SETTINGS = ("managed_source", "managed_poll_interval", "storage_backend", "sqlite_active",
+                      "control_api_port", "control_api_token")
+
+class ManagedConfigError(Exception):
+    """集中配置包无效或无法获取"""
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _write_atomic(path, data):
+    """先写临时文件再替换"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def _is_http(source):
+    return source.lower().startswith(("http://", "https://"))
+
+class ManagedConfigSync(QObject):
+    """从共享目录或HTTP地址同步集中管理的配置包，只下载变化的部分并在本地缓存"""
+    
+    # 配置包已应用，参数为版本号和更新的部分
+    bundle_applied = Signal(int, list)
+    sync_failed = Signal(str)
+    _fetched = Signal(object)  # 后台线程获取完成，结果在主线程中应用
+    
+    def __init__(self, config_manager, reminder_manager, source, poll_interval=DEFAULT_POLL_INTERVAL):
+        super().__init__()
+        self.config_manager = config_manager
+        self.reminder_manager = reminder_manager
+        self.source = source
+        self.cache_dir = os.path.join(config_manager.app_data_dir, "managed")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.state = self._load_state()
+        self._worker = None
+        
+        self._fetched.connect(self._on_fetched)
+        
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self.poll)
+        self.poll_timer.start(max(30, int(poll_interval)) * 1000)
+        QTimer.singleShot(FIRST_POLL_DELAY, self.poll)
+    
+    # ---------- 本地缓存 ----------
+    
+    def _state_path(self):
+        return os.path.join(self.cache_dir, "state.json")
+    
+    def _part_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}.json")
+    
+    def _load_state(self):
+        """加载同步状态：已应用的清单和版本、清单的缓存校验信息"""
+        try:
+            with open(self._state_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+    
+    def _save_state(self):
+        _write_atomic(self._state_path(), json.dumps(self.state, ensure_ascii=False, indent=2).encode("utf-8"))
+    
+    def _read_cached_part(self, name, expected):
+        """读取本地缓存的部分，缓存缺失或哈希不符时返回None"""
+        try:
+            with open(self._part_path(name), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        return data if _sha256(data) == expected else None
+    
+    # ---------- 获取（后台线程） ----------
+    
+    def _resolve(self, path):
+        """清单中的部分路径相对于清单所在位置"""
+        if _is_http(self.source):
+            return urllib.parse.urljoin(self._manifest_location(), path)
+        base_dir = os.path.dirname(os.path.abspath(self._manifest_location()))
+        full_path = os.path.normpath(os.path.join(base_dir, path))
+        if os.path.commonpath([base_dir, full_path]) != base_dir:
+            raise ManagedConfigError(f"配置包路径超出来源目录: {path}")
+        return full_path
+    
+    def _manifest_location(self):
+        if _is_http(self.source):
+            return self.source
+        if os.path.isdir(self.source):
+            return os.path.join(self.source, MANIFEST_NAME)
+        return self.source
+    
+    def _read(self, location, validators=None):
+        """读取来源文件，返回 (内容, 缓存校验头)；HTTP返回304时内容为None"""
+        if not _is_http(self.source):
+            with open(location, "rb") as f:
+                return f.read(), None
+        
+        # 服务器支持时使用ETag，否则使用Last-Modified
+        validators = validators or {}
+        request = urllib.request.Request(location)
+        if validators.get("etag"):
+            request.add_header("If-None-Match", validators["etag"])
+        if validators.get("last_modified"):
+            request.add_header("If-Modified-Since", validators["last_modified"])
+        try:
+            with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+                return response.read(), {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, validators
+            raise
+    
+    def _fetch(self, state):
+        """检查清单并下载变化的部分，校验哈希后写入本地缓存"""
+        location = self._manifest_location()
+        
+        # 共享目录用修改时间和大小判断清单是否变化，HTTP使用条件请求
+        signature = None
+        if not _is_http(self.source):
+            stat = os.stat(location)
+            signature = [stat.st_mtime_ns, stat.st_size]
+            if signature == state.get("signature") and state.get("manifest"):
+                return {"status": "unchanged"}
+        
+        content, validators = self._read(location, state.get("validators"))
+        if content is None:
+            return {"status": "unchanged"}
+        
+        try:
+            manifest = json.loads(content.decode("utf-8"))
+            version = int(manifest["version"])
+            parts = manifest.get("parts", {})
+        except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise ManagedConfigError(f"清单格式无效: {e}")
+        # 镜像未同步完成等情况下可能读到旧清单，不回退到旧版本
+        if version < state.get("applied_version", 0):
+            raise ManagedConfigError(f"配置包版本 {version} 低于已应用的版本 {state['applied_version']}")
+        
+        # 只处理与已应用清单哈希不同的部分，本地缓存中已有的不再下载
+        applied_parts = (state.get("manifest") or {}).get("parts", {})
+        changed = {}
+        downloaded = {}
+        for name, part in parts.items():
+            if name not in PART_NAMES:
+                logger.warning(f"忽略未知的配置部分: {name}")
+                continue
+            expected = str(part.get("sha256", "")).lower()
+            if not expected:
+                raise ManagedConfigError(f"配置部分缺少哈希: {name}")
+            if str(applied_parts.get(name, {}).get("sha256", "")).lower() == expected:
+                continue
+            
+            data = self._read_cached_part(name, expected)
+            if data is None:
+                data, _ = self._read(self._resolve(part.get("path", f"{name}.json")))
+                if _sha256(data) != expected:
+                    raise ManagedConfigError(f"配置部分哈希校验失败: {name}")
+                downloaded[name] = data
+            try:
+                changed[name] = json.loads(data.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise ManagedConfigError(f"配置部分格式无效: {name} ({e})")
+        
+        # 全部校验通过后才写入缓存，应用后才记录清单，中途失败时下次检查会重新应用
+        for name, data in downloaded.items():
+            _write_atomic(self._part_path(name), data)
+        
+        return {
+            "status": "updated",
+            "version": version,
+            "manifest": manifest,
+            "validators": validators,
+            "signature": signature,
+            "parts": changed,
+            "downloaded": sorted(downloaded),
+        }
+    
+    def _run_fetch(self, state):
+        try:
+            result = self._fetch(state)
+        except (OSError, urllib.error.URLError, ManagedConfigError) as e:
+            result = {"status": "error", "message": str(e)}
+        self._fetched.emit(result)
+    
+    def poll(self):
+        """在后台线程中检查配置包是否更新"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._run_fetch, args=(dict(self.state),), daemon=True)
+        self._worker.start()
+    
+    # ---------- 应用（主线程） ----------
+    
+    def _on_fetched(self, result):
+        status = result["status"]
+        if status == "error":
+            logger.error(f"同步集中配置失败，继续使用本地缓存: {result['message']}")
+            self.sync_failed.emit(result["message"])
+            return
+        if status == "unchanged":
+            return
+        
+        parts = result["parts"]
+        applied = self.apply_parts(parts)
+        
+        self.state.update({
+            "manifest": result["manifest"],
+            "validators": result["validators"],
+            "signature": result["signature"],
+            "applied_version": result["version"],
+        })
+        self._save_state()
+        logger.info(
+            f"已应用集中配置版本 {result['version']}，更新部分: {', '.join(applied) or '无'}，"
+            f"下载 {len(result['downloaded'])} 个部分"
+        )
+        self.bundle_applied.emit(result["version"], applied)
+    
+    def apply_parts(self, parts):
+        """应用变化的部分，提醒列表整体替换，返回已应用的部分名称"""
+        applied = []
+        
+        if "reminders" in parts:
+            reminders = []
+            for i, data in enumerate(parts["reminders"] if isinstance(parts["reminders"], list) else []):
+                try:
+                    reminder = validate_reminder(data)
+                except (TimetableError, AttributeError) as e:
+                    logger.warning(f"集中配置中的第{i + 1}个提醒无效: {e}")
+                    continue
+                # 保留配置包中的ID，多次同步时同一提醒的ID不变
+                if data.get("id"):
+                    reminder["id"] = str(data["id"])
+                reminders.append(reminder)
+            self.reminder_manager.import_reminders(reminders, replace=True)
+            applied.append("reminders")
+        
+        if "schedule" in parts and isinstance(parts["schedule"], dict):
+            schedule = parts["schedule"]
+            if "terms" in schedule:
+                self.reminder_manager.set_terms(schedule["terms"])
+            if "holidays" in schedule:
+                self.reminder_manager.set_holidays(schedule["holidays"])
+            applied.append("schedule")
+        
+        if "settings" in parts and isinstance(parts["settings"], dict):
+            for key, value in parts["settings"].items():
+                if key in PROTECTED_SETTINGS:
+                    logger.warning(f"集中配置不能修改本机设置: {key}")
+                    continue
+                self.config_manager.set_setting(key, value)
+            applied.append("settings")
+        
+        return applied
+    
+    def stop(self):
+        """停止轮询"""
+        self.poll_timer.stop()
@@ -0,0 +1,70 @@
+import gc
+import os
+import sys
+import time
+import logging
+from collections import deque, Counter
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.Diagnostics")
+
+DEFAULT_HISTORY = 200  # 保留最近的记录数，托盘常驻数周时按课时观察内存趋势
+TRACKED_WIDGETS = ("ReminderScreen", "Card", "CardSprite")
+
+def process_rss():
+    """当前进程的常驻内存（字节），无法获取时返回None"""
+    if sys.platform == "win32":
+        try:
+            import win32api
+            import win32process
+            return win32process.GetProcessMemoryInfo(win32api.GetCurrentProcess())["WorkingSetSize"]
+        except Exception:
+            return None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def count_live_objects():
+    """统计存活的提醒屏幕、名片控件和Python持有的QPixmap数量"""
+    widgets = Counter(type(widget).__name__ for widget in QApplication.allWidgets())
+    counts = {name: widgets.get(name, 0) for name in TRACKED_WIDGETS}
+    counts["QPixmap"] = sum(1 for obj in gc.get_objects() if isinstance(obj, QPixmap))
+    return counts
+
+class MemoryDiagnostics:
+    """提醒屏幕的内存诊断：每次提醒结束销毁后记录存活的对象数量和进程内存"""
+    
+    def __init__(self, history_size=DEFAULT_HISTORY):
+        self.firings = 0
+        self.history = deque(maxlen=history_size)
+    
+    def snapshot(self):
+        """回收循环引用后统计当前状态"""
+        gc.collect()
+        rss = process_rss()
+        return dict(
+            count_live_objects(),
+            time=time.strftime("%Y-%m-%d %H:%M:%S"),
+            firings=self.firings,
+            rss_mb=round(rss / (1024 * 1024), 1) if rss is not None else None,
+        )
+    
+    def record_firing(self):
+        """一次提醒结束后记录并写入日志"""
+        self.firings += 1
+        snapshot = self.snapshot()
+        self.history.append(snapshot)
+        logger.info(
+            f"第{self.firings}次提醒结束: "
+            + " ".join(f"{name}={snapshot[name]}" for name in TRACKED_WIDGETS + ("QPixmap",))
+            + f" RSS={snapshot['rss_mb']}MB"
+        )
+        return snapshot
+    
+    def report(self):
+        """当前状态和最近的记录"""
+        return {"current": self.snapshot(), "history": list(self.history)}
@@ -1,10 +1,23 @@
+import json
 import logging
 from datetime import datetime
 from PySide6.QtCore import QTime, QObject, Signal
 
+from .schedule import Schedule, WEEK_PARITIES, SCHEDULE_FIELDS, parse_minute
+from .fire_ledger import FireLedger, DEFAULT_GRACE_MINUTES
+from ..config_manager import new_reminder_id
+
 # 获取logger
 logger = logging.getLogger("ClassScreenReminder.ReminderManager")
 
+# update_reminder 可修改的字段
+EDITABLE_FIELDS = ("time", "message", "duration", "play_sound", "weekdays") + SCHEDULE_FIELDS
+
+def _content_key(reminder):
+    """不含ID的提醒内容，用于判断重复"""
+    return json.dumps({key: value for key, value in reminder.items() if key != "id"},
+                      sort_keys=True, ensure_ascii=False)
+
 class ReminderManager(QObject):
     """提醒管理器，处理提醒的添加、编辑、删除和检查"""
     
@@ -12,34 +25,74 @@ class ReminderManager(QObject):
     reminder_added = Signal()
     reminder_deleted = Signal(int)  # 参数为被删除的提醒索引
     reminder_edited = Signal(int)   # 参数为被编辑的提醒索引
+    reminders_imported = Signal(int)  # 参数为导入的提醒数量
+    reminders_reloaded = Signal()     # 提醒列表整体替换（外部修改调整了顺序等）
     
     def __init__(self, config_manager):
         super().__init__()
         self.config_manager = config_manager
         self.reminders = self.config_manager.load_reminders()
-        self.last_reminder_time = ""
+        self.clock = datetime.now  # 当前时间的来源，基准测试和调试时可替换为模拟时钟
+        self.ledger = FireLedger()  # 上次检查的时刻和触发记录，休眠唤醒后补查错过的提醒
+        self._schedule = None  # 编译后的课表索引，提醒或学期设置变化后重新编译
         self.wallpaper_path = self.config_manager.get_wallpaper_path()
     
     def get_all_reminders(self):
         """获取所有提醒"""
         return self.reminders
     
-    def add_reminder(self, time_str, message, duration, play_sound, weekdays):
-        """添加新提醒"""
+    def get_schedule(self):
+        """获取编译后的课表索引"""
+        if self._schedule is None:
+            self._schedule = Schedule(
+                self.reminders,
+                self.config_manager.get_setting("terms", []),
+                self.config_manager.get_setting("holidays", [])
+            )
+        return self._schedule
+    
+    def invalidate_schedule(self):
+        """提醒、学期或假期变化后使课表索引失效"""
+        self._schedule = None
+    
+    def get_terms(self):
+        """获取学期列表 [{name, start_date, end_date}]"""
+        return self.config_manager.get_setting("terms", [])
+    
+    def set_terms(self, terms):
+        """设置学期列表"""
+        self.config_manager.set_setting("terms", terms)
+        self.invalidate_schedule()
+    
+    def get_holidays(self):
+        """获取全局不触发的日期列表"""
+        return self.config_manager.get_setting("holidays", [])
+    
+    def set_holidays(self, holidays):
+        """设置全局不触发的日期列表"""
+        self.config_manager.set_setting("holidays", sorted(set(holidays)))
+        self.invalidate_schedule()
+    
+    def add_reminder(self, time_str, message, duration, play_sound, weekdays, rules=None):
+        """添加新提醒，rules 为可选的课表规则字段（日期范围、学期、例外日期、单双周、一次性日期）"""
         # 确保必填项不为空
         if not message:
             return False, "提醒消息不能为空"
         
         # 添加到提醒列表
         reminder = {
+            "id": new_reminder_id(),
             "time": time_str,
             "message": message,
             "duration": int(duration),  # 确保duration是整数
             "play_sound": play_sound,   # 添加声音设置
             "weekdays": weekdays        # 添加星期设置
         }
+        if rules:
+            reminder.update({key: value for key, value in rules.items() if key in SCHEDULE_FIELDS})
         
         self.reminders.append(reminder)
+        self.invalidate_schedule()
         
         # 保存到配置
         self.config_manager.save_reminders(self.reminders)
@@ -49,45 +102,213 @@ class ReminderManager(QObject):
         
         return True, "提醒已添加"
     
+    def import_reminders(self, reminders, replace=False):
+        """批量导入已校验的提醒，一次性保存，返回 (是否成功, 消息, 导入数量)"""
+        reminders = self.config_manager.sanitize_reminders(reminders)
+        
+        # 跳过与现有提醒完全相同的条目，重复导入同一课表不会产生重复提醒
+        existing = [] if replace else list(self.reminders)
+        seen = {_content_key(reminder) for reminder in existing}
+        added = []
+        for reminder in reminders:
+            key = _content_key(reminder)
+            if key not in seen:
+                seen.add(key)
+                added.append(reminder)
+        
+        if not added and not replace:
+            return True, "没有新的提醒需要导入", 0
+        
+        # 保存成功后才替换内存中的列表
+        new_reminders = existing + added
+        try:
+            self.config_manager.save_reminders(new_reminders)
+        except OSError as e:
+            logger.error(f"保存导入的提醒时出错: {e}")
+            return False, f"保存提醒时出错: {e}", 0
+        
+        self.reminders[:] = new_reminders
+        self.invalidate_schedule()
+        self.reminders_imported.emit(len(added))
+        return True, f"已导入 {len(added)} 个提醒", len(added)
+    
+    def apply_batch(self, added=(), deleted_ids=()):
+        """批量添加和删除提醒，整批只保存一次，返回 (是否成功, 消息, 添加的提醒ID列表)"""
+        deleted_ids = set(deleted_ids)
+        missing = deleted_ids - {reminder["id"] for reminder in self.reminders}
+        if missing:
+            return False, f"未找到提醒: {', '.join(sorted(missing))}", []
+        
+        # 没有ID的新提醒在规范化时分配ID，指定的ID不能与保留的提醒重复
+        added = self.config_manager.sanitize_reminders([dict(reminder) for reminder in added])
+        ids = {reminder["id"] for reminder in self.reminders if reminder["id"] not in deleted_ids}
+        for reminder in added:
+            if reminder["id"] in ids:
+                return False, f"提醒ID已存在: {reminder['id']}", []
+            ids.add(reminder["id"])
+        
+        new_reminders = [reminder for reminder in self.reminders if reminder["id"] not in deleted_ids] + added
+        try:
+            self.config_manager.save_reminders(new_reminders)
+        except OSError as e:
+            logger.error(f"批量保存提醒时出错: {e}")
+            return False, f"保存提醒时出错: {e}", []
+        
+        # 保存成功后按行删除再追加，列表模型只更新变化的行
+        self.invalidate_schedule()
+        for i in range(len(self.reminders) - 1, -1, -1):
+            if self.reminders[i]["id"] in deleted_ids:
+                del self.reminders[i]
+                self.reminder_deleted.emit(i)
+        if added:
+            self.reminders.extend(added)
+            self.reminders_imported.emit(len(added))
+        return True, f"已添加 {len(added)} 个提醒，删除 {len(deleted_ids)} 个提醒", [reminder["id"] for reminder in added]
+    
+    def reload_reminders(self):
+        """配置文件被外部修改后重新加载提醒，只对删除、修改和新增的提醒发出信号，返回是否有变化"""
+        new_reminders = self.config_manager.load_reminders()
+        if new_reminders == self.reminders:
+            return False
+        self.invalidate_schedule()
+        
+        # 删除已不存在的提醒，从后往前删除保证索引有效
+        new_ids = {reminder["id"] for reminder in new_reminders}
+        for i in range(len(self.reminders) - 1, -1, -1):
+            if self.reminders[i].get("id") not in new_ids:
+                del self.reminders[i]
+                self.reminder_deleted.emit(i)
+        
+        # 保留的提醒顺序不变、新提醒都在末尾时按行更新，否则整体替换
+        kept = len(self.reminders)
+        if [reminder["id"] for reminder in new_reminders[:kept]] != [reminder["id"] for reminder in self.reminders]:
+            self.reminders[:] = new_reminders
+            self.reminders_reloaded.emit()
+            return True
+        
+        for i, reminder in enumerate(new_reminders[:kept]):
+            if reminder != self.reminders[i]:
+                self.reminders[i] = reminder
+                self.reminder_edited.emit(i)
+        
+        added = new_reminders[kept:]
+        if added:
+            self.reminders.extend(added)
+            self.reminders_imported.emit(len(added))
+        return True
+    
     def delete_reminder(self, index):
         """删除提醒"""
         if 0 <= index < len(self.reminders):
             del self.reminders[index]
+            self.invalidate_schedule()
             self.config_manager.save_reminders(self.reminders)
             self.reminder_deleted.emit(index)
             return True, "提醒已删除"
         return False, "无效的提醒索引"
     
+    def delete_reminder_by_id(self, reminder_id):
+        """按ID删除提醒"""
+        index = self.index_of_reminder(reminder_id)
+        if index < 0:
+            return False, "提醒不存在或已被删除"
+        return self.delete_reminder(index)
+    
     def get_reminder(self, index):
         """获取指定索引的提醒"""
         if 0 <= index < len(self.reminders):
             return self.reminders[index]
         return None
     
-    def check_reminders(self):
-        """检查是否有到期的提醒"""
-        current_time = datetime.now().strftime("%H:%M")
-        current_weekday = datetime.now().weekday()  # 0是周一，6是周日
+    def index_of_reminder(self, reminder_id):
+        """获取指定ID的提醒在列表中的索引，不存在时返回-1"""
+        for index, reminder in enumerate(self.reminders):
+            if reminder.get("id") == reminder_id:
+                return index
+        return -1
+    
+    def get_reminder_by_id(self, reminder_id):
+        """获取指定ID的提醒"""
+        return self.get_reminder(self.index_of_reminder(reminder_id))
+    
+    def update_reminder(self, reminder_id, fields):
+        """原地修改指定ID的提醒，只保存这一条记录；规则字段的值为None时删除该字段"""
+        index = self.index_of_reminder(reminder_id)
+        if index < 0:
+            return False, "提醒不存在或已被删除"
         
-        # 防止同一分钟内重复触发提醒
-        if current_time == self.last_reminder_time:
-            return None
+        unknown = set(fields) - set(EDITABLE_FIELDS)
+        if unknown:
+            return False, f"不支持修改的字段: {', '.join(sorted(unknown))}"
+        if "message" in fields and not fields["message"]:
+            return False, "提醒消息不能为空"
+        if "time" in fields and parse_minute(fields["time"]) is None:
+            return False, f"无效的时间: {fields['time']}"
         
-        for reminder in self.reminders:
-            if reminder["time"] == current_time:
-                # 检查当前星期是否启用
-                weekdays = reminder.get("weekdays", [True] * 7)
-                if not weekdays[current_weekday]:
-                    # 当前星期未启用此提醒，跳过
-                    continue
-                
-                # 记录当前提醒时间，避免重复触发
-                self.last_reminder_time = current_time
-                
-                # 返回匹配的提醒
-                return reminder
+        # 在副本上修改，保存成功后再替换
+        reminder = self.reminders[index]
+        updated = dict(reminder)
+        for key, value in fields.items():
+            if value is None and key in SCHEDULE_FIELDS:
+                updated.pop(key, None)
+            else:
+                updated[key] = value
+        updated = self.config_manager.sanitize_reminders([updated])[0]
+        if updated == reminder:
+            return True, "提醒未修改"
         
-        return None
+        try:
+            # 文件中找不到该提醒（例如被外部修改）时保存整个列表
+            if not self.config_manager.update_reminder(updated):
+                self.config_manager.save_reminders(self.reminders[:index] + [updated] + self.reminders[index + 1:])
+        except OSError as e:
+            logger.error(f"保存提醒时出错: {e}")
+            return False, f"保存提醒时出错: {e}"
+        
+        # 原地更新字典，持有该提醒引用的地方也能看到修改
+        reminder.clear()
+        reminder.update(updated)
+        self.invalidate_schedule()
+        self.reminder_edited.emit(index)
+        return True, "提醒已更新"
+    
+    def check_reminders(self, now=None):
+        """检查上次检查之后是否有到期的提醒，休眠或卡顿期间错过的提醒在宽限内补显示"""
+        now = now or self.clock()
+        
+        # 课表索引已考虑星期、日期范围、例外日期和单双周，触发记录保证同一次触发只显示一次
+        index = self.ledger.evaluate(
+            self.get_schedule(), self.reminders, now,
+            self.config_manager.get_setting("missed_grace_minutes", DEFAULT_GRACE_MINUTES)
+        )
+        if index is None:
+            return None
+        
+        # 返回匹配的提醒
+        return self.reminders[index]
+    
+    def get_fire_history(self):
+        """最近的触发、补显示和错过记录，按时间先后排序"""
+        return list(self.ledger.history)
+    
+    def get_today_reminders(self):
+        """获取今天会触发的提醒，返回 [(时间字符串, 提醒)]，按时间排序"""
+        return [
+            (f"{minute // 60:02d}:{minute % 60:02d}", self.reminders[index])
+            for minute, index in self.get_schedule().occurrences_on(self.clock().date())
+        ]
+    
+    def get_next_reminder(self):
+        """获取下一次触发的提醒，返回 (datetime, 提醒)，没有时返回None"""
+        occurrence = self.get_schedule().next_occurrence(self.clock())
+        if occurrence is None:
+            return None
+        when, index = occurrence
+        return when, self.reminders[index]
+    
+    def get_upcoming_reminders(self, limit=10):
+        """获取接下来的N次触发，返回 [(datetime, 提醒)]"""
+        return [(when, self.reminders[index]) for when, index in self.get_schedule().upcoming(self.clock(), limit)]
     
     def create_time_from_string(self, time_str):
         """从字符串创建QTime对象"""
@@ -118,6 +339,16 @@ class ReminderManager(QObject):
                 weekday_str += weekday_abbrs[i]
         
         weekday_display = f"[{weekday_str}]" if weekday_str else "[无]"
+        
+        # 一次性日期、单双周和日期范围
+        if reminder.get("dates"):
+            weekday_display = f"[{len(reminder['dates'])}个日期]"
+        if reminder.get("week_parity") in WEEK_PARITIES:
+            weekday_display += f"[{reminder['week_parity']}周]"
+        if reminder.get("term"):
+            weekday_display += f"[{reminder['term']}]"
+        if reminder.get("start_date") or reminder.get("end_date"):
+            weekday_display += f"[{reminder.get('start_date', '')}~{reminder.get('end_date', '')}]"
         sound_status = "有声音" if play_sound else "静音"
         
         return f"{time_str} {weekday_display} - {display_message} ({duration}秒) [{sound_status}]"
@@ -8,6 +8,10 @@ logger = logging.getLogger("ClassScreenReminder.ResourceManager")
 _app_root_dir = None
 _resources_dir = None
 
+def get_app_data_dir():
+    """用户数据目录，配置、日志、缓存和单实例服务名都以此为准；只使用标准库，可在导入Qt之前调用"""
+    return os.path.join(os.environ.get('APPDATA', os.path.expanduser('~/.config')), 'ClassScreenReminder')
+
 def init_resource_paths(app_dir=None):
     """初始化资源路径"""
     global _app_root_dir, _resources_dir
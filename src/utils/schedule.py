@@ -0,0 +1,208 @@
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.Schedule")
+
+# 提醒中可选的规则字段（均为可选，缺省时与原来的每周重复行为一致）:
+#   "start_date" / "end_date": "YYYY-MM-DD"，生效日期范围（含首尾）
+#   "term": 学期名称，使用设置中 "terms" 对应学期的日期范围
+#   "exceptions": ["YYYY-MM-DD", ...]，不触发的日期
+#   "week_parity": "A" 或 "B"，单双周；以 start_date 或学期开始所在的周为A周，都没有时按ISO周序号，奇数周为A周
+#   "dates": ["YYYY-MM-DD", ...]，一次性日期，设置后只在这些日期触发，忽略星期设置
+#   "grace_minutes": 整数，休眠或卡顿错过触发时间后仍补显示的分钟数，缺省时使用设置中的 "missed_grace_minutes"
+# 设置中的 "holidays" 为全局不触发的日期列表
+
+SCHEDULE_FIELDS = ("start_date", "end_date", "term", "exceptions", "week_parity", "dates", "grace_minutes")
+WEEK_PARITIES = ("A", "B")
+MAX_CACHED_DAYS = 64       # 最多缓存的按日期展开的触发列表
+DEFAULT_HORIZON_DAYS = 366 # 查找下一次触发时最多向后查找的天数
+
+def parse_date(value):
+    """将 YYYY-MM-DD 字符串解析为日期，无效时返回None"""
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+def parse_minute(time_str):
+    """将 HH:MM 转换为当天的分钟数，无效时返回None"""
+    try:
+        hour, minute = (int(part) for part in str(time_str).split(":"))
+    except (TypeError, ValueError):
+        return None
+    if 0 <= hour < 24 and 0 <= minute < 60:
+        return hour * 60 + minute
+    return None
+
+def _parse_dates(values):
+    """解析日期列表为序数集合，忽略无效日期"""
+    ordinals = set()
+    for value in values or ():
+        day = parse_date(value)
+        if day is None:
+            logger.warning(f"忽略无效的日期: {value}")
+        else:
+            ordinals.add(day.toordinal())
+    return frozenset(ordinals)
+
+def _week_start(day):
+    """日期所在周的周一的序数"""
+    return day.toordinal() - day.weekday()
+
+class _Rule:
+    """编译后的单个提醒规则"""
+    
+    __slots__ = ("index", "minute", "weekdays", "start", "end", "exceptions", "parity", "anchor", "dates")
+    
+    def __init__(self, index, minute, reminder, terms, holidays):
+        self.index = index
+        self.minute = minute
+        weekdays = reminder.get("weekdays", [True] * 7)
+        self.weekdays = tuple(bool(weekdays[i]) if i < len(weekdays) else False for i in range(7))
+        self.exceptions = _parse_dates(reminder.get("exceptions")) | holidays
+        self.dates = _parse_dates(reminder.get("dates"))
+        
+        # 日期范围取提醒自身范围和所属学期范围的交集
+        start = parse_date(reminder.get("start_date"))
+        end = parse_date(reminder.get("end_date"))
+        term = terms.get(reminder.get("term")) if reminder.get("term") else None
+        if reminder.get("term") and term is None:
+            logger.warning(f"提醒引用了不存在的学期: {reminder.get('term')}")
+        if term:
+            term_start, term_end = term
+            start = max(filter(None, (start, term_start)), default=None)
+            end = min(filter(None, (end, term_end)), default=None)
+        self.start = start.toordinal() if start else None
+        self.end = end.toordinal() if end else None
+        
+        # 单双周以起始日期所在的周为A周
+        parity = reminder.get("week_parity")
+        self.parity = WEEK_PARITIES.index(parity) if parity in WEEK_PARITIES else None
+        self.anchor = _week_start(start) if start else None
+    
+    def is_active_on(self, day):
+        """规则在指定日期是否生效（不检查星期和一次性日期）"""
+        ordinal = day.toordinal()
+        if self.start is not None and ordinal < self.start:
+            return False
+        if self.end is not None and ordinal > self.end:
+            return False
+        if ordinal in self.exceptions:
+            return False
+        if self.parity is not None:
+            if self.anchor is not None:
+                week = (_week_start(day) - self.anchor) // 7
+            else:
+                week = day.isocalendar()[1] - 1
+            if week % 2 != self.parity:
+                return False
+        return True
+
+class Schedule:
+    """课表模型，将提醒规则编译为按星期和日期排序的索引，查询某一时刻和下一次触发只需二分查找"""
+    
+    def __init__(self, reminders, terms=None, holidays=None):
+        self.reminders = reminders
+        self._weekly = [[] for _ in range(7)]  # {星期: [(分钟, 提醒索引, 规则)]}，按分钟排序
+        self._one_off = {}                      # {日期序数: [(分钟, 提醒索引, 规则)]}
+        self._days = {}                         # {日期序数: ([分钟], [提醒索引])}
+        self._compile(reminders, terms or [], holidays or [])
+    
+    def _compile(self, reminders, terms, holidays):
+        """编译全部提醒规则"""
+        term_ranges = {}
+        for term in terms:
+            name = term.get("name")
+            if name:
+                term_ranges[name] = (parse_date(term.get("start_date")), parse_date(term.get("end_date")))
+        holiday_set = _parse_dates(holidays)
+        
+        for index, reminder in enumerate(reminders):
+            minute = parse_minute(reminder.get("time"))
+            if minute is None:
+                logger.warning(f"忽略时间无效的提醒: {reminder.get('time')}")
+                continue
+            
+            rule = _Rule(index, minute, reminder, term_ranges, holiday_set)
+            entry = (minute, index, rule)
+            if rule.dates:
+                for ordinal in rule.dates:
+                    self._one_off.setdefault(ordinal, []).append(entry)
+            else:
+                for weekday, enabled in enumerate(rule.weekdays):
+                    if enabled:
+                        self._weekly[weekday].append(entry)
+        
+        for entries in self._weekly:
+            entries.sort(key=lambda item: item[:2])
+    
+    def _day(self, day):
+        """获取指定日期按分钟排序的触发列表"""
+        ordinal = day.toordinal()
+        cached = self._days.get(ordinal)
+        if cached is not None:
+            return cached
+        
+        entries = [entry for entry in self._weekly[day.weekday()] if entry[2].is_active_on(day)]
+        one_off = [entry for entry in self._one_off.get(ordinal, ()) if entry[2].is_active_on(day)]
+        if one_off:
+            entries = sorted(entries + one_off, key=lambda item: item[:2])
+        
+        if len(self._days) >= MAX_CACHED_DAYS:
+            self._days.clear()
+        cached = self._days[ordinal] = ([entry[0] for entry in entries], [entry[1] for entry in entries])
+        return cached
+    
+    def occurrences_on(self, day):
+        """指定日期的所有触发，返回 [(分钟, 提醒索引)]，按时间排序"""
+        minutes, indexes = self._day(day)
+        return list(zip(minutes, indexes))
+    
+    def due_at(self, moment):
+        """指定时刻（精确到分钟）应触发的提醒索引列表"""
+        minutes, indexes = self._day(moment.date())
+        minute = moment.hour * 60 + moment.minute
+        return indexes[bisect_left(minutes, minute):bisect_right(minutes, minute)]
+    
+    def upcoming(self, moment, limit=10, horizon_days=DEFAULT_HORIZON_DAYS):
+        """指定时刻之后（不含当前分钟）的N次触发，返回 [(时间, 提醒索引)]，按时间排序"""
+        results = []
+        if limit <= 0 or (not any(self._weekly) and not self._one_off):
+            return results
+        
+        day = moment.date()
+        after = moment.hour * 60 + moment.minute
+        for _ in range(horizon_days + 1):
+            minutes, indexes = self._day(day)
+            midnight = datetime.combine(day, datetime.min.time())
+            for position in range(bisect_right(minutes, after), len(minutes)):
+                results.append((midnight + timedelta(minutes=minutes[position]), indexes[position]))
+                if len(results) >= limit:
+                    return results
+            day += timedelta(days=1)
+            after = -1
+        return results
+    
+    def next_occurrence(self, moment, horizon_days=DEFAULT_HORIZON_DAYS):
+        """指定时刻之后（不含当前分钟）的下一次触发，返回 (时间, 提醒索引)，没有时返回None"""
+        occurrences = self.upcoming(moment, 1, horizon_days)
+        return occurrences[0] if occurrences else None
+    
+    def between(self, start, end):
+        """两个时刻之间（不含开始分钟，含结束分钟）的触发，返回 [(时间, 提醒索引)]，按时间排序"""
+        results = []
+        day = start.date()
+        after = start.hour * 60 + start.minute
+        while day <= end.date():
+            minutes, indexes = self._day(day)
+            until = end.hour * 60 + end.minute if day == end.date() else 24 * 60
+            midnight = datetime.combine(day, datetime.min.time())
+            for position in range(bisect_right(minutes, after), bisect_right(minutes, until)):
+                results.append((midnight + timedelta(minutes=minutes[position]), indexes[position]))
+            day += timedelta(days=1)
+            after = -1
+        return results
@@ -0,0 +1,67 @@
+import json
+import logging
+from PySide6.QtCore import QObject, QLockFile, Signal
+from PySide6.QtNetwork import QLocalServer
+
+from .instance_client import server_name, lock_path
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.SingleInstance")
+
+class SingleInstanceServer(QObject):
+    """单实例本地服务，接收再次启动时转发的命令"""
+    
+    # 参数为命令列表
+    commands_received = Signal(list)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+        self.lock = None
+    
+    def listen(self):
+        """获取单实例锁并开始监听，已有其他实例持有锁时返回False"""
+        # 锁在进程退出前一直持有，进程异常退出后由 QLockFile 按进程ID判断为失效
+        self.lock = QLockFile(lock_path())
+        self.lock.setStaleLockTime(0)
+        if not self.lock.tryLock(0):
+            return False
+        
+        # 持有锁时已有的套接字文件一定是异常退出留下的
+        name = server_name()
+        QLocalServer.removeServer(name)
+        if not self.server.listen(name):
+            # 无法监听时仍然运行，只是不能接收转发的命令
+            logger.error(f"单实例服务监听失败: {self.server.errorString()}")
+        return True
+    
+    def close(self):
+        """停止监听并释放锁"""
+        self.server.close()
+        if self.lock is not None:
+            self.lock.unlock()
+    
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(socket.deleteLater)
+    
+    def _on_ready_read(self, socket):
+        """读取一行命令，确认后发出信号"""
+        if not socket.canReadLine():
+            return
+        try:
+            message = json.loads(bytes(socket.readLine()).decode("utf-8"))
+            commands = [str(command) for command in message.get("commands", [])]
+        except (UnicodeDecodeError, json.JSONDecodeError, AttributeError, TypeError) as e:
+            logger.warning(f"忽略无效的转发命令: {e}")
+            socket.disconnectFromServer()
+            return
+        
+        socket.write(b'{"ok": true}\n')
+        socket.flush()
+        logger.info(f"收到转发的命令: {commands}")
+        self.commands_received.emit(commands)
@@ -2,10 +2,10 @@ import os
 import time
 import logging
 from PySide6.QtCore import QTimer, QUrl
-from PySide6.QtMultimedia import QSoundEffect, QMediaPlayer, QAudioOutput
 
 # 获取logger
 logger = logging.getLogger("ClassScreenReminder.SoundManager")
+timing_logger = logging.getLogger("ClassScreenReminder.Timing")
 
 # 全局声音变量
 _global_sound = None
@@ -16,6 +16,11 @@ _last_play_time = 0
 _is_second_sound_playing = False
 _current_audio_path = ""  # 存储当前使用的音频文件路径
 _is_wav_format = True     # 当前是否为WAV格式
+_config_manager = None    # 共享的配置管理器，由启动流程注入
+_media_devices = None     # 音频设备监视器，用于响应设备热插拔
+_output_device_id = None  # 用户选择的输出设备ID，空字符串表示跟随系统默认设备
+_device_listeners = []    # 输出设备列表变化时的回调
+_qt_multimedia = None     # 延迟导入的QtMultimedia模块
 
 # 支持的音频格式
 SUPPORTED_FORMATS = {
@@ -27,13 +32,157 @@ SUPPORTED_FORMATS = {
     "flac": "FLAC音频文件 (*.flac)"
 }
 
-def initialize_sound():
+def _multimedia():
+    """延迟导入QtMultimedia，只在首次用到声音功能时加载多媒体后端"""
+    global _qt_multimedia
+    if _qt_multimedia is None:
+        start_time = time.perf_counter()
+        from PySide6 import QtMultimedia
+        _qt_multimedia = QtMultimedia
+        timing_logger.info(f"QtMultimedia导入耗时: {(time.perf_counter() - start_time) * 1000:.1f}ms")
+    return _qt_multimedia
+
+def set_config_manager(config_manager):
+    """注入共享的配置管理器，避免声音子系统重复创建ConfigManager"""
+    global _config_manager
+    _config_manager = config_manager
+
+def _get_config_manager():
+    """获取共享的配置管理器，未注入时仅创建一次"""
+    global _config_manager
+    if _config_manager is None:
+        from ..config_manager import ConfigManager
+        _config_manager = ConfigManager()
+    return _config_manager
+
+def _device_id(device):
+    """获取音频设备ID的字符串形式"""
+    return bytes(device.id().data()).decode("utf-8", "ignore")
+
+def _ensure_device_monitor():
+    """创建设备监视器并读取用户选择的输出设备（仅执行一次）"""
+    global _media_devices, _output_device_id
+    
+    if _media_devices is None:
+        _media_devices = _multimedia().QMediaDevices()
+        _media_devices.audioOutputsChanged.connect(_on_audio_outputs_changed)
+    
+    if _output_device_id is None:
+        try:
+            _output_device_id = _get_config_manager().get_setting("audio_output_device", "") or ""
+        except Exception as e:
+            logger.error(f"读取输出设备设置时出错: {e}")
+            _output_device_id = ""
+
+def _resolve_output_device():
+    """确定当前应使用的输出设备：优先用户选择的设备，不可用时回退到系统默认设备"""
+    _ensure_device_monitor()
+    
+    if _output_device_id:
+        for device in _multimedia().QMediaDevices.audioOutputs():
+            if _device_id(device) == _output_device_id:
+                return device
+        logger.warning(f"所选输出设备不可用，暂时使用系统默认设备: {_output_device_id}")
+    
+    return _multimedia().QMediaDevices.defaultAudioOutput()
+
+def _create_sound_effect(path):
+    """创建绑定到当前输出设备的WAV音效对象"""
+    sound_effect = _multimedia().QSoundEffect(_resolve_output_device())
+    sound_effect.setSource(QUrl.fromLocalFile(path))
+    sound_effect.setVolume(1.0)
+    sound_effect.setLoopCount(0)
+    return sound_effect
+
+def _create_audio_output():
+    """创建绑定到当前输出设备的音频输出对象"""
+    audio_output = _multimedia().QAudioOutput(_resolve_output_device())
+    audio_output.setVolume(1.0)
+    return audio_output
+
+def _apply_output_device():
+    """将已加载的声音对象切换到当前输出设备，已解码的数据保持不变"""
+    device = _resolve_output_device()
+    
+    # 只切换输出端，不重新设置音源，避免重新解码
+    if _global_sound is not None:
+        _global_sound.setAudioDevice(device)
+    if _audio_output is not None:
+        _audio_output.setDevice(device)
+    
+    logger.info(f"音频输出已切换到: {device.description()}")
+
+def _on_audio_outputs_changed():
+    """处理音频设备热插拔（如投影仪HDMI音频接入或断开）"""
+    try:
+        _apply_output_device()
+    except Exception as e:
+        logger.error(f"切换音频输出设备时出错: {e}")
+    
+    for callback in list(_device_listeners):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"通知输出设备变化时出错: {e}")
+
+def get_audio_output_devices():
+    """获取可用的音频输出设备列表，每项为 (设备ID, 设备名称)"""
+    _ensure_device_monitor()
+    return [(_device_id(device), device.description()) for device in _multimedia().QMediaDevices.audioOutputs()]
+
+def get_audio_output_device():
+    """获取用户选择的输出设备ID，空字符串表示跟随系统默认设备"""
+    _ensure_device_monitor()
+    return _output_device_id
+
+def set_audio_output_device(device_id):
+    """选择音频输出设备并立即切换，空字符串表示跟随系统默认设备"""
+    global _output_device_id
+    
+    _ensure_device_monitor()
+    _output_device_id = device_id or ""
+    
+    try:
+        _get_config_manager().set_setting("audio_output_device", _output_device_id)
+    except Exception as e:
+        logger.error(f"保存配置时出错: {e}")
+    
+    try:
+        _apply_output_device()
+        return True
+    except Exception as e:
+        logger.error(f"切换音频输出设备时出错: {e}")
+        return False
+
+def add_output_devices_listener(callback):
+    """注册输出设备列表变化的回调"""
+    if callback not in _device_listeners:
+        _device_listeners.append(callback)
+
+def remove_output_devices_listener(callback):
+    """取消注册输出设备列表变化的回调"""
+    if callback in _device_listeners:
+        _device_listeners.remove(callback)
+
+def initialize_sound(config_manager=None):
     """初始化全局声音对象"""
-    global _global_sound, _media_player, _audio_output, _sound_is_initialized, _current_audio_path, _is_wav_format
+    if config_manager is not None:
+        set_config_manager(config_manager)
     
     if _sound_is_initialized:
         return True
     
+    start_time = time.perf_counter()
+    try:
+        return _initialize_sound()
+    finally:
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        timing_logger.info(f"声音初始化耗时: {elapsed_ms:.1f}ms")
+
+def _initialize_sound():
+    """加载声音文件并创建播放对象"""
+    global _global_sound, _media_player, _audio_output, _sound_is_initialized, _current_audio_path, _is_wav_format
+    
     try:
         # 修正声音文件路径 - 现在需要向上两级目录才能找到resources目录
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -42,8 +191,7 @@ def initialize_sound():
         
         # 尝试从配置中加载自定义音频
         try:
-            from ..config_manager import ConfigManager
-            config = ConfigManager()
+            config = _get_config_manager()
             custom_audio = config.get_setting("custom_audio_path", "")
             if custom_audio and os.path.exists(custom_audio):
                 sound_path = custom_audio
@@ -69,10 +217,7 @@ def initialize_sound():
             if file_ext == '.wav':
                 # WAV格式使用QSoundEffect
                 _is_wav_format = True
-                sound_effect = QSoundEffect()
-                sound_effect.setSource(QUrl.fromLocalFile(sound_path))
-                sound_effect.setVolume(1.0)
-                sound_effect.setLoopCount(0)
+                sound_effect = _create_sound_effect(sound_path)
                 
                 _global_sound = sound_effect
                 _sound_is_initialized = True
@@ -80,10 +225,9 @@ def initialize_sound():
             else:
                 # 非WAV格式使用QMediaPlayer
                 _is_wav_format = False
-                _audio_output = QAudioOutput()
-                _audio_output.setVolume(1.0)
+                _audio_output = _create_audio_output()
                 
-                _media_player = QMediaPlayer()
+                _media_player = _multimedia().QMediaPlayer()
                 _media_player.setAudioOutput(_audio_output)
                 _media_player.setSource(QUrl.fromLocalFile(sound_path))
                 
@@ -106,10 +250,7 @@ def initialize_sound():
                 if os.path.exists(path):
                     # WAV格式使用QSoundEffect
                     _is_wav_format = True
-                    sound_effect = QSoundEffect()
-                    sound_effect.setSource(QUrl.fromLocalFile(path))
-                    sound_effect.setVolume(1.0)
-                    sound_effect.setLoopCount(0)
+                    sound_effect = _create_sound_effect(path)
                     
                     _global_sound = sound_effect
                     _sound_is_initialized = True
@@ -201,13 +342,10 @@ def set_custom_audio(audio_path):
         
         if file_ext == '.wav':
             # WAV格式使用QSoundEffect
-            sound_effect = QSoundEffect()
-            sound_effect.setSource(QUrl.fromLocalFile(audio_path))
-            sound_effect.setVolume(1.0)
-            sound_effect.setLoopCount(0)
+            sound_effect = _create_sound_effect(audio_path)
             
             # 如果加载成功，替换全局对象
-            if sound_effect.isLoaded() or sound_effect.status() == QSoundEffect.Loading:
+            if sound_effect.isLoaded() or sound_effect.status() == _multimedia().QSoundEffect.Loading:
                 # 停止并清理旧的播放器
                 if _is_wav_format and _global_sound:
                     if _global_sound.isPlaying():
@@ -225,8 +363,8 @@ def set_custom_audio(audio_path):
         else:
             # 非WAV格式使用QMediaPlayer
             if _media_player is None:
-                _audio_output = QAudioOutput()
-                _media_player = QMediaPlayer()
+                _audio_output = _create_audio_output()
+                _media_player = _multimedia().QMediaPlayer()
                 _media_player.setAudioOutput(_audio_output)
             
             # 停止并清理旧的播放器
@@ -245,9 +383,7 @@ def set_custom_audio(audio_path):
         
         # 保存到配置
         try:
-            from ..config_manager import ConfigManager
-            config = ConfigManager()
-            config.set_setting("custom_audio_path", audio_path)
+            _get_config_manager().set_setting("custom_audio_path", audio_path)
         except Exception as e:
             logger.error(f"保存配置时出错: {e}")
         
@@ -273,13 +409,10 @@ def reset_to_default_audio():
             return False
         
         # 创建新的声音效果对象
-        sound_effect = QSoundEffect()
-        sound_effect.setSource(QUrl.fromLocalFile(default_audio_path))
-        sound_effect.setVolume(1.0)
-        sound_effect.setLoopCount(0)
+        sound_effect = _create_sound_effect(default_audio_path)
         
         # 如果加载成功，替换全局对象
-        if sound_effect.isLoaded() or sound_effect.status() == QSoundEffect.Loading:
+        if sound_effect.isLoaded() or sound_effect.status() == _multimedia().QSoundEffect.Loading:
             # 停止并清理旧的播放器
             if _is_wav_format and _global_sound:
                 if _global_sound.isPlaying():
@@ -294,9 +427,7 @@ def reset_to_default_audio():
             
             # 清除配置中的自定义音频
             try:
-                from ..config_manager import ConfigManager
-                config = ConfigManager()
-                config.set_setting("custom_audio_path", "")
+                _get_config_manager().set_setting("custom_audio_path", "")
             except Exception as e:
                 logger.error(f"保存配置时出错: {e}")
             
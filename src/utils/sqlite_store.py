@@ -0,0 +1,177 @@
+import os
+import json
+import sqlite3
+import logging
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.SqliteStore")
+
+SCHEMA_VERSION = 1
+
+# 提醒按ID保存，每个启用的星期在 reminder_slots 中占一行，按 (星期, 分钟) 建索引
+# 一次性日期、日期范围等课表规则仍由 Schedule 处理，这里的查询只按星期和时间筛选
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reminder_slots (
+    reminder_id TEXT NOT NULL REFERENCES reminders(id) ON DELETE CASCADE,
+    weekday INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    PRIMARY KEY (reminder_id, weekday)
+);
+CREATE INDEX IF NOT EXISTS idx_reminders_minute ON reminders(minute);
+CREATE INDEX IF NOT EXISTS idx_slots_weekday_minute ON reminder_slots(weekday, minute);
+CREATE TABLE IF NOT EXISTS cards (
+    position INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+# 查询语句，sqlite3 会缓存编译后的语句
+SQL_LOAD_REMINDERS = "SELECT data FROM reminders ORDER BY position"
+SQL_REMINDER_ROWS = "SELECT id, position, data FROM reminders"
+SQL_INSERT_REMINDER = "INSERT OR REPLACE INTO reminders (id, position, minute, data) VALUES (?, ?, ?, ?)"
+SQL_UPDATE_POSITION = "UPDATE reminders SET position = ? WHERE id = ?"
+SQL_UPDATE_REMINDER = "UPDATE reminders SET minute = ?, data = ? WHERE id = ?"
+SQL_DELETE_REMINDER = "DELETE FROM reminders WHERE id = ?"
+SQL_DELETE_SLOTS = "DELETE FROM reminder_slots WHERE reminder_id = ?"
+SQL_INSERT_SLOT = "INSERT INTO reminder_slots (reminder_id, weekday, minute) VALUES (?, ?, ?)"
+SQL_COUNT_REMINDERS = "SELECT COUNT(*) FROM reminders"
+SQL_DUE_AT = """
+SELECT r.data FROM reminder_slots s JOIN reminders r ON r.id = s.reminder_id
+WHERE s.weekday = ? AND s.minute = ? ORDER BY r.position
+"""
+SQL_NEXT_ON_DAY = """
+SELECT s.minute, r.data FROM reminder_slots s JOIN reminders r ON r.id = s.reminder_id
+WHERE s.weekday = ? AND s.minute > ? ORDER BY s.minute, r.position LIMIT ?
+"""
+SQL_LOAD_CARDS = "SELECT data FROM cards ORDER BY position"
+SQL_DELETE_CARDS = "DELETE FROM cards"
+SQL_INSERT_CARD = "INSERT INTO cards (position, data) VALUES (?, ?)"
+
+def _reminder_minute(reminder):
+    """提醒时间转换为分钟数，无效时返回-1"""
+    try:
+        hour, minute = (int(part) for part in str(reminder.get("time", "")).split(":"))
+        return hour * 60 + minute
+    except ValueError:
+        return -1
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+class SqliteStore:
+    """SQLite存储，保存提醒和名片，使用WAL模式并按星期和时间建索引"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+    
+    @property
+    def connection(self):
+        """首次使用时打开数据库并创建表"""
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(SCHEMA)
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._connection = connection
+        return self._connection
+    
+    def close(self):
+        """关闭数据库连接"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+    
+    # ---------- 提醒 ----------
+    
+    def count_reminders(self):
+        """提醒数量"""
+        return self.connection.execute(SQL_COUNT_REMINDERS).fetchone()[0]
+    
+    def load_reminders(self):
+        """按顺序加载全部提醒"""
+        return [json.loads(data) for (data,) in self.connection.execute(SQL_LOAD_REMINDERS)]
+    
+    def _write_slots(self, cursor, reminder, minute):
+        """写入提醒启用的星期，设置了一次性日期的提醒不按星期触发"""
+        cursor.execute(SQL_DELETE_SLOTS, (reminder["id"],))
+        if reminder.get("dates") or minute < 0:
+            return
+        cursor.executemany(SQL_INSERT_SLOT, [
+            (reminder["id"], weekday, minute)
+            for weekday, enabled in enumerate(reminder.get("weekdays", [True] * 7)) if enabled
+        ])
+    
+    def save_reminders(self, reminders):
+        """保存提醒列表，只写入有变化的行，返回写入的行数"""
+        connection = self.connection
+        existing = {row[0]: (row[1], row[2]) for row in connection.execute(SQL_REMINDER_ROWS)}
+        changed = 0
+        
+        with connection:
+            cursor = connection.cursor()
+            for position, reminder in enumerate(reminders):
+                data = _dump(reminder)
+                stored = existing.pop(reminder["id"], None)
+                if stored is None or stored[1] != data:
+                    minute = _reminder_minute(reminder)
+                    cursor.execute(SQL_INSERT_REMINDER, (reminder["id"], position, minute, data))
+                    self._write_slots(cursor, reminder, minute)
+                    changed += 1
+                elif stored[0] != position:
+                    cursor.execute(SQL_UPDATE_POSITION, (position, reminder["id"]))
+                    changed += 1
+            
+            # 列表中已不存在的提醒
+            for reminder_id in existing:
+                cursor.execute(SQL_DELETE_REMINDER, (reminder_id,))
+                changed += 1
+        return changed
+    
+    def update_reminder(self, reminder):
+        """按ID更新单个提醒，未找到时返回False"""
+        minute = _reminder_minute(reminder)
+        with self.connection as connection:
+            cursor = connection.execute(SQL_UPDATE_REMINDER, (minute, _dump(reminder), reminder["id"]))
+            if cursor.rowcount == 0:
+                return False
+            self._write_slots(cursor, reminder, minute)
+        return True
+    
+    def due_at(self, weekday, minute):
+        """在指定星期的指定分钟触发的提醒，按列表顺序"""
+        return [json.loads(data) for (data,) in self.connection.execute(SQL_DUE_AT, (weekday, minute))]
+    
+    def next_occurrences(self, weekday, minute, limit=10):
+        """从指定星期的指定分钟之后（不含该分钟）的N次触发，返回 [(天数偏移, 分钟, 提醒)]"""
+        results = []
+        connection = self.connection
+        # 最多查找8天，第8天覆盖当天更早的时间
+        for offset in range(8):
+            after = minute if offset == 0 else -1
+            rows = connection.execute(SQL_NEXT_ON_DAY, ((weekday + offset) % 7, after, limit - len(results)))
+            results.extend((offset, slot_minute, json.loads(data)) for slot_minute, data in rows)
+            if len(results) >= limit:
+                break
+        return results
+    
+    # ---------- 名片 ----------
+    
+    def load_cards(self):
+        """按顺序加载全部名片"""
+        return [json.loads(data) for (data,) in self.connection.execute(SQL_LOAD_CARDS)]
+    
+    def save_cards(self, cards):
+        """保存名片列表，名片数量很少，整表替换"""
+        with self.connection as connection:
+            connection.execute(SQL_DELETE_CARDS)
+            connection.executemany(SQL_INSERT_CARD, [(position, _dump(card)) for position, card in enumerate(cards)])
@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import logging
+import platform
+from contextlib import contextmanager, nullcontext
+
+from .resource_manager import get_app_data_dir
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.StartupProfiler")
+
+# 通过环境变量或命令行参数启用
+ENV_ENABLE = "CSR_PROFILE_STARTUP"        # 设为1启用启动性能分析
+ENV_OUTPUT = "CSR_PROFILE_OUTPUT"         # 报告输出路径
+ENV_EXIT = "CSR_PROFILE_EXIT"             # 设为1时启动完成后写出报告并退出
+ARG_ENABLE = "--profile-startup"
+ARG_OUTPUT = "--profile-output="
+ARG_EXIT = "--profile-exit"
+
+# 分析状态，仅在启用后使用
+_enabled = False
+_start_time = None
+_phases = []          # [{name, start_ms, duration_ms}]
+_marks = []           # [{name, at_ms}]
+_imports = {}         # {模块名: [自身耗时, 累计耗时, 嵌套深度]}，按首次加载顺序
+_import_stack = []    # 正在加载的模块的子模块累计耗时
+_import_timer = None
+
+def _env_flag(name):
+    """检查环境变量开关"""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def is_requested(argv=None):
+    """检查是否通过环境变量或命令行参数请求了启动性能分析"""
+    argv = sys.argv if argv is None else argv
+    return _env_flag(ENV_ENABLE) or ARG_ENABLE in argv or exit_requested(argv)
+
+def exit_requested(argv=None):
+    """检查是否要求启动完成后写出报告并退出，用于无界面的回归测试"""
+    argv = sys.argv if argv is None else argv
+    return _env_flag(ENV_EXIT) or ARG_EXIT in argv
+
+def is_enabled():
+    """启动性能分析是否已启用"""
+    return _enabled
+
+def _elapsed_ms(timestamp=None):
+    """相对于启动起点的毫秒数"""
+    return ((time.perf_counter() if timestamp is None else timestamp) - _start_time) * 1000
+
+class _TimedLoader:
+    """包装模块加载器，记录模块创建和执行的耗时"""
+    
+    def __init__(self, loader, fullname):
+        self._loader = loader
+        self._fullname = fullname
+    
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+    
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        if create_module is None:
+            return None
+        # 扩展模块（如PySide6各模块）的主要耗时在创建阶段
+        return _timed_call(self._fullname, create_module, spec)
+    
+    def exec_module(self, module):
+        # 执行前还原原始加载器，避免影响模块自身对加载器的使用
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        return _timed_call(self._fullname, self._loader.exec_module, module)
+
+class _ImportTimer:
+    """元路径查找器，为每个新加载的模块包装计时加载器，效果类似 -X importtime"""
+    
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, fullname)
+                return spec
+        return None
+
+def _timed_call(fullname, func, arg):
+    """调用加载函数并把耗时计入模块，嵌套加载的耗时从父模块的自身耗时中扣除"""
+    depth = len(_import_stack)
+    _import_stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return func(arg)
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        children = _import_stack.pop()
+        if _import_stack:
+            _import_stack[-1] += elapsed
+        
+        entry = _imports.setdefault(fullname, [0.0, 0.0, depth])
+        entry[0] += elapsed - children
+        entry[1] += elapsed
+
+def start(start_time=None):
+    """启用启动性能分析并开始记录模块导入耗时"""
+    global _enabled, _start_time, _import_timer
+    if _enabled:
+        return
+    
+    _enabled = True
+    _start_time = time.perf_counter() if start_time is None else start_time
+    _import_timer = _ImportTimer()
+    sys.meta_path.insert(0, _import_timer)
+
+def stop_import_timing():
+    """停止记录模块导入耗时"""
+    global _import_timer
+    if _import_timer is not None and _import_timer in sys.meta_path:
+        sys.meta_path.remove(_import_timer)
+    _import_timer = None
+
+def phase(name):
+    """记录一个启动阶段的耗时，未启用时不做任何事"""
+    if not _enabled:
+        return nullcontext()
+    return _phase(name)
+
+@contextmanager
+def _phase(name):
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases.append({
+            "name": name,
+            "start_ms": round(_elapsed_ms(start_time), 3),
+            "duration_ms": round((time.perf_counter() - start_time) * 1000, 3),
+        })
+
+def mark(name):
+    """记录一个时间点"""
+    if _enabled:
+        _marks.append({"name": name, "at_ms": round(_elapsed_ms(), 3)})
+
+def get_output_path(argv=None):
+    """获取报告输出路径，默认写到应用数据目录"""
+    argv = sys.argv if argv is None else argv
+    for arg in argv:
+        if arg.startswith(ARG_OUTPUT):
+            return arg[len(ARG_OUTPUT):]
+    if os.environ.get(ENV_OUTPUT):
+        return os.environ[ENV_OUTPUT]
+    return os.path.join(get_app_data_dir(), 'startup_profile.json')
+
+def build_report():
+    """生成启动性能报告"""
+    imports = [
+        {"module": name, "self_ms": round(self_ms, 3), "cumulative_ms": round(cumulative_ms, 3), "depth": depth}
+        for name, (self_ms, cumulative_ms, depth) in _imports.items()
+    ]
+    
+    return {
+        "total_ms": round(_elapsed_ms(), 3),
+        "phases": list(_phases),
+        "marks": list(_marks),
+        "imports": imports,
+        "import_total_ms": round(sum(entry["self_ms"] for entry in imports), 3),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qt_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        },
+    }
+
+def write_report(path=None):
+    """写出JSON格式的启动性能报告，返回报告路径"""
+    if not _enabled:
+        return None
+    
+    stop_import_timing()
+    path = path or get_output_path()
+    report = build_report()
+    
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.error(f"写入启动性能报告时出错: {e}")
+        return None
+    
+    logger.info(f"启动性能报告已写入: {path} (总耗时 {report['total_ms']:.1f}ms)")
+    return path
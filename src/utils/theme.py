@@ -0,0 +1,106 @@
+import logging
+from string import Template
+from functools import lru_cache
+from PySide6.QtGui import QColor
+
+from .resource_manager import get_resource_path
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.Theme")
+
+STYLE_TEMPLATE = "style.qss"
+DEFAULT_THEME = "light"
+DEFAULT_ACCENT = "#0067C0"
+
+# 各主题的配色，模板中以 $名称 引用；强调色相关的值由 accent_tokens 生成
+THEMES = {
+    "light": {
+        "window": "#fcfcfc",
+        "surface": "white",
+        "surface_alt": "#FAFAFA",
+        "sidebar": "#f8f8f8",
+        "border": "#e1e1e1",
+        "input_border": "#d1d1d1",
+        "text": "#202020",
+        "text_body": "#333333",
+        "text_muted": "#707070",
+        "text_disabled": "#a0a0a0",
+        "danger": "#d9242b",
+        "danger_rgb": "249, 99, 118",
+        "hover_rgb": "0, 0, 0",
+    },
+    "dark": {
+        "window": "#202020",
+        "surface": "#2b2b2b",
+        "surface_alt": "#2d2d2d",
+        "sidebar": "#1c1c1c",
+        "border": "#3a3a3a",
+        "input_border": "#454545",
+        "text": "#f3f3f3",
+        "text_body": "#e0e0e0",
+        "text_muted": "#a0a0a0",
+        "text_disabled": "#6e6e6e",
+        "danger": "#ff99a4",
+        "danger_rgb": "249, 99, 118",
+        "hover_rgb": "255, 255, 255",
+    },
+}
+
+_applied_key = None  # 当前应用样式表对应的 (主题, 强调色)
+
+def _mix(color, other, ratio):
+    """按比例混合两种颜色"""
+    return QColor(
+        round(color.red() + (other.red() - color.red()) * ratio),
+        round(color.green() + (other.green() - color.green()) * ratio),
+        round(color.blue() + (other.blue() - color.blue()) * ratio),
+    )
+
+def accent_tokens(theme, accent_color):
+    """由强调色生成悬停、按下和选中背景等颜色"""
+    accent = QColor(accent_color)
+    surface = QColor(THEMES[theme]["surface"])
+    return {
+        "accent": accent.name(),
+        "accent_hover": _mix(accent, QColor("white"), 0.12).name(),
+        "accent_pressed": accent.darker(125).name(),
+        "accent_rgb": f"{accent.red()}, {accent.green()}, {accent.blue()}",
+        "accent_selection": _mix(surface, accent, 0.1 if theme == "light" else 0.3).name(),
+        "on_accent": "white",
+    }
+
+def normalize(theme, accent_color):
+    """无效的主题或强调色使用默认值"""
+    if theme not in THEMES:
+        theme = DEFAULT_THEME
+    if not accent_color or not QColor(accent_color).isValid():
+        accent_color = DEFAULT_ACCENT
+    return theme, QColor(accent_color).name()
+
+def load_template():
+    """读取样式模板"""
+    try:
+        with open(get_resource_path(STYLE_TEMPLATE), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError as e:
+        logger.error(f"读取样式模板失败: {e}")
+        return ""
+
+@lru_cache(maxsize=8)
+def compile_stylesheet(template, theme=DEFAULT_THEME, accent_color=DEFAULT_ACCENT):
+    """将样式模板编译为应用样式表，相同的模板、主题和强调色只编译一次"""
+    theme, accent_color = normalize(theme, accent_color)
+    tokens = dict(THEMES[theme], **accent_tokens(theme, accent_color))
+    return Template(template).safe_substitute(tokens)
+
+def apply_theme(app, config_manager, template=None):
+    """按配置中的主题和强调色设置应用样式表，与当前样式相同时不重新设置"""
+    global _applied_key
+    key = normalize(config_manager.get_theme(), config_manager.get_accent_color())
+    if key == _applied_key:
+        return False
+    
+    # 整个应用只设置这一份样式表，各控件按对象名和属性匹配规则，不再单独解析样式
+    app.setStyleSheet(compile_stylesheet(template if template is not None else load_template(), *key))
+    _applied_key = key
+    return True
@@ -0,0 +1,194 @@
+import os
+import json
+import hashlib
+import logging
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QPen, QColor, QGuiApplication
+
+from .resource_manager import get_app_data_dir
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.ThumbnailCache")
+
+# 缩略图缓存目录和索引，将在首次使用时初始化
+_cache_dir = None
+_index = None           # {源文件路径: [修改时间, 文件大小, 内容哈希]}
+_index_dirty = False
+
+CORNER_RADIUS = 12      # 方形头像的圆角半径
+
+def init_thumbnail_cache(cache_dir=None):
+    """初始化缩略图缓存目录"""
+    global _cache_dir, _index
+    
+    if cache_dir is None:
+        cache_dir = os.path.join(get_app_data_dir(), 'thumbnails')
+    
+    _cache_dir = cache_dir
+    _index = None
+    os.makedirs(_cache_dir, exist_ok=True)
+    return _cache_dir
+
+def _get_cache_dir():
+    """获取缩略图缓存目录"""
+    if _cache_dir is None:
+        init_thumbnail_cache()
+    return _cache_dir
+
+def _index_path():
+    """获取缓存索引文件路径"""
+    return os.path.join(_get_cache_dir(), "index.json")
+
+def _load_index():
+    """加载源文件到内容哈希的索引，避免每次都读取整张原图计算哈希"""
+    global _index
+    if _index is None:
+        try:
+            with open(_index_path(), 'r', encoding='utf-8') as f:
+                _index = json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            _index = {}
+    return _index
+
+def _save_index():
+    """保存索引"""
+    global _index_dirty
+    if not _index_dirty:
+        return
+    try:
+        with open(_index_path(), 'w', encoding='utf-8') as f:
+            json.dump(_index, f, ensure_ascii=False)
+        _index_dirty = False
+    except OSError as e:
+        logger.error(f"保存缩略图索引时出错: {e}")
+
+def _content_hash(image_path):
+    """获取源图片的内容哈希，文件未变化时直接使用索引中的结果"""
+    global _index_dirty
+    
+    stat = os.stat(image_path)
+    index = _load_index()
+    entry = index.get(image_path)
+    if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry[2]
+    
+    digest = hashlib.sha1()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    content_hash = digest.hexdigest()
+    
+    index[image_path] = [stat.st_mtime_ns, stat.st_size, content_hash]
+    _index_dirty = True
+    _save_index()
+    return content_hash
+
+def _thumbnail_name(content_hash, size, is_round, dpr):
+    """根据内容哈希、尺寸、形状和设备像素比生成缓存文件名"""
+    shape = "round" if is_round else "rect"
+    return f"{content_hash}_{size}_{shape}_{dpr:g}x.png"
+
+def render_avatar(pixmap, size, is_round=True, dpr=1.0):
+    """将图片填充裁剪为指定尺寸，并应用圆形或圆角矩形遮罩"""
+    pixel_size = round(size * dpr)
+    
+    # 先缩放图片填充方式
+    scaled_pixmap = pixmap.scaled(pixel_size, pixel_size,
+                                  Qt.KeepAspectRatioByExpanding,
+                                  Qt.SmoothTransformation)
+    
+    # 计算中心裁剪区域
+    width, height = scaled_pixmap.width(), scaled_pixmap.height()
+    x_offset = (width - pixel_size) // 2 if width > pixel_size else 0
+    y_offset = (height - pixel_size) // 2 if height > pixel_size else 0
+    
+    # 裁剪中心区域
+    cropped_pixmap = scaled_pixmap.copy(x_offset, y_offset,
+                                        min(width, pixel_size),
+                                        min(height, pixel_size))
+    
+    avatar = QPixmap(pixel_size, pixel_size)
+    avatar.fill(Qt.transparent)
+    
+    painter = QPainter(avatar)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.scale(dpr, dpr)
+    
+    # 创建圆形或圆角矩形裁剪区域
+    path = QPainterPath()
+    if is_round:
+        path.addEllipse(0, 0, size, size)
+    else:
+        path.addRoundedRect(0, 0, size, size, CORNER_RADIUS, CORNER_RADIUS)
+    painter.setClipPath(path)
+    
+    # 先绘制边框
+    pen = QPen(QColor(200, 200, 200, 120), 2)
+    painter.setPen(pen)
+    if is_round:
+        painter.drawEllipse(1, 1, size-2, size-2)
+    else:
+        painter.drawRoundedRect(1, 1, size-2, size-2, CORNER_RADIUS, CORNER_RADIUS)
+    
+    # 绘制裁剪后的图片
+    painter.resetTransform()
+    painter.drawPixmap(0, 0, cropped_pixmap)
+    painter.end()
+    
+    avatar.setDevicePixelRatio(dpr)
+    return avatar
+
+def get_avatar(image_path, size, is_round=True, dpr=None):
+    """获取头像缩略图，优先读取缓存的PNG，未命中时生成并写入缓存；图片无法加载时返回None"""
+    if not image_path or not os.path.exists(image_path):
+        return None
+    
+    if dpr is None:
+        dpr = QGuiApplication.primaryScreen().devicePixelRatio() if QGuiApplication.primaryScreen() else 1.0
+    
+    try:
+        cache_path = os.path.join(_get_cache_dir(), _thumbnail_name(_content_hash(image_path), size, is_round, dpr))
+    except OSError as e:
+        logger.error(f"读取图片时出错: {e}")
+        return None
+    
+    # 命中缓存，直接加载小尺寸PNG
+    if os.path.exists(cache_path):
+        avatar = QPixmap(cache_path)
+        if not avatar.isNull():
+            avatar.setDevicePixelRatio(dpr)
+            return avatar
+    
+    # 未命中缓存，解码原图并生成缩略图
+    pixmap = QPixmap(image_path)
+    if pixmap.isNull():
+        return None
+    
+    avatar = render_avatar(pixmap, size, is_round, dpr)
+    if not avatar.save(cache_path, "PNG"):
+        logger.warning(f"无法写入缩略图缓存: {cache_path}")
+    return avatar
+
+def prune_thumbnails(active_paths):
+    """清理缓存：移除源文件已不存在或不再被使用的条目及其缩略图"""
+    global _index_dirty
+    
+    index = _load_index()
+    active_paths = {path for path in active_paths if path}
+    
+    for path in list(index):
+        if path not in active_paths or not os.path.exists(path):
+            del index[path]
+            _index_dirty = True
+    
+    # 删除不再被任何源文件引用的缩略图
+    active_hashes = {entry[2] for entry in index.values()}
+    cache_dir = _get_cache_dir()
+    try:
+        for file_name in os.listdir(cache_dir):
+            if file_name.endswith(".png") and file_name.split("_", 1)[0] not in active_hashes:
+                os.remove(os.path.join(cache_dir, file_name))
+    except OSError as e:
+        logger.error(f"清理缩略图缓存时出错: {e}")
+    
+    _save_index()
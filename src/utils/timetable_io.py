@@ -0,0 +1,403 @@
+import os
+import csv
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from .schedule import parse_date, parse_minute, SCHEDULE_FIELDS, WEEK_PARITIES
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.TimetableIO")
+
+# CSV列，多个日期用分号分隔，星期用"一二三四五"或"1111100"表示
+CSV_FIELDS = ("time", "message", "duration", "play_sound", "weekdays",
+              "start_date", "end_date", "term", "exceptions", "week_parity", "dates", "grace_minutes")
+WEEKDAY_ABBRS = "一二三四五六日"
+ICS_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+ICS_LINE_LIMIT = 75  # iCalendar 每行最多75字节，超出需要折行
+
+TRUE_VALUES = ("1", "true", "yes", "y", "是", "on")
+FALSE_VALUES = ("0", "false", "no", "n", "否", "off")
+
+class TimetableError(Exception):
+    """课表文件格式错误"""
+
+def _parse_bool(value, default=True):
+    """解析布尔值，空值时返回默认值"""
+    text = str(value).strip().lower() if value is not None else ""
+    if not text:
+        return default
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise TimetableError(f"无效的布尔值: {value}")
+
+def _parse_weekdays(value):
+    """解析星期设置，支持"一二三"、"1111100"和"MO,TU"三种写法，空值表示每天"""
+    text = str(value or "").strip().replace("周", "").replace("星期", "")
+    if not text:
+        return [True] * 7
+    if len(text) == 7 and set(text) <= {"0", "1"}:
+        return [char == "1" for char in text]
+    if set(text) <= set(WEEKDAY_ABBRS + "天"):
+        text = text.replace("天", "日")
+        return [abbr in text for abbr in WEEKDAY_ABBRS]
+    
+    codes = {code.strip().upper()[-2:] for code in text.replace(";", ",").split(",") if code.strip()}
+    if codes <= set(ICS_WEEKDAYS):
+        return [code in codes for code in ICS_WEEKDAYS]
+    raise TimetableError(f"无效的星期设置: {value}")
+
+def _split_dates(value):
+    """分号或逗号分隔的日期字符串转换为列表"""
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [part.strip() for part in str(value or "").replace(",", ";").split(";") if part.strip()]
+
+def validate_reminder(data):
+    """校验并规范化单个提醒，返回提醒字典，无效时抛出 TimetableError"""
+    minute = parse_minute(data.get("time"))
+    if minute is None:
+        raise TimetableError(f"无效的时间: {data.get('time')}")
+    
+    message = str(data.get("message") or "").replace("\\n", "\n").strip()
+    if not message:
+        raise TimetableError("提醒消息不能为空")
+    
+    reminder = {
+        "time": f"{minute // 60:02d}:{minute % 60:02d}",
+        "message": message,
+        "duration": data.get("duration") or 10,
+        "play_sound": _parse_bool(data.get("play_sound"), True),
+        "weekdays": data["weekdays"] if isinstance(data.get("weekdays"), list) else _parse_weekdays(data.get("weekdays")),
+    }
+    
+    # 课表规则字段
+    for key in ("start_date", "end_date"):
+        if data.get(key):
+            day = parse_date(data[key])
+            if day is None:
+                raise TimetableError(f"无效的日期: {data[key]}")
+            reminder[key] = day.isoformat()
+    for key in ("exceptions", "dates"):
+        values = _split_dates(data.get(key))
+        if values:
+            days = [parse_date(value) for value in values]
+            if None in days:
+                raise TimetableError(f"无效的日期: {values[days.index(None)]}")
+            reminder[key] = sorted({day.isoformat() for day in days})
+    if data.get("term"):
+        reminder["term"] = str(data["term"]).strip()
+    if data.get("week_parity"):
+        parity = str(data["week_parity"]).strip().upper()
+        if parity not in WEEK_PARITIES:
+            raise TimetableError(f"无效的单双周设置: {data['week_parity']}")
+        reminder["week_parity"] = parity
+    if data.get("grace_minutes") not in (None, ""):
+        try:
+            reminder["grace_minutes"] = max(0, int(data["grace_minutes"]))
+        except (TypeError, ValueError):
+            raise TimetableError(f"无效的补显示宽限: {data['grace_minutes']}")
+    
+    if reminder.get("start_date") and reminder.get("end_date") and reminder["start_date"] > reminder["end_date"]:
+        raise TimetableError("开始日期晚于结束日期")
+    return reminder
+
+def validate_reminders(items):
+    """批量校验 (位置, 原始数据) 序列，返回 (有效的提醒列表, 错误信息列表)"""
+    reminders = []
+    errors = []
+    for location, data in items:
+        if isinstance(data, Exception):
+            errors.append(f"{location}: {data}")
+            continue
+        try:
+            reminders.append(validate_reminder(data))
+        except TimetableError as e:
+            errors.append(f"{location}: {e}")
+    return reminders, errors
+
+# ---------- CSV ----------
+
+def iter_csv(path):
+    """逐行读取CSV，生成 (位置, 原始数据)"""
+    # utf-8-sig 兼容Excel导出的带BOM文件
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or "time" not in reader.fieldnames or "message" not in reader.fieldnames:
+            raise TimetableError("CSV文件缺少 time 或 message 列")
+        for row in reader:
+            yield f"第{reader.line_num}行", row
+
+def write_csv(reminders, path):
+    """将提醒写入CSV文件"""
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for reminder in reminders:
+            row = {
+                "time": reminder["time"],
+                "message": reminder["message"].replace("\n", "\\n"),
+                "duration": reminder.get("duration", 10),
+                "play_sound": "1" if reminder.get("play_sound", True) else "0",
+                "weekdays": "".join("1" if enabled else "0" for enabled in reminder.get("weekdays", [True] * 7)),
+            }
+            for key in SCHEDULE_FIELDS:
+                value = reminder.get(key)
+                if value or value == 0 and key == "grace_minutes":
+                    row[key] = ";".join(value) if isinstance(value, list) else value
+            writer.writerow(row)
+
+# ---------- iCalendar ----------
+
+def _ics_unescape(text):
+    """还原iCalendar文本转义"""
+    result = []
+    chars = iter(text)
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            result.append("\n" if escaped in ("n", "N") else escaped)
+        else:
+            result.append(char)
+    return "".join(result)
+
+def _ics_escape(text):
+    """iCalendar文本转义"""
+    return (str(text).replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+def _iter_ics_lines(f):
+    """逐行读取并合并iCalendar的折行"""
+    current = None
+    for raw in f:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+def _parse_ics_property(line):
+    """解析属性行，返回 (名称, 参数字典, 值)"""
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    return name.upper(), dict(param.partition("=")[::2] for param in params), value
+
+def _parse_ics_datetime(value, params):
+    """解析DTSTART等时间值，UTC时间转换为本地时间，返回 (日期, 分钟或None)"""
+    value = value.strip()
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value[:8], "%Y%m%d").date(), None
+    moment = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        moment = moment.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+    return moment.date(), moment.hour * 60 + moment.minute
+
+def _event_message(summary, description):
+    """由标题和描述组成提醒消息，导出时描述为完整消息，以标题开头"""
+    if not description:
+        return summary
+    if description.startswith(summary):
+        return description
+    return f"{summary}\n{description}"
+
+def _event_to_reminder(props):
+    """将VEVENT属性转换为提醒原始数据"""
+    if "DTSTART" not in props:
+        raise TimetableError("事件缺少 DTSTART")
+    params, value = props["DTSTART"][0]
+    start_day, minute = _parse_ics_datetime(value, params)
+    if minute is None:
+        raise TimetableError("全天事件无法作为提醒")
+    
+    summary = _ics_unescape(props.get("SUMMARY", [({}, "")])[0][1])
+    description = _ics_unescape(props.get("DESCRIPTION", [({}, "")])[0][1])
+    data = {
+        "time": f"{minute // 60:02d}:{minute % 60:02d}",
+        "message": _event_message(summary, description),
+        "duration": props.get("X-CSR-DURATION", [({}, "")])[0][1] or 10,
+        "play_sound": props.get("X-CSR-PLAY-SOUND", [({}, "")])[0][1],
+        "term": _ics_unescape(props.get("X-CSR-TERM", [({}, "")])[0][1]),
+        "exceptions": [
+            _parse_ics_datetime(part, params)[0].isoformat()
+            for params, value in props.get("EXDATE", []) for part in value.split(",") if part
+        ],
+    }
+    
+    rrule = props.get("RRULE")
+    if not rrule:
+        # 没有重复规则的事件作为一次性日期，RDATE为额外日期
+        dates = {start_day.isoformat()}
+        for params, value in props.get("RDATE", []):
+            dates.update(_parse_ics_datetime(part, params)[0].isoformat() for part in value.split(",") if part)
+        data["dates"] = sorted(dates)
+        data["weekdays"] = [False] * 7
+        return data
+    
+    rule = dict(part.partition("=")[::2] for part in rrule[0][1].split(";") if part)
+    freq = rule.get("FREQ", "").upper()
+    if freq == "DAILY":
+        data["weekdays"] = [True] * 7
+    elif freq == "WEEKLY":
+        data["weekdays"] = rule.get("BYDAY") or ICS_WEEKDAYS[start_day.weekday()]
+    else:
+        raise TimetableError(f"不支持的重复频率: {freq}")
+    
+    interval = int(rule.get("INTERVAL") or 1)
+    if interval == 2 and freq == "WEEKLY":
+        # 隔周重复以起始周为A周
+        data["week_parity"] = "A"
+    elif interval != 1:
+        raise TimetableError(f"不支持的重复间隔: {interval}")
+    
+    data["start_date"] = start_day.isoformat()
+    if rule.get("UNTIL"):
+        data["end_date"] = _parse_ics_datetime(rule["UNTIL"], {})[0].isoformat()
+    return data
+
+def iter_ics(path):
+    """逐行读取iCalendar文件，每个VEVENT生成一个 (位置, 原始数据)"""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        props = None
+        count = 0
+        for line in _iter_ics_lines(f):
+            upper = line.upper()
+            if upper == "BEGIN:VEVENT":
+                props = {}
+                count += 1
+            elif upper == "END:VEVENT" and props is not None:
+                try:
+                    yield f"第{count}个事件", _event_to_reminder(props)
+                except (TimetableError, ValueError) as e:
+                    yield f"第{count}个事件", TimetableError(str(e))
+                props = None
+            elif props is not None and ":" in line:
+                name, params, value = _parse_ics_property(line)
+                props.setdefault(name, []).append((params, value))
+
+def _fold_ics_line(line):
+    """按75字节折行"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= ICS_LINE_LIMIT:
+        return line
+    
+    parts = []
+    current = ""
+    size = 0
+    limit = ICS_LINE_LIMIT
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if size + char_size > limit:
+            parts.append(current)
+            current = ""
+            size = 0
+            limit = ICS_LINE_LIMIT - 1  # 后续行以空格开头
+        current += char
+        size += char_size
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+def _ics_first_day(reminder, today):
+    """导出时重复规则的起始日期：与单双周对齐的起始周内第一个启用的星期"""
+    start = parse_date(reminder.get("start_date"))
+    week_start = (start or today) - timedelta(days=(start or today).weekday())
+    
+    parity = reminder.get("week_parity")
+    if parity in WEEK_PARITIES and start is None:
+        # 没有起始日期时按ISO周序号，奇数周为A周
+        if (week_start.isocalendar()[1] - 1) % 2 != WEEK_PARITIES.index(parity):
+            week_start += timedelta(days=7)
+    elif parity == "B":
+        week_start += timedelta(days=7)
+    
+    weekdays = reminder.get("weekdays", [True] * 7)
+    for offset in range(7):
+        day = week_start + timedelta(days=offset)
+        if weekdays[offset] and (start is None or day >= start):
+            return day
+    return start or week_start
+
+def write_ics(reminders, path, today=None):
+    """将提醒写入iCalendar文件"""
+    today = today or date.today()
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        def write(line):
+            f.write(_fold_ics_line(line) + "\r\n")
+        
+        write("BEGIN:VCALENDAR")
+        write("VERSION:2.0")
+        write("PRODID:-//ClassScreenReminder//Timetable//ZH")
+        for index, reminder in enumerate(reminders):
+            hour, minute = reminder["time"].split(":")
+            time_part = f"T{int(hour):02d}{int(minute):02d}00"
+            dates = sorted(filter(None, (parse_date(value) for value in reminder.get("dates", []))))
+            first_day = dates[0] if dates else _ics_first_day(reminder, today)
+            
+            write("BEGIN:VEVENT")
+            write(f"UID:{reminder.get('id') or f'{stamp}-{index}'}@classscreenreminder")
+            write(f"DTSTAMP:{stamp}")
+            write(f"DTSTART:{first_day.strftime('%Y%m%d')}{time_part}")
+            lines = reminder["message"].split("\n")
+            write(f"SUMMARY:{_ics_escape(lines[0])}")
+            if len(lines) > 1:
+                write(f"DESCRIPTION:{_ics_escape(reminder['message'])}")
+            
+            if dates:
+                if len(dates) > 1:
+                    write("RDATE:" + ",".join(f"{day.strftime('%Y%m%d')}{time_part}" for day in dates[1:]))
+            else:
+                byday = ",".join(code for code, enabled in zip(ICS_WEEKDAYS, reminder.get("weekdays", [True] * 7)) if enabled)
+                rule = f"FREQ=WEEKLY;BYDAY={byday or ICS_WEEKDAYS[first_day.weekday()]}"
+                if reminder.get("week_parity") in WEEK_PARITIES:
+                    rule += ";INTERVAL=2"
+                end = parse_date(reminder.get("end_date"))
+                if end:
+                    rule += f";UNTIL={end.strftime('%Y%m%d')}T235959"
+                write(f"RRULE:{rule}")
+            
+            exceptions = [parse_date(value) for value in reminder.get("exceptions", [])]
+            if any(exceptions):
+                write("EXDATE:" + ",".join(f"{day.strftime('%Y%m%d')}{time_part}" for day in exceptions if day))
+            if reminder.get("term"):
+                write(f"X-CSR-TERM:{_ics_escape(reminder['term'])}")
+            write(f"X-CSR-DURATION:{reminder.get('duration', 10)}")
+            write(f"X-CSR-PLAY-SOUND:{1 if reminder.get('play_sound', True) else 0}")
+            write("END:VEVENT")
+        write("END:VCALENDAR")
+
+# ---------- 入口 ----------
+
+def read_timetable(path):
+    """读取CSV或iCalendar课表，返回 (有效的提醒列表, 错误信息列表)，文件无法读取时抛出 TimetableError"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        items = iter_csv(path)
+    elif extension in (".ics", ".ical"):
+        items = iter_ics(path)
+    else:
+        raise TimetableError(f"不支持的文件类型: {extension}")
+    
+    try:
+        return validate_reminders(items)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise TimetableError(f"读取课表文件出错: {e}") from e
+
+def write_timetable(reminders, path):
+    """按扩展名将提醒导出为CSV或iCalendar文件"""
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        if extension == ".csv":
+            write_csv(reminders, path)
+        elif extension in (".ics", ".ical"):
+            write_ics(reminders, path)
+        else:
+            raise TimetableError(f"不支持的文件类型: {extension}")
+    except OSError as e:
+        raise TimetableError(f"写入课表文件出错: {e}") from e
+    logger.info(f"已导出 {len(reminders)} 个提醒到 {path}")
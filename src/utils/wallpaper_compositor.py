@@ -0,0 +1,84 @@
+import os
+import hashlib
+import logging
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPainter, QColor
+
+from .wallpaper_importer import get_area_target_size
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.WallpaperCompositor")
+
+# 各区域遮罩颜色，与提醒屏幕中的色块颜色一致
+AREA_MASK_COLORS = {
+    "main": "#0B5394",
+    "left": "#073763",
+    "top": "#8EACCD",
+    "accent": "#4FC3F7",
+}
+
+COMPOSITE_QUALITY = 92
+
+def composite_name(wallpaper_path, area, opacity, blur_radius=0, screen_size=None):
+    """根据壁纸、遮罩透明度、模糊半径和目标尺寸生成合成图文件名"""
+    target_size = get_area_target_size(area, screen_size)
+    raw = f"{wallpaper_path}|{opacity}|{blur_radius}|{target_size.width()}x{target_size.height()}"
+    return f"{area}_composited_{hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]}.jpg"
+
+def blur_image(image, radius):
+    """通过先缩小再放大的方式对图片做近似模糊"""
+    if radius <= 0:
+        return image
+    
+    factor = radius + 1
+    small = image.scaled(max(1, image.width() // factor), max(1, image.height() // factor),
+                         Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return small.scaled(image.width(), image.height(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+def render_composite(image, area, opacity, blur_radius, target_size):
+    """将壁纸填充裁剪到目标尺寸，可选模糊后叠加区域遮罩色，返回不透明图像"""
+    mask_color = QColor(AREA_MASK_COLORS.get(area, AREA_MASK_COLORS["main"]))
+    
+    # 以不透明的遮罩色打底，壁纸带透明通道时结果仍为不透明图像
+    result = QImage(target_size, QImage.Format_RGB32)
+    result.fill(mask_color)
+    
+    # 填充裁剪：按较大比例缩放后居中截取
+    scaled = image.scaled(target_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    x_offset = (scaled.width() - target_size.width()) // 2
+    y_offset = (scaled.height() - target_size.height()) // 2
+    cropped = scaled.copy(x_offset, y_offset, target_size.width(), target_size.height())
+    cropped = blur_image(cropped, blur_radius)
+    
+    painter = QPainter(result)
+    painter.drawImage(0, 0, cropped)
+    
+    # 叠加遮罩色，opacity 为0-100的遮罩不透明度
+    mask_color.setAlphaF(opacity / 100.0)
+    painter.fillRect(result.rect(), mask_color)
+    painter.end()
+    return result
+
+def composite_wallpaper(wallpaper_path, area, opacity, store_dir, blur_radius=0, screen_size=None):
+    """预合成壁纸、遮罩色和模糊，保存为不透明图片并返回路径，失败时返回None"""
+    if not wallpaper_path or not os.path.exists(wallpaper_path):
+        return None
+    
+    target_path = os.path.join(store_dir, composite_name(wallpaper_path, area, opacity, blur_radius, screen_size))
+    if os.path.exists(target_path):
+        return target_path
+    
+    image = QImage(wallpaper_path)
+    if image.isNull():
+        logger.error(f"无法加载壁纸图片: {wallpaper_path}")
+        return None
+    
+    result = render_composite(image, area, opacity, blur_radius, get_area_target_size(area, screen_size))
+    
+    os.makedirs(store_dir, exist_ok=True)
+    if not result.save(target_path, "JPG", COMPOSITE_QUALITY):
+        logger.error(f"保存合成壁纸时出错: {target_path}")
+        return None
+    
+    logger.info(f"已合成{area}区域壁纸: {target_path}")
+    return target_path
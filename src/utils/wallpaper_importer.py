@@ -0,0 +1,104 @@
+import os
+import hashlib
+import logging
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QGuiApplication, QImageReader, QImageWriter
+
+# 获取logger
+logger = logging.getLogger("ClassScreenReminder.WallpaperImporter")
+
+JPEG_QUALITY = 90
+WEBP_QUALITY = 90
+
+def get_largest_screen_size():
+    """获取所有已连接屏幕中最大的物理像素尺寸"""
+    largest = QSize(1920, 1080)
+    for screen in QGuiApplication.screens():
+        size = screen.size() * screen.devicePixelRatio()
+        if size.width() * size.height() > largest.width() * largest.height():
+            largest = size
+    return largest
+
+def get_area_target_size(area, screen_size=None):
+    """计算指定区域在提醒屏幕中的最大显示尺寸，与提醒屏幕布局一致"""
+    if screen_size is None:
+        screen_size = get_largest_screen_size()
+    
+    width = screen_size.width()
+    height = screen_size.height()
+    left_width = width // 5
+    
+    if area == "left":
+        return QSize(left_width, height)
+    if area == "top":
+        return QSize(width - left_width, height // 2)
+    if area == "accent":
+        return QSize(width - left_width, 14)
+    return QSize(width, height)
+
+def _source_hash(source_path, target_size):
+    """根据源文件内容和目标尺寸生成导入文件名中的哈希"""
+    digest = hashlib.sha1()
+    with open(source_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    digest.update(f"{target_size.width()}x{target_size.height()}".encode("ascii"))
+    return digest.hexdigest()[:16]
+
+def import_wallpaper(source_path, area, store_dir, screen_size=None):
+    """将壁纸缩小到区域的最大显示尺寸并保存到受管目录，返回导入后的路径，失败时返回None"""
+    if not source_path or not os.path.exists(source_path):
+        return None
+    
+    target_size = get_area_target_size(area, screen_size)
+    base_name = f"{area}_{_source_hash(source_path, target_size)}"
+    
+    # 同一图片已按相同尺寸导入过时直接复用
+    for ext in (".jpg", ".webp", ".png"):
+        existing_path = os.path.join(store_dir, base_name + ext)
+        if os.path.exists(existing_path):
+            return existing_path
+    
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)  # 应用照片的EXIF方向
+    source_size = reader.size()
+    if not source_size.isValid():
+        logger.error(f"无法读取壁纸图片: {source_path} ({reader.errorString()})")
+        return None
+    
+    # 按覆盖区域所需的比例缩小，解码时直接缩放，避免完整解码大尺寸照片
+    scale = max(target_size.width() / source_size.width(),
+                target_size.height() / source_size.height())
+    if scale < 1.0:
+        reader.setScaledSize(QSize(max(1, round(source_size.width() * scale)),
+                                   max(1, round(source_size.height() * scale))))
+    
+    image = reader.read()
+    if image.isNull():
+        logger.error(f"无法解码壁纸图片: {source_path} ({reader.errorString()})")
+        return None
+    
+    os.makedirs(store_dir, exist_ok=True)
+    supported_formats = [bytes(fmt.data()).decode() for fmt in QImageWriter.supportedImageFormats()]
+    
+    # 不透明图片使用渐进式JPEG，带透明通道时优先使用WebP
+    if not image.hasAlphaChannel():
+        target_path = os.path.join(store_dir, base_name + ".jpg")
+        writer = QImageWriter(target_path, b"jpg")
+        writer.setQuality(JPEG_QUALITY)
+        writer.setProgressiveScanWrite(True)
+        writer.setOptimizedWrite(True)
+    elif "webp" in supported_formats:
+        target_path = os.path.join(store_dir, base_name + ".webp")
+        writer = QImageWriter(target_path, b"webp")
+        writer.setQuality(WEBP_QUALITY)
+    else:
+        target_path = os.path.join(store_dir, base_name + ".png")
+        writer = QImageWriter(target_path, b"png")
+    
+    if not writer.write(image):
+        logger.error(f"保存导入的壁纸时出错: {target_path} ({writer.errorString()})")
+        return None
+    
+    logger.info(f"已导入壁纸 {source_path} -> {target_path} ({image.width()}x{image.height()})")
+    return target_path
@@ -1,6 +1,9 @@
 import os
 import logging
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer
+
+from .wallpaper_importer import import_wallpaper
+from .wallpaper_compositor import composite_wallpaper
 
 logger = logging.getLogger("ClassScreenReminder.WallpaperManager")
 
@@ -16,14 +19,83 @@ class WallpaperManager(QObject):
     def __init__(self, config_manager):
         super().__init__()
         self.config_manager = config_manager
+        self.store_dir = os.path.join(config_manager.app_data_dir, "wallpapers")  # 导入壁纸的受管目录
         self.wallpapers = self._load_wallpapers()
+        self.sources = self._load_sources()
         self.opacities = self._load_opacities()
+        self.blurs = self.config_manager.get_setting("wallpaper_blurs", {})  # 各区域的模糊半径，默认不模糊
+        
+        # 预合成的壁纸（壁纸+遮罩色+模糊），提醒时只需直接绘制
+        self.composite_dir = os.path.join(self.store_dir, "composited")
+        self.composited = {}
+        self._pending_composites = set()
+        self._composite_timer = QTimer(self)
+        self._composite_timer.setSingleShot(True)
+        self._composite_timer.setInterval(300)  # 连续调整透明度时合并为一次合成
+        self._composite_timer.timeout.connect(self._update_composites)
+        
+        # 启动后空闲时导入旧版本直接引用原图的壁纸，并补齐缺失的合成图
+        QTimer.singleShot(0, self._import_legacy_wallpapers)
     
     def _load_wallpapers(self):
         """从配置中加载壁纸设置"""
         wallpapers = self.config_manager.get_setting("wallpapers", {})
         return wallpapers
     
+    def _load_sources(self):
+        """从配置中加载各区域壁纸的原始图片路径"""
+        return self.config_manager.get_setting("wallpaper_sources", {})
+    
+    def _is_managed(self, path):
+        """检查路径是否为受管目录中导入的壁纸"""
+        return bool(path) and os.path.normcase(os.path.dirname(os.path.abspath(path))) == os.path.normcase(self.store_dir)
+    
+    def _import_legacy_wallpapers(self, areas=None):
+        """将仍直接引用原图的壁纸导入受管目录，并合成指定区域（默认全部区域）"""
+        changed = False
+        for area, path in list(self.wallpapers.items()):
+            if areas is not None and area not in areas:
+                continue
+            if path and not self._is_managed(path) and os.path.exists(path):
+                managed_path = import_wallpaper(path, area, self.store_dir)
+                if managed_path:
+                    self.wallpapers[area] = managed_path
+                    self.sources[area] = path
+                    changed = True
+        
+        if changed:
+            self._save_wallpapers()
+        
+        self._schedule_composite(*(self.wallpapers if areas is None else areas))
+    
+    def reload_wallpapers(self):
+        """配置文件被外部修改后重新加载壁纸设置，只重新合成变化的区域，返回变化的区域"""
+        wallpapers = self._load_wallpapers()
+        opacities = self._load_opacities()
+        blurs = self.config_manager.get_setting("wallpaper_blurs", {})
+        
+        areas = set(wallpapers) | set(self.wallpapers) | set(opacities) | set(blurs) | set(self.blurs)
+        changed = [
+            area for area in areas
+            if wallpapers.get(area, "") != self.wallpapers.get(area, "")
+            or opacities.get(area) != self.opacities.get(area)
+            or blurs.get(area, 0) != self.blurs.get(area, 0)
+        ]
+        
+        old_paths = [self.wallpapers.get(area, "") for area in changed]
+        self.wallpapers = wallpapers
+        self.sources = self._load_sources()
+        self.opacities = opacities
+        self.blurs = blurs
+        if not changed:
+            return []
+        
+        for path in old_paths:
+            self._remove_unused(path)
+        # 外部写入的原图路径同样导入受管目录
+        self._import_legacy_wallpapers(changed)
+        return changed
+    
     def _load_opacities(self):
         """从配置中加载壁纸透明度设置"""
         opacities = self.config_manager.get_setting("wallpaper_opacities", {})
@@ -46,13 +118,30 @@ class WallpaperManager(QObject):
             self.wallpapers[area] = ""
         return path
     
+    def get_wallpaper_source(self, area=AREA_MAIN):
+        """获取指定区域壁纸的原始图片路径，用于界面显示"""
+        return self.sources.get(area) or self.wallpapers.get(area, "")
+    
     def set_wallpaper(self, area, path):
-        """设置指定区域的壁纸"""
-        if not path or os.path.exists(path):
-            self.wallpapers[area] = path
-            self._save_wallpapers()
+        """设置指定区域的壁纸，图片会按区域的显示尺寸缩小后导入受管目录"""
+        if not path:
+            self.clear_wallpaper(area)
             return True
-        return False
+        
+        if not os.path.exists(path):
+            return False
+        
+        managed_path = import_wallpaper(path, area, self.store_dir)
+        if not managed_path:
+            return False
+        
+        old_path = self.wallpapers.get(area, "")
+        self.wallpapers[area] = managed_path
+        self.sources[area] = path
+        self._save_wallpapers()
+        self._remove_unused(old_path)
+        self._schedule_composite(area)
+        return True
     
     def get_wallpaper_opacity(self, area=AREA_MAIN):
         """获取指定区域的壁纸遮罩透明度（0-100）"""
@@ -66,20 +155,90 @@ class WallpaperManager(QObject):
         opacity = max(0, min(100, int(opacity)))
         self.opacities[area] = opacity
         self._save_opacities()
+        self._schedule_composite(area)
         return True
     
+    def get_wallpaper_blur(self, area=AREA_MAIN):
+        """获取指定区域壁纸的模糊半径，0表示不模糊"""
+        return self.blurs.get(area, 0)
+    
+    def set_wallpaper_blur(self, area, radius):
+        """设置指定区域壁纸的模糊半径"""
+        self.blurs[area] = max(0, int(radius))
+        self.config_manager.set_setting("wallpaper_blurs", self.blurs)
+        self._schedule_composite(area)
+        return True
+    
+    def _schedule_composite(self, *areas):
+        """标记需要重新合成的区域，稍后统一合成"""
+        self._pending_composites.update(areas)
+        self._composite_timer.start()
+    
+    def _update_composites(self):
+        """重新合成所有待更新区域的壁纸，并删除不再使用的旧合成图"""
+        self._composite_timer.stop()
+        pending, self._pending_composites = self._pending_composites, set()
+        
+        for area in pending:
+            path = self.wallpapers.get(area, "")
+            if path and os.path.exists(path):
+                composited = composite_wallpaper(path, area, self.get_wallpaper_opacity(area),
+                                                 self.composite_dir, self.get_wallpaper_blur(area))
+                if composited:
+                    self.composited[area] = composited
+                else:
+                    self.composited.pop(area, None)
+            else:
+                self.composited.pop(area, None)
+        
+        self._prune_composites()
+    
+    def _prune_composites(self):
+        """删除不再对应任何区域当前设置的合成图"""
+        if not os.path.isdir(self.composite_dir):
+            return
+        
+        active_names = {os.path.basename(path) for path in self.composited.values()}
+        try:
+            for file_name in os.listdir(self.composite_dir):
+                if file_name not in active_names:
+                    os.remove(os.path.join(self.composite_dir, file_name))
+        except OSError as e:
+            logger.warning(f"清理合成壁纸失败: {e}")
+    
     def clear_wallpaper(self, area=None):
         """清除指定区域或所有壁纸"""
         if area is None:
             # 清除所有壁纸
+            old_paths = list(self.wallpapers.values())
             self.wallpapers = {}
-        elif area in self.wallpapers:
+            self.sources = {}
+        else:
             # 清除指定区域的壁纸
-            del self.wallpapers[area]
+            old_paths = [self.wallpapers.pop(area, "")]
+            self.sources.pop(area, None)
         self._save_wallpapers()
+        
+        for path in old_paths:
+            self._remove_unused(path)
+        self._schedule_composite(*(self.composited if area is None else [area]))
+    
+    def _remove_unused(self, path):
+        """删除不再被任何区域使用的导入壁纸文件"""
+        if not self._is_managed(path) or path in self.wallpapers.values():
+            return
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            logger.warning(f"删除导入的壁纸文件失败: {e}")
     
     def get_all_wallpapers(self):
-        """获取所有壁纸设置，包括透明度"""
+        """获取所有壁纸设置，包括透明度和预合成的壁纸"""
+        # 还有未完成的合成时立即合成，确保提醒屏幕使用最新的设置
+        if self._pending_composites:
+            self._update_composites()
+        
         result = self.wallpapers.copy()
         
         # 添加透明度信息 - 作为遮罩的不透明度
@@ -91,6 +250,9 @@ class WallpaperManager(QObject):
                 # 转换为0-1范围的不透明度值
                 opacity = self.get_wallpaper_opacity(area) / 100.0
                 opacity_info[f"{area}_opacity"] = opacity
+                
+                if area in self.composited and os.path.exists(self.composited[area]):
+                    opacity_info[f"{area}_composited"] = self.composited[area]
         
         # 将透明度信息更新到结果字典中
         result.update(opacity_info)
@@ -100,6 +262,7 @@ class WallpaperManager(QObject):
     def _save_wallpapers(self):
         """保存壁纸设置到配置"""
         self.config_manager.set_setting("wallpapers", self.wallpapers)
+        self.config_manager.set_setting("wallpaper_sources", self.sources)
     
     def _save_opacities(self):
         """保存壁纸透明度设置到配置"""